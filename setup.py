@@ -156,13 +156,13 @@ setup(
         # Specify the Python versions you support here. In particular, ensure
         # that you indicate whether you support Python 2, Python 3 or both.
         'Programming Language :: Python :: 3',
-        'Programming Language :: Python :: 3.3',
-        'Programming Language :: Python :: 3.4',
-        'Programming Language :: Python :: 3.5',
         'Programming Language :: Python :: 3.6',
 
     ],
 
+    # The encoder log specifications use __init_subclass__, which was added in Python 3.6
+    python_requires='>=3.6',
+
     # What does your project relate to?
     keywords='video-coding bjontegaard-delta rate-distortion-plots',
 
@@ -17,13 +17,28 @@
 #    along with this program. If not, see <http://www.gnu.org/licenses/>.
 #
 ##################################################################################################
+import bz2
+import gzip
+import io
+import lzma
+import mmap
 import pkgutil
 import re
+import tarfile
+import time
+import zipfile
+import zlib
 from abc import ABCMeta, abstractmethod
+from importlib import import_module
+from inspect import isabstract
+from itertools import islice
 from collections import deque
-from copy import copy
-from os import listdir
-from os.path import join, abspath, isfile, isdir
+from multiprocessing import get_context
+from fnmatch import fnmatchcase
+from os import scandir, cpu_count, sep, stat
+from os.path import abspath, isfile, isdir, splitext, dirname, join, relpath, getsize
+
+import numpy as np
 
 
 #
@@ -43,6 +58,12 @@ def dict_tree_from_sim_data_items(sim_data_item_collection):
     this is necessary, and what this method does, take a look at the
     documentation of the :class: `SimulationDataItem` *data* property.
 
+    The leafs are looked up by their path and identifiers in a hash map,
+    thus, the tree is built in linear time of the number of leafs of all
+    sim data items. The values of the sim data items are not copied, but
+    shared with the :class: `PlotData` objects, unless values of several
+    sim data items have to be joined.
+
     :param sim_data_item_collection: Iterable of :class: `SimDataItem`s
 
     :rtype: tree of :class: `dict`s with :class: `list`s of
@@ -50,20 +71,25 @@ def dict_tree_from_sim_data_items(sim_data_item_collection):
     """
 
     dict_tree = {}
+    # Nodes of the *dict_tree* by their path, and PlotData objects and the
+    # values to join for them by their path and identifiers
+    nodes = {(): dict_tree}
+    plot_data_by_key = {}
+    values_to_join = {}
 
     for sim_data_item in sim_data_item_collection:
         for (identifiers, sim_data_item_dict_tree) in sim_data_item.data:
 
             # Process all items of the *encoder_log*'s dictionary tree ie.
             # create corresponding keys in the output *dict_tree* and
-            # copy the data at the corresponding position in PlotData
+            # add the data at the corresponding position as PlotData
             # objects.
 
-            # Note, that tuple in queue are pairs of path ie. a list of
+            # Note, that tuple in queue are pairs of path ie. a tuple of
             # strings/keys of the encoder_log_dict_tree, and the tree itself.
             # deque has to be initialized with iterable, thus, pair is wrapped
             # with list.
-            tree_queue = deque([([], sim_data_item_dict_tree)])
+            tree_queue = deque([((), sim_data_item_dict_tree)])
 
             while len(tree_queue) > 0:
                 (keys, parent) = tree_queue.pop()
@@ -72,70 +98,268 @@ def dict_tree_from_sim_data_items(sim_data_item_collection):
                 # themselves
                 if isinstance(parent, dict):
                     for key, item in parent.items():
-                        tree_queue.appendleft((keys + [key], item))
+                        tree_queue.appendleft((keys + (key,), item))
+                    continue
+
+                # Values at a path with the same identifiers as values of
+                # another sim data item are joined to one PlotData object
+                plot_data_key = (keys, tuple(identifiers))
+                if plot_data_key in plot_data_by_key:
+                    values_to_join.setdefault(plot_data_key, [plot_data_by_key[plot_data_key].values]).append(parent)
                     continue
-                label = sim_data_item._get_label(keys)
 
-                # Non dictionary items are processed ie. their data is
-                # added as PlotData object to the output *dict_tree*
-                dict_tree = append_value_to_dict_tree_at_path(
-                    dict_tree,
-                    keys,
-                    PlotData(identifiers, copy(parent), keys, label),
-                )
+                plot_data = PlotData(identifiers, parent, list(keys), sim_data_item._get_label(list(keys)))
+                plot_data_by_key[plot_data_key] = plot_data
+                _get_dict_tree_node(nodes, keys[:-1]).setdefault(keys[-1], []).append(plot_data)
+
+    for (plot_data_key, values_list) in values_to_join.items():
+        plot_data_by_key[plot_data_key].values = join_values(values_list)
 
     return dict_tree
 
 
-def append_value_to_dict_tree_at_path(dict_tree, path, plot_data):
-    """Add a *plot_data* object to a *dict_tree* at a certain *path*.
+def _get_dict_tree_node(nodes, path):
+    """Return the node of a dict tree at *path*, and create it, if it does
+    not exist. *nodes* maps the paths of the existing nodes to the nodes.
+    """
+    node = nodes.get(path)
+    if node is None:
+        node = _get_dict_tree_node(nodes, path[:-1]).setdefault(path[-1], {})
+        nodes[path] = node
+    return node
+
 
-    :param dict_tree: Tree of nested :class: `dict`s
-    :param path: :class: `list` of keys describing a path in the *dict_tree*
-    :param plot_data: :class: `PlotData` object to be added to the *dict_tree*
+def join_values(values_list):
+    """Join the values in *values_list*, ie. lists of x, y pairs or
+    :class: `ColumnValues`, to new values in one pass. The type of the first
+    values is kept. The values in *values_list* are not changed.
 
-    :rtype: Altered tree of nested :class: `dict`s
+    :rtype: :class: `list` or :class: `ColumnValues`
     """
+    if not isinstance(values_list[0], ColumnValues):
+        joined_values = list(values_list[0])
+        for values in values_list[1:]:
+            joined_values.extend(values)
+        return joined_values
+
+    columns_list = [values if isinstance(values, ColumnValues) else ColumnValues.from_pairs(values)
+                    for values in values_list]
+    is_sorted = True
+    last_x = None
+    for columns in columns_list:
+        is_sorted = is_sorted and columns.is_sorted
+        if len(columns) > 0:
+            is_sorted = is_sorted and (last_x is None or last_x <= columns.xs[0])
+            last_x = columns.xs[-1]
+    return ColumnValues(np.concatenate([columns.xs for columns in columns_list]),
+                        np.concatenate([columns.ys for columns in columns_list]), is_sorted)
+
+
+def columns_from_rows(rows, names, first_index=0, chunk_size=64 * 1024):
+    """Convert the *rows* of strings parsed from a log, eg. one row per
+    frame, to typed NumPy columns. All columns share one index array, which
+    numbers the rows starting at *first_index*. A column is stored as
+    integer array, if all of its values are integers, and as float array
+    otherwise.
+
+    The rows are converted in chunks of *chunk_size* rows, thus, if *rows* is
+    a generator, only one chunk of strings is kept in memory at a time.
+
+    :param rows: Iterable of :class: `tuple`s of :class: `str` or
+        :class: `bytes`
+    :param names: :class: `dict` of indices of values in a row and the
+        corresponding column names
+    :param first_index: Index of the first row
+
+    :rtype: :class: `dict` of column names and :class: `ColumnValues`
+    """
+    rows = iter(rows)
+    chunks = {name: [] for name in names.values()}
+    row_count = 0
+    while True:
+        chunk = list(islice(rows, chunk_size))
+        for (position, name) in names.items():
+            strings = [row[position] for row in chunk]
+            try:
+                column = np.array(strings, dtype=np.int64)
+            except ValueError:
+                column = np.array(strings, dtype=np.float64)
+            chunks[name].append(column)
+        row_count += len(chunk)
+        if len(chunk) < chunk_size:
+            break
+
+    # a column is converted to float, if any of its chunks is
+    index = np.arange(first_index, first_index + row_count, dtype=np.int64)
+    return {name: ColumnValues(index, column_chunks[0] if len(column_chunks) == 1 else np.concatenate(column_chunks),
+                               is_sorted=True)
+            for (name, column_chunks) in chunks.items()}
+
+
+def concatenate_columns(columns, other_columns):
+    """Append the *other_columns* to *columns*, as returned by
+    :func: `columns_from_rows`. The concatenated columns share one index
+    array again.
+
+    :rtype: :class: `dict` of column names and :class: `ColumnValues`
+    """
+    if not columns:
+        return other_columns
+    if not other_columns:
+        return columns
+    index = None
+    concatenated_columns = {}
+    for (name, values) in columns.items():
+        other_values = other_columns[name]
+        if index is None:
+            index = np.concatenate((values.xs, other_values.xs))
+        concatenated_columns[name] = ColumnValues(
+            index, np.concatenate((values.ys, other_values.ys)), is_sorted=values.is_sorted
+            and other_values.is_sorted and (len(values) == 0 or len(other_values) == 0
+                                            or values.xs[-1] <= other_values.xs[0])
+        )
+    return concatenated_columns
+
+
+def sorted_columns(values):
+    """Convert *values* of a :class: `PlotData` object to two float arrays of
+    x and y values sorted by x. The *values* are either :class: `ColumnValues`,
+    or, eg. for summary data and items stored by older versions of rdplot, a
+    :class: `list` of pairs of numbers or strings.
+
+    :rtype: :class: `tuple` of two :class: `numpy.ndarray`s
+    """
+    if isinstance(values, ColumnValues):
+        return values.sorted_columns()
+    return ColumnValues.from_pairs(values).sorted_columns()
 
-    # Walk the *path* down at the *dict_tree* and create not existing keys
-    # on the way.
-    # Note, that the last key of the path is excluded, as the data has
-    # to be written to this key.
-    item = dict_tree
-    for key in path[:-1]:
-        # Create nested dictionaries if they do not exist already
-        if key not in item:
-            item[key] = {}
-
-        item = item[key]
-
-    # If the last element of the path does not exist, create a list on the
-    # corresponding position in the *dict_tree* with the *plot_data* object
-    # as only member so far. Return.
-    if path[-1] not in item:
-        item[path[-1]] = [plot_data]
-        return dict_tree
-
-    # If the last element does exist, retrieve the list stored at its position
-    plot_data_list = item[path[-1]]
-
-    # Iterate over the existing PlotData objects and check, if one has equal
-    # identifiers to the current one. If this is the case, append the values
-    # stored in the current *plot_data* object to one already present. Return.
-    for plot_data_other in plot_data_list:
-        if plot_data_other.identifiers == plot_data.identifiers:
-            plot_data_other.values.extend(plot_data.values)
-            return dict_tree
-
-    # If the last element exists, but no PlotData object with the same
-    # identifiers is present, append the PlotData object *plot_data* to the
-    # list.
-    plot_data_list.append(plot_data)
-    return dict_tree
+
+def iter_lines(buffer, offset=0):
+    """Generator, which yields the lines of the bytes-like *buffer* starting at
+    byte *offset*, eg. of the buffer of a :class: `FileLoadContext`. The lines
+    are yielded as :class: `bytes` without line endings, one at a time, thus,
+    the buffer is not copied as a whole.
+
+    :rtype: generator of :class: `bytes`
+    """
+    end = len(buffer)
+    while offset < end:
+        line_end = buffer.find(b'\n', offset)
+        if line_end == -1:
+            line_end = end
+        line = buffer[offset:line_end]
+        yield line[:-1] if line.endswith(b'\r') else line
+        offset = line_end + 1
+
+
+def get_file_key(path):
+    """Return the size and the modification time in nanoseconds of the file
+    at *path*, which change, if the file is changed.
+
+    :rtype: :class: `tuple` of :class: `int`s
+    """
+    file_stat = stat(path)
+    return file_stat.st_size, file_stat.st_mtime_ns
+
+
+def get_file_path(path):
+    """Return the path of the file on disk, from which the item with *path*
+    is loaded. This is *path* itself, or the path of the archive, if *path*
+    is located in an archive, see :func: `split_archive_path`.
+    """
+    archive_path_and_member_name = split_archive_path(path)
+    return path if archive_path_and_member_name is None else archive_path_and_member_name[0]
 
 
 # -------------------------------------------------------------------------------
 
+def get_compression_suffix(path):
+    """Return the suffix of *path*, if it is the path of a compressed file,
+    which can be decompressed by an opener of *COMPRESSED_FILE_OPENERS*, and
+    an empty string otherwise.
+
+    :rtype: :class: `str`
+    """
+    suffix = splitext(path)[1].lower()
+    return suffix if suffix in COMPRESSED_FILE_OPENERS else ''
+
+
+def strip_compression_suffix(path):
+    """Return *path* without the suffix of a compressed file, eg. 'a_enc.log'
+    for 'a_enc.log.gz'. Other paths are returned unchanged.
+
+    :rtype: :class: `str`
+    """
+    suffix = get_compression_suffix(path)
+    return path[:-len(suffix)] if suffix else path
+
+
+def is_archive(path):
+    """Check, if *path* is the path of an archive by its suffix, see
+    *ARCHIVE_SUFFIXES*.
+
+    :rtype: :class: `bool`
+    """
+    return path.lower().endswith(ARCHIVE_SUFFIXES)
+
+
+def split_archive_path(path):
+    """Split the path of a member of an archive, eg. 'a.tar/b/c_enc.log', to
+    the path of the archive file and the name of the member in the archive,
+    eg. ('a.tar', 'b/c_enc.log').
+
+    :rtype: :class: `tuple` of :class: `str`s, or None, if *path* is not
+        located in an archive
+    """
+    archive_path = dirname(path)
+    while archive_path != dirname(archive_path):
+        if is_archive(archive_path) and isfile(archive_path):
+            return archive_path, relpath(path, archive_path).replace(sep, '/')
+        archive_path = dirname(archive_path)
+    return None
+
+
+def iter_archive_members(archive_path):
+    """Generator, which iterates the files in the archive at *archive_path* in
+    one sequential pass, and yields tuples (name, size, read) of the name and
+    the size of each member, and a function *read*, which returns the content
+    of the member as :class: `bytes`. Members have to be read before the
+    next one is yielded. Members, which are not read, are skipped.
+
+    :rtype: generator of :class: `tuple`s
+    """
+    if archive_path.lower().endswith('.zip'):
+        with zipfile.ZipFile(archive_path) as archive:
+            for member in archive.infolist():
+                if not member.is_dir():
+                    yield member.filename, member.file_size, lambda member=member: archive.read(member)
+        return
+
+    # the tar archive is read as stream, thus, compressed archives are
+    # decompressed once and not seeked
+    with tarfile.open(archive_path, 'r|*') as archive:
+        for member in archive:
+            if member.isfile():
+                yield member.name, member.size, lambda member=member: archive.extractfile(member).read()
+
+
+def read_archive_member(archive_path, member_name):
+    """Return the content of the member *member_name* of the archive at
+    *archive_path*, see :func: `split_archive_path`. Raises an
+    :class: `OSError`, if the member is not found.
+
+    :rtype: :class: `bytes`
+    """
+    try:
+        if archive_path.lower().endswith('.zip'):
+            with zipfile.ZipFile(archive_path) as archive:
+                return archive.read(member_name)
+        with tarfile.open(archive_path) as archive:
+            return archive.extractfile(member_name).read()
+    except (KeyError, AttributeError, zipfile.BadZipFile, tarfile.TarError) as error:
+        raise OSError("Could not read '{}' from '{}': {}".format(member_name, archive_path, error)) from error
+
+
 #
 # Classes
 #
@@ -166,6 +390,168 @@ class PlotData:
         self.label = label
 
 
+class ColumnValues:
+    """Sequence of x, y pairs, which is stored as two NumPy columns *xs* and
+    *ys*. Temporal data is kept in this form, as a :class: `list` of
+    :class: `tuple`s per frame and metric needs much more memory and has to
+    be converted for plotting. For compatibility, it behaves like the
+    :class: `list` of pairs, which is used for summary data, ie. it can be
+    iterated, indexed, compared and extended.
+
+    Note, that the columns are never changed in place, as they are shared,
+    eg. all columns of a log share one index array *xs*.
+
+    :param xs: x values, eg. the frame index
+    :type xs: :class: `numpy.ndarray`
+
+    :param ys: y values, eg. the PSNR of the frames
+    :type ys: :class: `numpy.ndarray`
+
+    :param is_sorted: True, if *xs* is known to be ascending
+    """
+
+    def __init__(self, xs, ys, is_sorted=False):
+        self.xs = xs
+        self.ys = ys
+        self.is_sorted = is_sorted
+
+    @classmethod
+    def from_pairs(cls, values):
+        """Create float columns from a :class: `list` of pairs of numbers or
+        strings.
+
+        :rtype: :class: `ColumnValues`
+        """
+        values = list(values)
+        if not values:
+            return cls(np.empty(0), np.empty(0), is_sorted=True)
+        xs, ys = zip(*values)
+        return cls(np.array(xs, dtype=np.float64), np.array(ys, dtype=np.float64))
+
+    def __len__(self):
+        return len(self.xs)
+
+    def __iter__(self):
+        return zip(self.xs.tolist(), self.ys.tolist())
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return ColumnValues(self.xs[index], self.ys[index], self.is_sorted and (index.step or 1) > 0)
+        return self.xs[index].item(), self.ys[index].item()
+
+    def __eq__(self, other):
+        if isinstance(other, ColumnValues):
+            return _columns_equal(self.xs, other.xs) and _columns_equal(self.ys, other.ys)
+        try:
+            return list(self) == list(other)
+        except TypeError:
+            return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self):
+        return 'ColumnValues({!r})'.format(list(self))
+
+    # The columns are pickled, eg. to .rd files, as plain lists, so the
+    # files do not depend on the version of NumPy, which wrote them
+    def __getstate__(self):
+        return {'xs': self.xs.tolist(), 'ys': self.ys.tolist(), 'is_sorted': self.is_sorted,
+                'dtypes': [self.xs.dtype.name, self.ys.dtype.name]}
+
+    def __setstate__(self, state):
+        xs_dtype, ys_dtype = state.get('dtypes', (None, None))
+        self.xs = np.array(state['xs'], dtype=xs_dtype)
+        self.ys = np.array(state['ys'], dtype=ys_dtype)
+        self.is_sorted = state['is_sorted']
+
+    def append(self, pair):
+        self.extend([pair])
+
+    def extend(self, values):
+        if not isinstance(values, ColumnValues):
+            values = ColumnValues.from_pairs(values)
+        is_sorted = self.is_sorted and values.is_sorted and (
+            len(self) == 0 or len(values) == 0 or self.xs[-1] <= values.xs[0])
+        self.xs = np.concatenate((self.xs, values.xs))
+        self.ys = np.concatenate((self.ys, values.ys))
+        self.is_sorted = is_sorted
+
+    def sorted_columns(self):
+        """Return x and y values as float arrays sorted by x. Columns, which
+        are known to be sorted, are not sorted again.
+
+        :rtype: :class: `tuple` of two :class: `numpy.ndarray`s
+        """
+        xs = self.xs.astype(np.float64, copy=False)
+        ys = self.ys.astype(np.float64, copy=False)
+        if self.is_sorted:
+            return xs, ys
+        order = np.argsort(xs, kind='mergesort')
+        return xs[order], ys[order]
+
+
+def _columns_equal(first, second):
+    """Compare two columns like :func: `numpy.array_equal`, but NaNs at the
+    same positions are equal.
+    """
+    if first.shape != second.shape:
+        return False
+    equal = first == second
+    if equal.all():
+        return True
+    return bool((equal | np.isnan(first) & np.isnan(second)).all())
+
+
+class LazyColumnValues(ColumnValues):
+    """:class: `ColumnValues`, which are loaded on first access of the
+    columns, eg. the temporal data of an encoder log is only parsed, if it
+    is plotted.
+
+    :param load: Callable without arguments, which returns the
+        :class: `ColumnValues` to be loaded
+    """
+
+    def __init__(self, load):
+        self._load = load
+
+    def __getattr__(self, name):
+        # Only called for attributes, which are not set yet, ie. the
+        # columns are loaded on first access
+        if name not in ('xs', 'ys', 'is_sorted'):
+            raise AttributeError(name)
+        values = self._load()
+        self.xs, self.ys, self.is_sorted = values.xs, values.ys, values.is_sorted
+        return getattr(self, name)
+
+
+# Default glob patterns of SimulationDataItemFactory.find_files. Bitstreams,
+# videos and reconstructions are skipped without opening them.
+DEFAULT_FILE_PATTERNS = ['!*.yuv', '!*.rgb', '!*.bin', '!*.bit', '!*.str', '!*.hevc', '!*.h265', '!*.265',
+                         '!*.vvc', '!*.266', '!*.jem', '!*.mp4', '!*.mkv']
+# Files larger than this are skipped by SimulationDataItemFactory.find_files
+DEFAULT_MAX_FILE_SIZE = 1024 ** 3
+
+# Files are only parsed by a pool of worker processes, if there are at least
+# as many files and bytes, as starting the workers takes some time
+PARALLEL_PARSE_MIN_FILES = 8
+PARALLEL_PARSE_MIN_BYTES = 256 * 1024 ** 2
+
+# Functions opening compressed files for binary reading, by the file name
+# suffix of the compression. Compressed files are decompressed while they
+# are read, and are parsed like the file without the suffix, eg.
+# 'a_enc.log.gz' like 'a_enc.log'. Further formats can be added here.
+COMPRESSED_FILE_OPENERS = {'.gz': gzip.open, '.xz': lzma.open, '.bz2': bz2.open}
+try:
+    import zstandard
+    COMPRESSED_FILE_OPENERS['.zst'] = zstandard.open
+except ImportError:
+    pass
+
+# File name suffixes of archives, whose members are parsed like the files of
+# a directory, see SimulationDataItemFactory.create_item_list_from_archive
+ARCHIVE_SUFFIXES = ('.tar', '.tar.gz', '.tgz', '.tar.bz2', '.tar.xz', '.zip')
+
+
 class SimulationDataItemError(Exception):
     pass
 
@@ -174,6 +560,162 @@ class IsNotAnAbstractSimulationDataItemSubClassError(SimulationDataItemError):
     pass
 
 
+class FileLoadContext:
+    """Load context of a single file, which is shared by all parsers the
+    file is offered to. The content of the file is read lazily on first
+    access, and then kept, so that detection by :func: `can_parse_file` and
+    all *_parse_* methods of the chosen class use the same buffer, and the
+    file is read at most once.
+
+    The content is provided as *buffer*, which maps the file into memory
+    without reading or decoding it. Parsers of large logs run bytes regexes
+    against the *buffer*, and only decode the captured fields. Thus, the
+    memory needed for parsing is about the size of the parsed values, and not
+    a multiple of the size of the log.
+
+    Additionally, a bounded prefix *head* of the file is provided, which is
+    used to match the signatures of parser classes without reading the whole
+    file.
+
+    Compressed files, see *COMPRESSED_FILE_OPENERS*, are decompressed while
+    they are read, without a temporary copy on disk. Their *buffer* is the
+    decompressed content in memory, as they can not be mapped. The same
+    applies to members of archives, which are given by their *content*, or
+    read from the archive, if *path* is located in an archive, see
+    :func: `split_archive_path`.
+
+    Note, that the context should not be stored at the simulation data
+    items, as the buffer is not needed anymore after parsing. The memory map
+    is released by :func: `close`.
+
+    :param path: Path of the file
+    :type path: :class: `str`
+
+    :param content: Content of the file as :class: `bytes`, eg. of a member
+        of an archive, which has already been read
+    """
+
+    # Number of characters read for the *head* of a file
+    head_size = 64 * 1024
+
+    def __init__(self, path, content=None):
+        self.path = abspath(path)
+        self._content = content
+        self._head = None
+        self._buffer = None
+        # Intermediate results of parsers, eg. of a single pass over the
+        # lines of the file, which are shared by the parse methods of a class
+        self.parse_results = {}
+
+    @property
+    def head(self):
+        """First *head_size* characters of the file. Undecodable bytes are
+        replaced, as the head is only used to match signatures.
+        """
+        if self._head is None:
+            with self._open_text(errors='replace') as simulation_data_item_file:
+                self._head = self._read(simulation_data_item_file, self.head_size)
+        return self._head
+
+    @property
+    def is_archive_member(self):
+        """True, if the file is a member of an archive. Its content is kept in
+        memory, and reading it again means decompressing the archive again.
+        """
+        return self._content is not None or not isfile(self.path) and split_archive_path(self.path) is not None
+
+    @property
+    def buffer(self):
+        """Content of the file as read-only :class: `mmap.mmap`, which supports
+        the bytes-like operations, eg. slicing, *find* and bytes regexes.
+        Mapped on first access. Empty files can not be mapped, their buffer is
+        an empty :class: `bytes` object. Note, that line endings are not
+        translated, ie. lines of files written on Windows end with '\\r'.
+        """
+        if self._buffer is None:
+            with self._open() as simulation_data_item_file:
+                if get_compression_suffix(self.path):
+                    self._buffer = self._read(simulation_data_item_file)
+                elif self._content is not None:
+                    # member of an archive
+                    self._buffer = self._content
+                else:
+                    try:
+                        self._buffer = mmap.mmap(simulation_data_item_file.fileno(), 0, access=mmap.ACCESS_READ)
+                    except ValueError:
+                        # empty file
+                        self._buffer = b''
+        return self._buffer
+
+    def read_until(self, pattern, chunk_size=64 * 1024):
+        """Return the content of the file up to the first match of the bytes
+        regex *pattern*, or the whole content, if the pattern does not match.
+        The file is read in chunks of *chunk_size* bytes until the pattern
+        matches, thus, only the head of large files is read, eg. the config
+        header of an encoder log. If the *buffer* is already mapped, the
+        prefix is taken from the buffer. Line endings are not translated.
+
+        :param pattern: Compiled bytes regex, which matches the end of the
+            prefix. Matches have to be contained in a single line.
+
+        :rtype: :class: `bytes`
+        """
+        if self._buffer is not None:
+            match = pattern.search(self._buffer)
+            return self._buffer[:match.start() if match else len(self._buffer)]
+
+        prefix = bytearray()
+        with self._open() as simulation_data_item_file:
+            while True:
+                chunk = self._read(simulation_data_item_file, chunk_size)
+                # A match can span the chunks, thus, the last line of the
+                # previous chunks is searched again
+                line_start = prefix.rfind(b'\n') + 1
+                prefix += chunk
+                match = pattern.search(prefix, line_start)
+                if match or not chunk:
+                    break
+        return bytes(prefix[:match.start() if match else len(prefix)])
+
+    def _open(self):
+        """Open the file for binary reading, compressed files are decompressed
+        while reading.
+        """
+        if self._content is None and not isfile(self.path):
+            archive = split_archive_path(self.path)
+            if archive is not None:
+                self._content = read_archive_member(*archive)
+
+        if self._content is None:
+            opener = COMPRESSED_FILE_OPENERS.get(get_compression_suffix(self.path), open)
+            return opener(self.path, 'rb')
+        opener = COMPRESSED_FILE_OPENERS.get(get_compression_suffix(self.path))
+        return io.BytesIO(self._content) if opener is None else opener(io.BytesIO(self._content), 'rb')
+
+    def _open_text(self, errors=None):
+        """Open the file for reading text like :func: `open`"""
+        return io.TextIOWrapper(self._open(), errors=errors)
+
+    @staticmethod
+    def _read(simulation_data_item_file, size=-1):
+        """Read *size* bytes or characters from *simulation_data_item_file*.
+        Corrupt compressed files raise an :class: `OSError`, like files, which
+        can not be read.
+        """
+        try:
+            return simulation_data_item_file.read(size)
+        except (EOFError, lzma.LZMAError, zlib.error) as error:
+            raise OSError("Could not decompress '{}': {}".format(simulation_data_item_file, error)) from error
+
+    def close(self):
+        """Release the *buffer*, ie. close its memory map. The buffer is
+        mapped or read again on next access.
+        """
+        if isinstance(self._buffer, mmap.mmap):
+            self._buffer.close()
+        self._buffer = None
+
+
 class AbstractSimulationDataItem(metaclass=ABCMeta):
     """Abstract base class for simulation data item classes. The abstract
     method :func: `can_parse_file` and the properties *data*, and
@@ -182,11 +724,31 @@ class AbstractSimulationDataItem(metaclass=ABCMeta):
     :param path: Path of associated file in file systems. Is used as unique
         identifier.
     :type path: :class: `str`
+
+    Sub classes accept an optional :class: `FileLoadContext` *load_context* as
+    second constructor argument, which is passed to all *_parse_* methods.
     """
 
     # Order value, used to determine order in which parser are tried.
     parse_order = 100  # large default value. it subclass does not lower it, it will be tried last
 
+    # Signature of the files a class can parse. It is checked by the factory
+    # before the more expensive :func: `can_parse_file`, so that only one
+    # candidate class has to inspect the whole file.
+    # Tuple of file name endings, None accepts all file names
+    file_name_suffixes = None
+    # Regex which has to match the *head* of the file, None accepts all files
+    header_pattern = None
+
+    # Version of the parser of a class. Has to be increased, if the parsing
+    # changes, as cached items of older versions are then invalid, see
+    # :class: `SimulationDataItemCache`
+    parser_version = 1
+
+    # Set for items of simulations, which were still running when parsed.
+    # Those items are kept up to date by :func: `update`.
+    is_running = False
+
     # Constructor
 
     def __init__(self, path):
@@ -196,7 +758,7 @@ class AbstractSimulationDataItem(metaclass=ABCMeta):
     # Abstract Methods/Properties
     @classmethod
     @abstractmethod
-    def can_parse_file(cls, path):
+    def can_parse_file(cls, path, load_context=None):
         """Check, if the file at *path* can be parsed by the class. The class
         can can for example check, if the file name or the file extension
         matches a certain pattern, or inspect the contents of the file. Note,
@@ -207,8 +769,64 @@ class AbstractSimulationDataItem(metaclass=ABCMeta):
         :param path:  path to file
         :type path: :class: `String`
 
+        :param load_context: Shared :class: `FileLoadContext` of the file. If
+            ``None``, the file is read on its own.
+
+        :rtype: :class: `Bool`
+        """
+        pass
+
+    @classmethod
+    def matches_signature(cls, path, load_context):
+        """Check, if the file at *path* matches the signature of the class, ie.
+        the file name suffix and the header pattern. Only the *head* of the
+        file is inspected. A matching signature is a necessary, but not a
+        sufficient condition for :func: `can_parse_file`.
+
+        :param path: path to file
+        :type path: :class: `String`
+
+        :param load_context: :class: `FileLoadContext` of the file
+
+        :rtype: :class: `Bool`
+        """
+        if cls.file_name_suffixes is not None \
+                and not strip_compression_suffix(path).endswith(cls.file_name_suffixes):
+            return False
+        if cls.header_pattern is not None:
+            return bool(re.search(cls.header_pattern, load_context.head, re.M + re.X))
+        return True
+
+    @classmethod
+    def can_parse_running_file(cls, path, load_context=None):
+        """Check, if the file at *path* is the log of a simulation, which is
+        still running, and can be parsed by the class anyway. The items of
+        running simulations are updated afterwards by :func: `update`. By
+        default, logs of running simulations are not supported.
+
+        :param path: path to file
+        :type path: :class: `String`
+
+        :param load_context: Shared :class: `FileLoadContext` of the file
+
         :rtype: :class: `Bool`
         """
+        return False
+
+    def update(self):
+        """Update the item with the data which has been appended to its file
+        by the running simulation since parsing or since the last update. By
+        default, items are not updated.
+
+        :rtype: :class: `Bool`, True if the data of the item changed
+        """
+        return False
+
+    def load_lazy_data(self):
+        """Load all data of the item, which is parsed lazily on first access,
+        eg. before the item is saved, as its file may be unavailable later
+        on. By default, items are parsed completely by the constructor.
+        """
         pass
 
     @property
@@ -220,7 +838,8 @@ class AbstractSimulationDataItem(metaclass=ABCMeta):
         data itself, in the form of a dictionary tree. The  dictionary tree
         has the variables which are provided by the *encoder_log* as keys, and
         the actual data as leafs. The data  is in the form of lists of 2-tuples
-        containing, an x and the  corresponding y value.
+        containing, an x and the  corresponding y value. Large data, eg.
+        temporal data, can be given as :class: `ColumnValues` instead.
 
 
         Now, the dictionary trees of different sim data items have to be
@@ -266,13 +885,26 @@ class AbstractSimulationDataItem(metaclass=ABCMeta):
         pass
 
     @abstractmethod
-    def _parse_config(self):
+    def _parse_config(self, load_context):
         """Method which parses log file to get config (QP, other parameters).
         Abstract, needs to be implemented by log parsers
+        :param load_context: :class: `FileLoadContext` of the parsed file
         :return:
         """
         pass
 
+    @classmethod
+    def read_config(cls, path, load_context=None):
+        """Return the config of the file at *path*, ie. the *log_config* of
+        its item. By default, the whole file is parsed. Sub classes, which
+        can parse the config on its own, eg. from the header of the file,
+        override this method, so that the configs of many files can be
+        scanned quickly, see :func: `SimulationDataItemFactory.read_configs`.
+
+        :rtype: :class: `dict` of parameter names and values
+        """
+        return cls(path, load_context).log_config
+
     # Magic Methods
     # TODO remove if useful 'set' is implemented
     def __hash__(self):
@@ -285,13 +917,104 @@ class AbstractSimulationDataItem(metaclass=ABCMeta):
         return str(self)
 
     # Helper Methods
+    @staticmethod
+    def _get_load_context(path, load_context=None):
+        """Return *load_context*, or a new :class: `FileLoadContext` for the
+        file at *path*, if no context is given.
+        """
+        if load_context is None:
+            return FileLoadContext(path)
+        return load_context
+
     @classmethod
-    def _is_file_text_matching_re_pattern(cls, path, pattern):
-        """Check, if the file at *path* matches the given regex *pattern*
+    def _is_file_text_matching_re_pattern(cls, path, pattern, load_context=None):
+        """Check, if the file at *path* matches the given regex *pattern*. The
+        pattern is matched as bytes regex against the buffer of the file, see
+        :class: `FileLoadContext`, thus, the file is not decoded.
         """
-        with open(path, 'r') as simulation_data_item_file:
-            text = simulation_data_item_file.read()
-            return bool(re.search(pattern, text, re.M + re.X))
+        buffer = cls._get_load_context(path, load_context).buffer
+        return bool(re.search(pattern.encode(), buffer, re.M + re.X))
+
+
+class ParseProgress:
+    """Progress of parsing the files of a path list, see :func:
+    `SimulationDataItemFactory.create_item_lists_from_path_list`. The factory
+    calls :func: `start` with all files to parse, and :func: `file_parsed`
+    after each file, which calls the optional *callback* with the progress,
+    the path, the items and the error of the file.
+
+    Parsing can be cancelled cooperatively from another thread by :func:
+    `cancel`: The factory stops after the file it currently waits for.
+
+    :param callback: Callable or None
+    """
+
+    def __init__(self, callback=None):
+        self.callback = callback
+        self.files_done = 0
+        self.files_total = 0
+        self.bytes_done = 0
+        self.bytes_total = 0
+        self._file_sizes = {}
+        self._start_time = None
+        self._cancelled = False
+
+    def start(self, file_paths):
+        """Reset the progress to parsing the files at *file_paths*."""
+        self._file_sizes = {file_path: self._get_file_size(file_path) for file_path in file_paths}
+        self.files_done = 0
+        self.files_total = len(self._file_sizes)
+        self.bytes_done = 0
+        self.bytes_total = sum(self._file_sizes.values())
+        self._start_time = time.monotonic()
+
+    def file_parsed(self, file_path, items, error):
+        """Record that the file at *file_path* is parsed to *items*, or
+        failed with *error*.
+        """
+        self.files_done += 1
+        self.bytes_done += self._file_sizes.get(file_path, 0)
+        if self.callback is not None:
+            self.callback(self, file_path, items, error)
+
+    def cancel(self):
+        self._cancelled = True
+
+    @property
+    def is_cancelled(self):
+        return self._cancelled
+
+    @property
+    def elapsed_time(self):
+        """Seconds since :func: `start`"""
+        if self._start_time is None:
+            return 0.0
+        return time.monotonic() - self._start_time
+
+    @property
+    def bytes_per_second(self):
+        elapsed_time = self.elapsed_time
+        if elapsed_time <= 0:
+            return 0.0
+        return self.bytes_done / elapsed_time
+
+    @property
+    def remaining_time(self):
+        """Estimated seconds until all files are parsed, or None, as long as
+        nothing is parsed. The estimate is based on the bytes parsed so far,
+        as the parse time grows with the size of the files.
+        """
+        if self.bytes_done == 0:
+            return None
+        return self.elapsed_time * (self.bytes_total - self.bytes_done) / self.bytes_done
+
+    @staticmethod
+    def _get_file_size(file_path):
+        try:
+            return getsize(file_path)
+        except OSError:
+            # e.g. members of archives
+            return 0
 
 
 class SimulationDataItemFactory:
@@ -310,11 +1033,36 @@ class SimulationDataItemFactory:
     class. Note, that the order of the classes is therefore important, as the
     first matching class will be used to create the item. Thus, more general
     items should be tried at last.
+
+    To avoid that every class inspects every file, the classes are sorted
+    once to a dispatch order, and only classes whose signature (file name
+    suffix, header pattern) matches the head of the file are asked to
+    inspect the whole file by *can_parse_file*.
+
+    Directories are searched recursively for files by :func: `find_files`,
+    which can be configured by the attributes *file_patterns*,
+    *recursive* and *max_file_size*.
+
+    Optionally, a :class: `SimulationDataItemCache` can be set as *cache*.
+    Then, files of directories and path lists are only parsed, if there is
+    no valid cached item for them.
     """
 
     # Constructors
-    def __init__(self, classes=None):
+    def __init__(self, classes=None, cache=None):
         self._classes = set()
+        # Concrete classes in the order in which they are tried. Created
+        # lazily and reset if classes are added.
+        self._dispatch_order = None
+        self.cache = cache
+        # If set, logs of running simulations are parsed, too, see
+        # AbstractSimulationDataItem.can_parse_running_file
+        self.parse_running = False
+
+        # Configuration of the file discovery in directories, see find_files
+        self.file_patterns = list(DEFAULT_FILE_PATTERNS)
+        self.recursive = True
+        self.max_file_size = DEFAULT_MAX_FILE_SIZE
 
         if classes is not None:
             for cls in classes:
@@ -342,9 +1090,11 @@ class SimulationDataItemFactory:
         # from user http://stackoverflow.com/users/633403/luca-invernizzi
 
         # Parse *directory_path* for sub classes of *AbstractSimulationDataItem*
-        for importer, name, _ in pkgutil.iter_modules([directory_path], 'rdplot.SimulationDataItemClasses.'):
-            # Import a module from *directory_path*
-            imported_module = importer.find_module(name).load_module(name)
+        for _, name, _ in pkgutil.iter_modules([directory_path], 'rdplot.SimulationDataItemClasses.'):
+            # Import a module from *directory_path*. Note, that modules, which
+            # are imported already, are not executed again, so the classes
+            # stay the same objects, and can be pickled for worker processes.
+            imported_module = import_module(name)
 
             # Add all sub classes of AbstractSimulationDataItem from the module
             # to the factory
@@ -375,50 +1125,237 @@ class SimulationDataItemFactory:
                  "not a sub class of AbstractSimulationDataItem").format(cls))
 
         self._classes.add(cls)
+        self._dispatch_order = None
+
+    def _get_dispatch_order(self):
+        """Return the concrete classes of the factory in the order in which
+        they are tried: Descending *parse_order*, and for equal order the
+        classes with longer names first, as they are the more specific ones,
+        eg. *DatLogJEM70_360* before *DatLogJEM70*.
+
+        :rtype: :class: `list` of sub classes of
+            :class: `AbstractSimulationDataItem`
+        """
+        if self._dispatch_order is None:
+            self._dispatch_order = sorted(
+                (cls for cls in self._classes if not isabstract(cls)),
+                key=lambda parser_class: (parser_class.parse_order, len(parser_class.__name__),
+                                          parser_class.__name__),
+                reverse=True,
+            )
+        return self._dispatch_order
 
     # Factory Methods
-    def create_item_from_file(self, file_path):
+    def create_item_from_file(self, file_path, load_context=None):
         """Create an item of a AbstractSimulationDataItem sub class for the
-        file specified by *file_path*.
+        file specified by *file_path*. Archives are parsed by
+        :func: `create_item_list_from_archive`.
 
         :param file_path: File which should be parsed as simulation data
             item_generator
+        :param load_context: :class: `FileLoadContext` of the file, eg. with
+            the content of a member of an archive
 
         :rtype: object of sub class of :class: `AbstractSimulationDataItem`
         """
 
-        # Create simulation data item of the first class which says, it can parse
-        # the file
+        if load_context is None and is_archive(file_path) and isfile(file_path):
+            return self.create_item_list_from_archive(file_path)
+
+        if load_context is None:
+            load_context = FileLoadContext(file_path)
         cls_list = []
-        # try parser, in the order given by their parse_order attribute. use the first one that can parse the file
-        for cls in reversed(sorted(self._classes, key=lambda parser_class: parser_class.parse_order)):
-            if cls.can_parse_file(file_path):
-                cls_list.append(cls(file_path))
-                break
+        try:
+            cls = self._get_parser_class(file_path, load_context)
+            if cls is not None:
+                cls_list.append(cls(file_path, load_context))
+        finally:
+            load_context.close()
         return cls_list
 
-    def create_item_list_from_directory(self, directory_path):
-        """Try to create simulation data items for all files in a directory at
-        *directory_path*. Ignore if files can not be parsed.
+    def _get_parser_class(self, file_path, load_context):
+        """Return the first class which says, it can parse the file at
+        *file_path*, or None. All classes share the *load_context*, so the file
+        is read at most once.
+
+        :rtype: sub class of :class: `AbstractSimulationDataItem` or None
+        """
+        # try parser, in the order given by their parse_order attribute. use the first one that can parse the file.
+        # Only classes with matching signature have to check the whole file.
+        for cls in self._get_dispatch_order():
+            try:
+                if not cls.matches_signature(file_path, load_context):
+                    continue
+            except OSError:
+                # eg. directories or files without read permission
+                return None
+            # compressed logs and members of archives are not written anymore
+            if cls.can_parse_file(file_path, load_context) \
+                    or self.parse_running and not get_compression_suffix(file_path) and isfile(file_path) \
+                    and cls.can_parse_running_file(file_path, load_context):
+                return cls
+        return None
+
+    def read_configs(self, directory_path):
+        """Generator, which reads the config of all files found by
+        :func: `find_files` in a directory at *directory_path*, including the
+        members of archives, without creating the simulation data items, see
+        :func: `AbstractSimulationDataItem.read_config`. Thus, the configs of
+        a whole tree of encoder logs can be scanned quickly, as only the
+        headers of the logs are read. Files, which can not be parsed, are
+        ignored.
 
         :param directory_path: :class: `str` of directory path
 
-        :rtype: :class: `list` of simulation data items
+        :rtype: generator of :class: `tuple`s of the file path, the class,
+            which can parse the file, and the config :class: `dict`
+        """
+        for file_path in self.find_files(directory_path):
+            if is_archive(file_path):
+                load_contexts = self._iter_archive_member_load_contexts(file_path)
+            else:
+                load_contexts = [FileLoadContext(file_path)]
+            for load_context in load_contexts:
+                try:
+                    cls = self._get_parser_class(load_context.path, load_context)
+                    if cls is not None:
+                        yield load_context.path, cls, cls.read_config(load_context.path, load_context)
+                except SimulationDataItemError:
+                    continue
+                finally:
+                    load_context.close()
+
+    def find_files(self, directory_path):
+        """Generator, which yields the paths of all candidate files in the
+        directory at *directory_path* and, if *recursive* is set, its sub
+        directories. Only the directory entries and their stat results are
+        used, files are not opened.
+
+        The files are filtered by the glob patterns in *file_patterns*,
+        which are matched against the whole path, with '/' as separator.
+        Patterns with a leading '!' exclude files, and directories matching
+        them are not entered, eg. '!*/rec/*'. If there are include patterns,
+        eg. '*_enc.log' or '*.xml', a file has to match at least one of them.
+        Files larger than *max_file_size* bytes are skipped, as they are
+        most probably bitstreams or videos. Compressed files, eg.
+        'a_enc.log.gz', are matched by the patterns with and without the
+        suffix of the compression. Archives, see *ARCHIVE_SUFFIXES*, are
+        not required to match the include patterns, as their members are
+        filtered, see :func: `create_item_list_from_archive`.
+
+        The entries of each directory are visited in the order of their names.
+
+        :param directory_path: :class: `str` of directory path
+
+        :rtype: generator of :class: `str` paths
+        """
+
+        exclude_patterns = [pattern[1:] for pattern in self.file_patterns if pattern.startswith('!')]
+
+        def is_excluded(path):
+            return any(fnmatchcase(path, pattern) for pattern in exclude_patterns)
+
+        directory_stack = [directory_path]
+        while directory_stack:
+            current_directory = directory_stack.pop()
+            try:
+                with scandir(current_directory) as entries:
+                    entries = sorted(entries, key=lambda entry: entry.name)
+            except OSError:
+                continue
+
+            sub_directories = []
+            for entry in entries:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        if self.recursive and not is_excluded(entry.path.replace(sep, '/') + '/'):
+                            sub_directories.append(entry.path)
+                        continue
+                    if not entry.is_file() or entry.stat().st_size > self.max_file_size:
+                        continue
+                except OSError:
+                    continue
+
+                if self._matches_file_patterns(entry.path, is_archive(entry.path)):
+                    yield entry.path
+
+            # visit the sub directories in order of their names, too
+            directory_stack.extend(reversed(sub_directories))
+
+    def _matches_file_patterns(self, path, is_included=False):
+        """Check, if the file at *path* matches the *file_patterns*, see
+        :func: `find_files`. If *is_included* is set, only the exclude
+        patterns are checked.
         """
+        # compressed files are matched with and without the suffix of the
+        # compression, eg. 'a_enc.log.gz' matches '*_enc.log'
+        paths = {path.replace(sep, '/'), strip_compression_suffix(path).replace(sep, '/')}
+        include_patterns = []
+        for pattern in self.file_patterns:
+            if pattern.startswith('!'):
+                if any(fnmatchcase(path, pattern[1:]) for path in paths):
+                    return False
+            else:
+                include_patterns.append(pattern)
+        return is_included or not include_patterns \
+            or any(fnmatchcase(path, pattern) for path in paths for pattern in include_patterns)
+
+    def create_item_list_from_archive(self, archive_path):
+        """Try to create simulation data items for all members of the tar or
+        zip archive at *archive_path*, see *ARCHIVE_SUFFIXES*. The archive is
+        read in one sequential pass, and is not extracted to disk. The members
+        are filtered like the files of a directory by :func: `find_files`,
+        and parsed from memory. Members, which can not be parsed, are ignored.
+
+        The path of the item of a member is the path of the member below the
+        archive path, eg. 'a.tar/b/c_enc.log'. Thus, items are identified by
+        the directories inside the archive, eg. the *config* of an encoder
+        log is 'a.tar/b'.
+
+        :param archive_path: :class: `str` of archive path
 
+        :rtype: :class: `list` of simulation data items
+        """
         item_list = []
-        for file_name in listdir(directory_path):
-            path = join(directory_path, file_name)
+        for load_context in self._iter_archive_member_load_contexts(archive_path):
             try:
-                item_list.extend(self.create_item_from_file(path))
+                item_list.extend(self.create_item_from_file(load_context.path, load_context))
+            except SimulationDataItemError:
+                continue
+        return item_list
+
+    def _iter_archive_member_load_contexts(self, archive_path):
+        """Generator, which yields a :class: `FileLoadContext` with the
+        content of each member of the archive at *archive_path*, which is
+        filtered like the files of a directory by :func: `find_files`.
+        """
+        for member_name, member_size, read_member in iter_archive_members(archive_path):
+            member_path = join(archive_path, *member_name.split('/'))
+            if member_size > self.max_file_size or not self._matches_file_patterns(member_path) \
+                    or not self.recursive and '/' in member_name.strip('/'):
+                continue
+            yield FileLoadContext(member_path, read_member())
+
+    def create_item_list_from_directory(self, directory_path, max_workers=1):
+        """Try to create simulation data items for all files found by
+        :func: `find_files` in a directory at *directory_path*. Ignore if
+        files can not be parsed.
+
+        :param directory_path: :class: `str` of directory path
+        :param max_workers: Number of processes used to parse the files, see
+            :func: `create_item_lists_from_path_list`
+
+        :rtype: :class: `list` of simulation data items
+        """
+
+        file_paths = list(self.find_files(directory_path))
+        item_list = []
+        for path, items, error in self._iter_item_lists_from_files(file_paths, max_workers):
+            # We definitely cannot accept thousands of exceptions on the command line,
+            # thus, files which can not be parsed are ignored silently
+            if error is None:
+                item_list.extend(items)
                 print("Parsed '{}' ".format(path))
-            except SimulationDataItemError as error:
-                pass
-                # We definitely cannot accept thousands of exceptions on the command line
-                # print((AbstractEncLog
-                #    "Could not create simulation data item from file '{}'"
-                #    " due to {}"
-                # ).format(path, error))
 
         return item_list
 
@@ -446,9 +1383,211 @@ class SimulationDataItemFactory:
                                           " '{}'"
                                       ).format(path))
 
+    def create_item_lists_from_path_list(self, path_list, max_workers=1, progress=None, loaded_files=None):
+        """Generator, which creates the list of simulation data items for each
+        path in *path_list* like :func: `create_item_list_from_path`. The
+        files of all paths are parsed by a pool of *max_workers* processes,
+        but the item lists are yielded in the order of *path_list*, each as
+        soon as all files of its path are parsed. Thus, the result is the
+        same as of a serial run. Raises :class: `SimulationDataItemError`
+        at the first path, for which the serial run would raise it.
+
+        :param path_list: Iterable of :class: `str` paths to files or
+            directories
+        :param max_workers: Number of processes used to parse the files,
+            None for the number of CPUs. For one worker or less files or
+            bytes than *PARALLEL_PARSE_MIN_FILES* or
+            *PARALLEL_PARSE_MIN_BYTES*, the files are parsed in the calling
+            process.
+        :param progress: Optional :class: `ParseProgress`, which is informed
+            about every parsed file. If it is cancelled, the generator stops
+            without yielding the path, whose files are parsed at the moment.
+        :param loaded_files: Optional mapping of the paths of files, whose
+            items are loaded already, to their key of :func: `get_file_key`
+            at loading time. These files are skipped, if they are unchanged,
+            thus, the item lists contain only the items of new and changed
+            files.
+
+        :rtype: generator of tuples (path, :class: `list` of simulation data
+            items)
+        """
+
+        for path, item_list, error in self.iter_item_lists_from_path_list(path_list, max_workers, progress,
+                                                                          loaded_files):
+            if error is not None:
+                raise error
+            yield path, item_list
+
+    def iter_item_lists_from_path_list(self, path_list, max_workers=1, progress=None, loaded_files=None):
+        """Like :func: `create_item_lists_from_path_list`, but yields tuples
+        (path, item list, error) for all paths. *error* is the :class:
+        `SimulationDataItemError`, which would be raised for the path, or
+        None. Thus, a path which can not be parsed, also due to an
+        unexpected error of a parser, does not stop the others.
+        """
+
+        # Collect the files of all paths, to spread them across the workers
+        # at once
+        path_file_paths = []
+        for path in path_list:
+            if isfile(path):
+                paths = [path]
+            elif isdir(path):
+                paths = list(self.find_files(path))
+            else:
+                path_file_paths.append((path, None, 0))
+                continue
+            if loaded_files:
+                unchanged_count = len(paths)
+                paths = [file_path for file_path in paths if not self._is_file_loaded(file_path, loaded_files)]
+                unchanged_count -= len(paths)
+            else:
+                unchanged_count = 0
+            path_file_paths.append((path, paths, unchanged_count))
+
+        file_paths = [file_path for _, paths, _ in path_file_paths if paths is not None for file_path in paths]
+        if progress is not None:
+            progress.start(file_paths)
+        results = self._iter_item_lists_from_files(file_paths, max_workers)
+
+        for path, paths, unchanged_count in path_file_paths:
+            if paths is None:
+                yield path, [], SimulationDataItemError((
+                                                            "Not at least one simulation data item can be created"
+                                                            " from path '{}'"
+                                                        ).format(path))
+                continue
+
+            item_list = []
+            path_error = None
+            for file_path, items, error in (next(results) for _ in paths):
+                if progress is not None:
+                    progress.file_parsed(file_path, items, error)
+                    if progress.is_cancelled:
+                        # Stops the pending parse jobs, too
+                        results.close()
+                        return
+                if error is None:
+                    item_list.extend(items)
+                    if file_path != path:
+                        print("Parsed '{}' ".format(file_path))
+                elif file_path == path:
+                    # Errors are only reported for single files, like for
+                    # create_item_list_from_path
+                    path_error = error
+            if paths != [path] and len(item_list) == 0 and unchanged_count == 0:
+                path_error = SimulationDataItemError()
+            yield path, item_list, path_error
+
+    @staticmethod
+    def _is_file_loaded(file_path, loaded_files):
+        file_key = loaded_files.get(file_path)
+        if file_key is None:
+            return False
+        try:
+            return get_file_key(file_path) == file_key
+        except OSError:
+            return False
+
+    def _iter_item_lists_from_files(self, file_paths, max_workers=1):
+        """Generator, which parses all files in *file_paths* using a pool of
+        *max_workers* processes, or takes their items from the *cache*, and
+        yields tuples (path, item list, error) in the order of *file_paths*. *error* is the
+        :class: `SimulationDataItemError` raised while parsing the file, or
+        None.
+        """
+
+        if self.cache is None:
+            yield from self._parse_files(file_paths, max_workers)
+            return
+
+        # Only parse the files without valid cache entry, but keep the order
+        classes = {cls.__name__: cls for cls in self._get_dispatch_order()}
+        cached_item_lists = [self.cache.get(file_path, classes) for file_path in file_paths]
+        results = self._parse_files([file_path for file_path, item_list in zip(file_paths, cached_item_lists)
+                                     if item_list is None], max_workers)
+        try:
+            for file_path, item_list in zip(file_paths, cached_item_lists):
+                if item_list is not None:
+                    yield file_path, item_list, None
+                    continue
+                result = next(results)
+                if result[2] is None:
+                    self.cache.put(file_path, result[1])
+                yield result
+        finally:
+            results.close()
+            self.cache.flush()
+
+    def _parse_files(self, file_paths, max_workers=1):
+        """Generator, which parses all files in *file_paths* using a pool of
+        *max_workers* processes, see :func: `_iter_item_lists_from_files`.
+        """
+
+        if max_workers is None:
+            max_workers = cpu_count() or 1
+        # Starting the workers takes longer than parsing a few files, thus,
+        # small amounts of files are parsed in the calling process
+        if max_workers <= 1 or len(file_paths) < PARALLEL_PARSE_MIN_FILES \
+                or sum(ParseProgress._get_file_size(file_path) for file_path in file_paths) < PARALLEL_PARSE_MIN_BYTES:
+            for file_path in file_paths:
+                yield _create_item_list_from_file(self, file_path)
+            return
+
+        # Use fresh worker processes instead of forking the caller, which
+        # might be a thread of the gui. The workers create their own factory
+        # from the (picklable) classes and the settings of this factory.
+        # Leaving the pool terminates the workers, thus, closing the generator
+        # stops the pending files.
+        settings = (tuple(self._classes), self.parse_running, list(self.file_patterns), self.recursive,
+                    self.max_file_size)
+        with get_context('spawn').Pool(max_workers, _init_parse_worker, settings) as pool:
+            # Send files in chunks to reduce the communication overhead, but
+            # keep the chunks small enough to balance the load
+            chunk_size = max(1, len(file_paths) // (4 * max_workers))
+            yield from pool.imap(_parse_file_in_worker, file_paths, chunk_size)
+
     # Magic Methods
     def __str__(self):
         return str(self._classes)
 
     def __repr__(self):
         return str("SimulationDataItemFactory with loaded classes: ".format(str(self)))
+
+
+# Parsing in worker processes of SimulationDataItemFactory
+
+# Factory of the worker process, set by _init_parse_worker
+_worker_factory = None
+
+
+def _init_parse_worker(classes, parse_running, file_patterns, recursive, max_file_size):
+    """Initializer of the worker processes: Create the factory of the worker
+    process from the *classes* and the settings of the calling factory.
+    """
+    global _worker_factory
+    _worker_factory = SimulationDataItemFactory(classes)
+    _worker_factory.parse_running = parse_running
+    _worker_factory.file_patterns = file_patterns
+    _worker_factory.recursive = recursive
+    _worker_factory.max_file_size = max_file_size
+
+
+def _parse_file_in_worker(file_path):
+    return _create_item_list_from_file(_worker_factory, file_path)
+
+
+def _create_item_list_from_file(factory, file_path):
+    """Create the item list for *file_path* with *factory*, and return a
+    tuple (path, item list, error), as exceptions are handed back from the
+    worker processes as values. Unexpected errors of a parser, eg. an
+    :class: `IndexError` for a malformed log, are handed back as
+    :class: `SimulationDataItemError`, too, so they only fail their own file.
+    """
+    try:
+        return file_path, factory.create_item_from_file(file_path), None
+    except SimulationDataItemError as error:
+        return file_path, [], error
+    except Exception as error:
+        return file_path, [], SimulationDataItemError("Could not parse file '{}': {}: {}".format(
+            file_path, type(error).__name__, error))
@@ -0,0 +1,192 @@
+##################################################################################################
+#    This file is part of RDPlot - A gui for creating rd plots based on pyqt and matplotlib
+#    <https://git.rwth-aachen.de/IENT-Software/rd-plot-gui>
+#    Copyright (C) 2017  Institut fuer Nachrichtentechnik, RWTH Aachen University, GERMANY
+#
+#    This program is free software; you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation; either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+#    GNU General Public License for more details.
+#
+#    You should have received a copy of the GNU General Public License
+#    along with this program. If not, see <http://www.gnu.org/licenses/>.
+#
+##################################################################################################
+import pickle
+import sqlite3
+import sys
+import time
+from os import environ, makedirs
+from os.path import abspath, dirname, expanduser, join
+
+from rdplot.SimulationDataItem import get_file_key
+
+
+def get_user_cache_directory():
+    """Return the platform specific directory for the cache files of RDPlot.
+
+    :rtype: :class: `str`
+    """
+    if sys.platform.startswith('win'):
+        base_directory = environ.get('LOCALAPPDATA', expanduser('~'))
+    elif sys.platform == 'darwin':
+        base_directory = expanduser(join('~', 'Library', 'Caches'))
+    else:
+        base_directory = environ.get('XDG_CACHE_HOME', expanduser(join('~', '.cache')))
+    return join(base_directory, 'rdplot')
+
+
+class SimulationDataItemCache:
+    """Persistent cache of parsed simulation data items, stored in a SQLite
+    database. The items are stored pickled, ie. with summary data, temporal
+    data, config and all other attributes. An entry is only valid, if
+
+    * size and modification time of the file are unchanged, and
+    * the class of the item is still known to the factory with the same
+      *parser_version*, see :class: `AbstractSimulationDataItem`.
+
+    The cache is limited to *max_size* bytes. If it is exceeded, the least
+    recently used entries are evicted.
+
+    Changes are written in one transaction on :func: `flush`, as committing
+    each entry separately would be slow.
+
+    :param path: Path of the database file. Defaults to *parse_cache.sqlite*
+        in the user cache directory.
+    :param max_size: Maximum size of the stored items in bytes
+    """
+
+    # Version of the database layout, databases of other versions are reset
+    schema_version = 1
+
+    def __init__(self, path=None, max_size=1024 ** 3):
+        if path is None:
+            path = join(get_user_cache_directory(), 'parse_cache.sqlite')
+        self.path = path
+        self.max_size = max_size
+
+        # The connection is opened on first access, as the cache is usually
+        # created in the gui thread, but used by the parser thread
+        self._connection = None
+        self._accessed_paths = []
+
+    def _get_connection(self):
+        if self._connection is None:
+            makedirs(dirname(abspath(self.path)), exist_ok=True)
+            connection = sqlite3.connect(self.path, check_same_thread=False)
+            if connection.execute('PRAGMA user_version').fetchone()[0] != self.schema_version:
+                connection.execute('DROP TABLE IF EXISTS items')
+                connection.execute('PRAGMA user_version = {}'.format(self.schema_version))
+            connection.execute(
+                'CREATE TABLE IF NOT EXISTS items ('
+                'path TEXT PRIMARY KEY, size INTEGER, mtime_ns INTEGER, '
+                'class_name TEXT, parser_version TEXT, last_access REAL, nbytes INTEGER, data BLOB)'
+            )
+            connection.execute('CREATE INDEX IF NOT EXISTS items_last_access ON items (last_access)')
+            connection.commit()
+            self._connection = connection
+        return self._connection
+
+    def get(self, path, classes):
+        """Return the cached item list of the file at *path*, or None if there
+        is no valid entry.
+
+        :param path: Path of the file
+        :param classes: Mapping of class names to the classes, which are known
+            to the factory
+
+        :rtype: :class: `list` of simulation data items or None
+        """
+        path = abspath(path)
+        try:
+            size, mtime_ns = get_file_key(path)
+        except OSError:
+            return None
+
+        row = self._get_connection().execute(
+            'SELECT size, mtime_ns, class_name, parser_version, data FROM items WHERE path = ?', (path,)
+        ).fetchone()
+        if row is None:
+            return None
+
+        cached_size, cached_mtime_ns, class_name, parser_version, data = row
+        cls = classes.get(class_name)
+        if (cached_size, cached_mtime_ns) != (size, mtime_ns) or cls is None \
+                or str(cls.parser_version) != parser_version:
+            return None
+
+        try:
+            item_list = pickle.loads(data)
+        except Exception:
+            # eg. classes which have been renamed or moved since the entry was stored
+            return None
+
+        self._accessed_paths.append(path)
+        return item_list
+
+    def put(self, path, item_list):
+        """Store the *item_list* parsed from the file at *path*. Empty item
+        lists and items of running simulations are not stored.
+
+        :param path: Path of the file
+        :param item_list: :class: `list` of simulation data items
+        """
+        if len(item_list) != 1 or item_list[0].is_running:
+            return
+
+        path = abspath(path)
+        try:
+            size, mtime_ns = get_file_key(path)
+        except OSError:
+            return
+
+        cls = item_list[0].__class__
+        data = pickle.dumps(item_list, pickle.HIGHEST_PROTOCOL)
+        self._get_connection().execute(
+            'INSERT OR REPLACE INTO items VALUES (?, ?, ?, ?, ?, ?, ?, ?)',
+            (path, size, mtime_ns, cls.__name__, str(cls.parser_version), time.time(), len(data), data)
+        )
+
+    def flush(self):
+        """Write the access times of the cache hits and the new entries to the
+        database, and evict the least recently used entries, if the cache
+        exceeds its size.
+        """
+        if self._connection is None:
+            return
+
+        connection = self._connection
+        now = time.time()
+        connection.executemany('UPDATE items SET last_access = ? WHERE path = ?',
+                               ((now, path) for path in self._accessed_paths))
+        self._accessed_paths.clear()
+
+        total_size = connection.execute('SELECT COALESCE(SUM(nbytes), 0) FROM items').fetchone()[0]
+        if total_size > self.max_size:
+            evicted_paths = []
+            for path, nbytes in connection.execute('SELECT path, nbytes FROM items ORDER BY last_access'):
+                if total_size <= self.max_size:
+                    break
+                evicted_paths.append((path,))
+                total_size -= nbytes
+            connection.executemany('DELETE FROM items WHERE path = ?', evicted_paths)
+
+        connection.commit()
+
+    def clear(self):
+        """Remove all entries from the cache."""
+        connection = self._get_connection()
+        connection.execute('DELETE FROM items')
+        connection.commit()
+        self._accessed_paths.clear()
+
+    def close(self):
+        if self._connection is not None:
+            self.flush()
+            self._connection.close()
+            self._connection = None
@@ -17,48 +17,107 @@
 #    along with this program. If not, see <http://www.gnu.org/licenses/>.
 #
 ##################################################################################################
-import xmltodict
+import re
 from abc import abstractmethod
-from xml.parsers.expat import ExpatError
+from xml.parsers.expat import ExpatError, ParserCreate
 from os.path import normpath, basename, sep, dirname
 
-from rdplot.SimulationDataItem import (AbstractSimulationDataItem, SimulationDataItemError)
+from rdplot.SimulationDataItem import (AbstractSimulationDataItem, SimulationDataItemError, strip_compression_suffix)
+
+
+class _StopReading(Exception):
+    pass
+
+
+def read_dat_log(xml_text, stop_after_codec=False):
+    """Read the entries of a dat log, ie. the *Value* and *Unit* of the
+    elements of the *Logfile*, eg.
+    ``<Rate><Unit>kbps</Unit><Value>4171.1368</Value></Rate>``. The xml is
+    read by a streaming parser, thus, no tree of the whole document is built.
+
+    :param xml_text: Content of the dat log, as :class: `str` or bytes-like
+        object, eg. the buffer of a :class: `FileLoadContext`
+    :param stop_after_codec: Stop reading after the value of the *Codec*
+        element, eg. to detect the parser class of a log
+
+    :rtype: :class: `dict` of element names and :class: `dict`s with the
+        keys 'Value' and/or 'Unit'
+    """
+    entries = {}
+    # Names of the open elements, and the character data of the current one
+    element_names = []
+    text = []
+
+    def start_element(name, attributes):
+        element_names.append(name)
+        text.clear()
+
+    def end_element(name):
+        element_names.pop()
+        if len(element_names) == 2 and element_names[0] == 'Logfile' and name in ('Value', 'Unit'):
+            entries.setdefault(element_names[1], {})[name] = ''.join(text).strip()
+            if stop_after_codec and element_names[1] == 'Codec' and name == 'Value':
+                raise _StopReading
+
+    parser = ParserCreate()
+    parser.StartElementHandler = start_element
+    parser.EndElementHandler = end_element
+    parser.CharacterDataHandler = text.append
+    try:
+        parser.Parse(xml_text, True)
+    except _StopReading:
+        pass
+    return entries
 
 
 class AbstractDatLog(AbstractSimulationDataItem):
-    def __init__(self, path):
+    # The entries of the log are stored instead of the xml tree
+    parser_version = 2
+
+    def __init__(self, path, load_context=None):
         super().__init__(path)
 
-        with open(self.path, 'r') as dat_log:
-            xml = dat_log.read()
-            sim_data = xmltodict.parse(xml)
-            sim_data = sim_data['Logfile']
-            # store the parsed xml dict
-            self.sim_data = sim_data
+        # Reuse the buffer of the load context, which was already read
+        # while detecting the parser
+        load_context = self._get_load_context(self.path, load_context)
+
+        # Units of the entries, which are needed for the labels
+        self._units = {name: entry['Unit'] for (name, entry) in self._get_entries(load_context).items()
+                       if 'Unit' in entry}
 
         # Parse file path and set additional identifiers
         # self.logType = self._get_Type(path)
-        self.sequence, self.config, self.qp = self._parse_path(self.path)
+        self.sequence, self.config, self.qp = self._parse_path(self.path, load_context)
 
         # Dictionaries holding the parsed values
-        self.summary_data = self._parse_summary_data()
+        self.summary_data = self._parse_summary_data(load_context)
         self.temporal_data = {}  # Dat logs have no temporal data
 
-        self.log_config = self._parse_config()
+        self.log_config = self._parse_config(load_context)
 
-    def _parse_path(self, path):
+    def _parse_path(self, path, load_context):
         """ parses the identifiers for an encoder log out of the
         path of the logfile and the sequence name and qp given in
          the logfile"""
         # set config to path of sim data item
         config = dirname(normpath(path))
-        sim_data = self.sim_data
+        entries = self._get_entries(load_context)
 
-        sequence = sim_data['SeqName']['Value']
-        qp = sim_data['QP']['Value']
+        sequence = entries['SeqName']['Value']
+        qp = entries['QP']['Value']
 
         return sequence, config, qp
 
+    @classmethod
+    def _get_entries(cls, load_context):
+        """Return the result of :func: `read_dat_log` for the text of
+        *load_context*. The result is stored at the load context, so that the
+        log is read only once for all parse methods.
+        """
+        if AbstractDatLog not in load_context.parse_results:
+            load_context.parse_results[AbstractDatLog] = read_dat_log(load_context.buffer)
+        return load_context.parse_results[AbstractDatLog]
+
     # Properties
 
     @property
@@ -66,7 +125,7 @@ class AbstractDatLog(AbstractSimulationDataItem):
         return [self.__class__.__name__, self.sequence, self.config, self.qp]
 
     @abstractmethod
-    def _parse_config(self):
+    def _parse_config(self, load_context):
         """Method which parses log file to get config (QP, other parameters).
         Abstract, needs to be implemented by log parsers
         :return:
@@ -90,46 +149,59 @@ class AbstractDatLog(AbstractSimulationDataItem):
 
     # Non-abstract Helper Functions
     @classmethod
-    def _enc_log_file_matches_re_pattern(cls, path, pattern):
+    def _enc_log_file_matches_re_pattern(cls, path, pattern, load_context=None):
         """"""
-        if path.endswith("enc.log"):
-            return cls._is_file_text_matching_re_pattern(path, pattern)
+        if strip_compression_suffix(path).endswith("enc.log"):
+            return cls._is_file_text_matching_re_pattern(path, pattern, load_context)
         return False
 
 
 class DatLogBasedOnClassName(AbstractDatLog):
+    # Signature, the codec is specified at the top of the log file
+    header_pattern = r'<Logfile'
+    _codec_pattern = re.compile(r'<Codec>\s*<Value>([^<]*)</Value>')
+
     @classmethod
-    def can_parse_file(cls, path):
+    def matches_signature(cls, path, load_context):
+        if not super().matches_signature(path, load_context):
+            return False
+        # compare codec without parsing the xml. if the codec is not found
+        # in the head, the decision is left to can_parse_file
+        m = cls._codec_pattern.search(load_context.head)
+        return m is None or cls.__name__[6:] in m.group(1)
+
+    @classmethod
+    def can_parse_file(cls, path, load_context=None):
             try:
-                with open(path, 'r') as dat_log:
-                    xml = dat_log.read()
-                sim_data = xmltodict.parse(xml)
+                xml = cls._get_load_context(path, load_context).buffer
+                # the log is only read until the codec
+                entries = read_dat_log(xml, stop_after_codec=True)
                 # discard 'DatLog' from class name, then compare to class specified in log file
-                is_sim_of_this_class = ( cls.__name__[6:]  in sim_data['Logfile']['Codec']['Value'])
+                is_sim_of_this_class = ( cls.__name__[6:]  in entries['Codec']['Value'])
                 return is_sim_of_this_class
             except (ExpatError, UnicodeDecodeError, KeyError, IsADirectoryError,FileNotFoundError, PermissionError):
                 return False
 
-    def _parse_summary_data(self):
+    def _parse_summary_data(self, load_context):
         try:
-            # create local copy of sim data. we don't want to delete the rate field outside of this function
-            sim_data = dict(self.sim_data)
-            rate = float(sim_data['Rate']['Value'])
-            del sim_data['Rate']
+            # create local copy of the entries. we don't want to delete the rate field outside of this function
+            entries = dict(self._get_entries(load_context))
+            rate = float(entries['Rate']['Value'])
+            del entries['Rate']
 
             data = {}
-            for key, value in sim_data.items():
+            for key, value in entries.items():
                 try:
-                    data[key] = [(rate, float(sim_data[key]['Value']))]
+                    data[key] = [(rate, float(entries[key]['Value']))]
                 except ValueError:
-                    print("Could not convert %s: %s to float" % (key,sim_data[key]['Value'] ))
+                    print("Could not convert %s: %s to float" % (key,entries[key]['Value'] ))
                     continue
 
             return data
         except IndexError:
             raise
 
-    def _parse_config(self):
+    def _parse_config(self, load_context):
         """Method which parses log file to get config (QP, other parameters).
         Abstract, needs to be implemented by log parsers
         :return:
@@ -141,10 +213,13 @@ class DatLogBasedOnClassName(AbstractDatLog):
         :param keys: Variable/Path for which to get the labels
         :return: tuple of labels: (x-axis label, y-axis label)
         """
-        sim_data = self.sim_data
-        unit_rate = sim_data['Rate']['Unit']
-        if 'Unit' in sim_data[keys[-1]]:
-            label = (unit_rate, sim_data[keys[-1]]['Unit'])
+        # This is for conformance with rd data written out by older versions of rdplot
+        if not hasattr(self, '_units'):
+            self._units = {name: entry['Unit'] for (name, entry) in self.sim_data.items()
+                           if isinstance(entry, dict) and 'Unit' in entry}
+        unit_rate = self._units['Rate']
+        if keys[-1] in self._units:
+            label = (unit_rate, self._units[keys[-1]])
         else:
             label = ('dummy', 'dummy')
 
@@ -173,7 +248,7 @@ class DatLogJEM70GeoHOMC(DatLogBasedOnClassName):
 
 class DatLogConversionPSNRLoss360(DatLogBasedOnClassName):
 
-    def _parse_path(self, path):
+    def _parse_path(self, path, load_context):
         # logs from this class are not actual encoder simulations, don't have qp, using the conversion size for qp
         # todo: should rd-plot allow different x-axis then qp?
         filename = basename(path)
@@ -191,14 +266,11 @@ class DatLogConversionPSNRLoss360(DatLogBasedOnClassName):
 
         # prepend simulation directory to config
         config = dirname(normpath(path)) + config
-        qp = None
-        with open(self.path, 'r') as dat_log:
-            try:
-                xml = dat_log.read()
-                sim_data = xmltodict.parse(xml)
-                # TODO support for layer specific qp
-                qp = sim_data['Logfile']['QP']['Value']
-            except (IndexError, ExpatError):
-                raise SimulationDataItemError
+        # the xml was already read by the constructor, no need to read the file again
+        try:
+            # TODO support for layer specific qp
+            qp = self._get_entries(load_context)['QP']['Value']
+        except (IndexError, KeyError):
+            raise SimulationDataItemError
 
         return sequence, config, qp
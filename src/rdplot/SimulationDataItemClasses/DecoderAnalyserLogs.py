@@ -21,23 +21,36 @@ import re
 from os.path import normpath, basename, dirname
 from abc import abstractclassmethod
 
-from rdplot.SimulationDataItem import AbstractSimulationDataItem, SimulationDataItemError
+import numpy as np
+
+from rdplot.SimulationDataItem import (AbstractSimulationDataItem, SimulationDataItemError,
+                                       strip_compression_suffix)
 
 
 class AbstractDecAnalyserLog(AbstractSimulationDataItem):
-    def __init__(self, path):
+    # The statistics are stored as columnar table
+    parser_version = 2
+    # Names of the values of a statistics line
+    _variables_list = ['CABAC Count', 'CABAC Sum', 'CABAC bits', 'EP Count', 'EP Sum', 'EP bits', 'Total bits',
+                       'Total bytes']
+
+    def __init__(self, path, load_context=None):
         super().__init__(path)
 
+        # All parse methods share the buffer of the load context, thus, the
+        # log file is read only once
+        load_context = self._get_load_context(self.path, load_context)
+
         # Parse file path and set additional identifiers
         # self.logType = self._get_Type(path)
-        self.sequence, self.config, self.qp = self._parse_path(self.path)
+        self.sequence, self.config, self.qp = self._parse_path(self.path, load_context)
 
-        # Dictionaries holding the parsed values
-        self.analyser_data = self._parse_analyser_data()
+        # Table holding the parsed values, see analyser_data
+        self.analyser_table = self._parse_analyser_data(load_context)
 
-        self.log_config = self._parse_config()
+        self.log_config = self._parse_config(load_context)
 
-    def _parse_path(self, path):
+    def _parse_path(self, path, load_context):
         """ parses the identifiers for an encoder log out of the
         path of the logfile and the sequence name and qp given in
          the logfile"""
@@ -68,12 +81,74 @@ class AbstractDecAnalyserLog(AbstractSimulationDataItem):
 
     # Properties
 
+    @property
+    def analyser_data(self):
+        """Dictionary tree of the parsed values, which is created once from
+        *analyser_table* on first access
+        """
+        # Rd data written out by older versions of rdplot has the tree only
+        if getattr(self, '_analyser_data', None) is None:
+            self._analyser_data = self._get_analyser_data()
+        return self._analyser_data
+
+    @analyser_data.setter
+    def analyser_data(self, analyser_data):
+        self._analyser_data = analyser_data
+
+    # The tree is not pickled along with the table, as it is created again
+    # from the table. Like :class: `ColumnValues`, the columns of the table
+    # are pickled, eg. to .rd files, as plain lists with their dtypes, so the
+    # files do not depend on the version of NumPy, which wrote them
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        if 'analyser_table' in state:
+            state.pop('_analyser_data', None)
+            state['analyser_table'] = {name: {'values': column.tolist(), 'dtype': column.dtype.str}
+                                       for (name, column) in state['analyser_table'].items()}
+        return state
+
+    def __setstate__(self, state):
+        if 'analyser_table' in state:
+            state['analyser_table'] = {name: np.array(column['values'], dtype=column['dtype'])
+                                       for (name, column) in state['analyser_table'].items()}
+        # Rd data written out by older versions of rdplot has the tree only
+        if 'analyser_data' in state:
+            state['_analyser_data'] = state.pop('analyser_data')
+        self.__dict__.update(state)
+
+    def _get_analyser_data(self):
+        table = self.analyser_table
+        data = dict()
+        data['Total'] = {}
+
+        columns = [table[column].tolist() for column in ['Table', 'Name', 'Width', 'Type'] + self._variables_list]
+        for (statistic_table, statistic_name, statistic_width, statistic_type, *values) in zip(*columns):
+            # create the path of the statistic, if not existing
+            if statistic_table == 'Statistics':
+                path = [statistic_type, statistic_width, statistic_name]
+            elif statistic_table == 'Total':
+                path = ['Total', statistic_name]
+            elif statistic_table == 'bySize':
+                path = ['bySize', statistic_width]
+            elif statistic_table == 'byType':
+                path = ['byType', statistic_type]
+            else:
+                path = ['bySize/byType', statistic_width, statistic_type]
+            item = data
+            for key in path:
+                item = item.setdefault(key, {})
+
+            # Reference all data to qp
+            item.update(zip(self._variables_list, ([(self.qp, value)] for value in values)))
+
+        return data
+
     @property
     def tree_identifier_list(self):
         return [self.__class__.__name__, self.sequence, self.config, self.qp]
 
     @abstractclassmethod
-    def _parse_config(self):
+    def _parse_config(self, load_context):
         """Method which parses log file to get config (QP, other parameters).
         Abstract, needs to be implemented by log parsers
         :return:
@@ -92,112 +167,101 @@ class AbstractDecAnalyserLog(AbstractSimulationDataItem):
 
     # Non-abstract Helper Functions
     @classmethod
-    def _enc_log_file_matches_re_pattern(cls, path, pattern):
+    def _enc_log_file_matches_re_pattern(cls, path, pattern, load_context=None):
         """"""
-        if path.endswith("dec.log"):
-            return cls._is_file_text_matching_re_pattern(path, pattern)
+        if strip_compression_suffix(path).endswith("dec.log"):
+            return cls._is_file_text_matching_re_pattern(path, pattern, load_context)
         return False
 
 
 class DecAnalyserLogHM(AbstractDecAnalyserLog):
-    # at the moment not the complete decoder analyser log is parsed. the bySize and bySize/byType values are left out
-
     # Order value, used to determine order in which parser are tried.
     parse_order = 10
+    # Signature, checked on the head of the file before can_parse_file
+    file_name_suffixes = ('dec.log',)
+    header_pattern = r'^HM \s software'
 
     @classmethod
-    def can_parse_file(cls, path):
-        matches_class = cls._enc_log_file_matches_re_pattern(path, r'^HM \s software')
-        is_finished = cls._enc_log_file_matches_re_pattern(path, '\[TOTAL')
+    def can_parse_file(cls, path, load_context=None):
+        load_context = cls._get_load_context(path, load_context)
+        matches_class = cls._enc_log_file_matches_re_pattern(path, r'^HM \s software', load_context)
+        is_finished = cls._enc_log_file_matches_re_pattern(path, '\[TOTAL', load_context)
         return matches_class and is_finished
 
-    def _parse_analyser_data(self):
-        with open(self.path, 'r') as log_file:
-            log_text = log_file.read()  # reads the whole text file
-
-            # we are only interested in the statistics. splitting the file at the line with 'Decoder statistics'
-            dec_statistics = re.split('Decoder statistics', log_text)[1]
-            # each statistic has its own line:
-            dec_statistics = re.split('\n', dec_statistics)
-
-            data = dict()
-            data['Total'] = {}
-
-            variables_list = ['CABAC Count', 'CABAC Sum', 'CABAC bits', 'EP Count', 'EP Sum', 'EP bits', 'Total bits',
-                              'Total bytes']
-
-            # process each line
-            for statistic in dec_statistics:
-                # try to match non total items
-                m = re.match(
-                    '\s*(\S+)\s*:' +         # name
-                    '\s*(\S+)' +             # width
-                    '\s*(\S+)' +             # type
-                    '\s*(\S+)' +             # CABAC Count
-                    '\s*(\S+)' +             # CABAC Sum
-                    '\s*(\S+)' +             # CABAC bits
-                    '\s*(\S+)' +             # EP Count
-                    '\s*(\S+)' +             # EP Sum
-                    '\s*(\S+)' +             # EP bits
-                    '\s*(\S+)' +             # Total bits
-                    '\s*\(\s*(\S+)\)',       # Total bytes
-                    statistic)
-                if m:
-                    statistic_name = m.group(1)
-                    statistic_width = m.group(2)
-                    statistic_type = m.group(3)
-
-                    # create type, width, statistic name if not existing
-                    if statistic_type not in data:
-                        data[statistic_type] = {}
-                    if statistic_width not in data[statistic_type]:
-                        data[statistic_type][statistic_width] = {}
-                    if statistic_name not in data[statistic_type][statistic_width]:
-                        data[statistic_type][statistic_width][statistic_name] = {}
-
-                    for idx, var_name in enumerate(variables_list):
-                        # Reference all data to bit rate
-                        data[statistic_type][statistic_width][statistic_name][var_name] = []
-                        # add an entry for each variable in variables_list
-                        data[statistic_type][statistic_width][statistic_name][var_name].append(
-                            (self.qp, float(m.group(idx + 4))))
-                        pass
-
-                    continue
-
-                # try to match total items
-                m = re.match(
-                    '\[(\S+)\s*~' +          # name
-                    '\s*(\S+)' +             # width
-                    '\s*(\S+)' +             # type
-                    '\s*(\S+)' +             # CABAC Count
-                    '\s*(\S+)' +             # CABAC Sum
-                    '\s*(\S+)' +             # CABAC bits
-                    '\s*(\S+)' +             # EP Count
-                    '\s*(\S+)' +             # EP Sum
-                    '\s*(\S+)' +             # EP bits
-                    '\s*(\S+)' +             # Total bits
-                    '\s*\(\s*(\S+)\)\]',     # Total bytes
-                    statistic)
-                if m:
-                    statistic_name = m.group(1)
-
-                    # create  statistic name if not existing
-                    if statistic_name not in data['Total']:
-                        data['Total'][statistic_name] = {}
-
-                    for idx, var_name in enumerate(variables_list):
-                        # Reference all data to qp
-                        data['Total'][statistic_name][var_name] = []
-                        # add an entry for each variable in variables_list
-                        data['Total'][statistic_name][var_name].append((self.qp, float(m.group(idx + 4))))
-                        pass
-
-                    continue
-
-        return data
+    # Pattern of the statistics lines, eg.
+    #  CABAC_BITS__SPLIT_FLAG     :       8      -   12 ... 34 (   5)
+    # [TOTAL                      ~  ~~GT~~ ~~GT~~   12 ... 34 (   5)]
+    # The first one is a regular line, the second one a total line. The name
+    # of regular lines is empty for the tables bySize, byType and
+    # bySize/byType. Lines of statistics, which are coded with EP bins only,
+    # have no CABAC values.
+    _statistic_pattern = re.compile(rb"""
+        ^ (?: \[ (?P<total_name> [^~\n]*? ) [ \t]* ~ | [ \t]* (?P<name> [^:\n]*? ) [ \t]* : )
+        [ \t]+ (?P<width> \S+ ) [ \t]+ (?P<type> \S+ )
+        (?P<values> [^(\n]* ) \( [ \t]* (?P<bytes> \S+ ) \)
+        """, re.M + re.X)
 
-    def _parse_config(self):
+    @classmethod
+    def _tokenize_statistics(cls, log_buffer):
+        """Classify each line of the decoder statistics in a single pass, and
+        return the rows of the statistics table. A row consists of the table,
+        ie. 'Statistics', 'Total', 'bySize', 'byType' or 'bySize/byType', the
+        name, width and type of the statistic, and the values of
+        *_variables_list*. The statistics are matched in the bytes-like
+        *log_buffer*, only the matched fields are decoded.
+
+        :rtype: :class: `list` of :class: `tuple`s
+        """
+        # we are only interested in the statistics, ie. the part after the first line with 'Decoder statistics'
+        # up to the next one
+        start = log_buffer.find(b'Decoder statistics')
+        if start == -1:
+            return []
+        start += len(b'Decoder statistics')
+        end = log_buffer.find(b'Decoder statistics', start)
+        if end == -1:
+            end = len(log_buffer)
+
+        rows = []
+        for match in cls._statistic_pattern.finditer(log_buffer, start, end):
+            total_name, name, width, statistic_type, values, total_bytes = match.groups()
+            values = values.split()
+            if len(values) == 4:
+                # EP bins only
+                values = [b'0', b'0', b'0'] + values
+            elif len(values) != 7:
+                continue
+            values.append(total_bytes)
+            width = width.decode(errors='replace')
+            statistic_type = statistic_type.decode(errors='replace')
+
+            if total_name is not None:
+                row = ('Total', total_name.decode(errors='replace'), width, statistic_type)
+            elif name:
+                row = ('Statistics', name.decode(errors='replace'), width, statistic_type)
+            elif statistic_type == '-':
+                row = ('bySize', '', width, statistic_type)
+            elif width == '-':
+                row = ('byType', '', width, statistic_type)
+            else:
+                row = ('bySize/byType', '', width, statistic_type)
+            rows.append(row + tuple(map(float, values)))
+        return rows
+
+    def _parse_analyser_data(self, load_context):
+        """Parse the decoder statistics to a columnar table, which is stored as
+        *analyser_table*. The nested dictionaries of *analyser_data* are
+        created from the table on access.
+        """
+        rows = self._tokenize_statistics(load_context.buffer)
+        columns = list(zip(*rows)) or [()] * (4 + len(self._variables_list))
+        table = {name: np.array(column, dtype=str)
+                 for (name, column) in zip(['Table', 'Name', 'Width', 'Type'], columns[:4])}
+        table.update((name, np.array(column, dtype=np.float64))
+                     for (name, column) in zip(self._variables_list, columns[4:]))
+        return table
+
+    def _parse_config(self, load_context):
         """Method which parses log file to get config (QP, other parameters).
         Abstract, needs to be implemented by log parsers
         :return:
@@ -20,41 +20,126 @@
 import re
 from abc import abstractmethod
 from collections import defaultdict
+from itertools import chain, takewhile
+from os import stat
 from os.path import normpath, basename, dirname, splitext
 
-from rdplot.SimulationDataItem import (AbstractSimulationDataItem)
+from rdplot.SimulationDataItem import (AbstractSimulationDataItem, FileLoadContext, LazyColumnValues,
+                                       SimulationDataItemError,
+                                       columns_from_rows, concatenate_columns, iter_lines, strip_compression_suffix)
+
+
+def _decode(values):
+    """Decode the :class: `bytes` *values*, eg. the groups of a match in the
+    buffer of a log. Undecodable bytes are replaced, None is kept.
+
+    :rtype: :class: `tuple` of :class: `str`
+    """
+    return tuple(value.decode(errors='replace') if value is not None else None for value in values)
 
 
 class AbstractEncLog(AbstractSimulationDataItem):
-    def __init__(self, path):
+    # Temporal data is stored as columns, see :class: `ColumnValues`, and
+    # parsed on first access
+    parser_version = 3
+    # Names of the temporal variables, if they are known without parsing
+    # the temporal data, see :func: `_get_temporal_tree`
+    _temporal_names = None
+
+    def __init__(self, path, load_context=None):
         super().__init__(path)
 
+        # All parse methods share the buffer of the load context, thus, the
+        # log file is mapped only once. The log is parsed by bytes regexes,
+        # and is not decoded as a whole
+        load_context = self._get_load_context(self.path, load_context)
+
         # Parse file path and set additional identifiers
         # self.logType = self._get_Type(path)
-        self.sequence, self.config = self._parse_path(self.path)
+        self.sequence, self.config = self._parse_path(self.path, load_context)
 
         # Dictionaries holding the parsed values
-        self.summary_data = self._parse_summary_data()
-        self.temporal_data = self._parse_temporal_data()
+        # Logs of running encoders do not have summary data yet. Their
+        # temporal data is parsed by update, which remembers the size of the
+        # already parsed part of the file in *_parsed_size*
+        # Temporal data of finished logs is parsed lazily on first access,
+        # starting at the POC block at byte *_temporal_offset* of the file.
+        # Members of archives are in memory already, and reading them again
+        # would decompress the whole archive, thus, their temporal data is
+        # parsed at once.
+        self.is_running = not self._is_log_finished(self.path, load_context)
+        if self.is_running:
+            self.summary_data = {}
+            self.temporal_data = self._parse_temporal_buffer(b'')
+            self._parsed_size = 0
+            self.update()
+        else:
+            self.summary_data = self._parse_summary_data(load_context)
+            self._temporal_offset = self._get_temporal_offset(load_context)
+            if load_context.is_archive_member:
+                self.temporal_data = self._parse_temporal_buffer(load_context.buffer, offset=self._temporal_offset)
+            else:
+                self.temporal_data = None
         self.additional_params = []
 
-        self.log_config = self._parse_config()
+        self.log_config = self._parse_config(load_context)
+
+    @property
+    def temporal_data(self):
+        """Temporal data of the log, which is parsed on first access"""
+        if self._temporal_data is None:
+            self._temporal_data = self._load_temporal_data()
+        return self._temporal_data
+
+    @temporal_data.setter
+    def temporal_data(self, temporal_data):
+        self._temporal_data = temporal_data
 
-    def _parse_path(self, path):
+    def load_lazy_data(self):
+        self.temporal_data
+
+    @staticmethod
+    def _get_temporal_offset(load_context):
+        """Return the position in the file of the first POC line."""
+        log_buffer = load_context.buffer
+        return 0 if log_buffer[:3] == b'POC' else log_buffer.find(b'\nPOC') + 1 or len(log_buffer)
+
+    def _load_temporal_data(self):
+        """Parse the temporal data from the POC block of the log file. If
+        the file is not available anymore, the temporal data is empty.
+        """
+        load_context = FileLoadContext(self.path)
+        try:
+            return self._parse_temporal_buffer(load_context.buffer, offset=self._temporal_offset)
+        except OSError:
+            return self._parse_temporal_buffer(b'')
+        finally:
+            load_context.close()
+
+    def _get_temporal_tree(self):
+        """Return the temporal data for the *data* property. If it is not
+        parsed yet, but the names of the temporal variables are known, the
+        variables are given as :class: `LazyColumnValues`. Thus, the temporal
+        data is only parsed, if one of its variables is plotted.
+        """
+        if self._temporal_data is not None or self._temporal_names is None:
+            return self.temporal_data
+        return {name: LazyColumnValues(lambda name=name: self.temporal_data[name])
+                for name in self._temporal_names.values()}
+
+    def _parse_path(self, path, load_context):
         """ parses the identifiers for an encoder log out of the
         path of the logfile and the sequence name and qp given in
          the logfile"""
         # set config to path of sim data item
         config = dirname(normpath(path))
-        # open log file and parse for sequence name and qp
-        with open(self.path, 'r') as log_file:
-            log_text = log_file.read()  # reads the whole text file
-            sequence = re.findall(r""" ^Input \s+ File \s+ : \s+ (\S+) $
-                                    """, log_text, re.M + re.X)
+        # parse log text for sequence name and qp
+        sequence = re.findall(rb""" ^Input \s+ File \s+ : \s+ (\S+) \r? $
+                                """, load_context.buffer, re.M + re.X)
 
         # set sequence to the sequence name without path and suffix
         # not for
-        sequence = splitext(basename(sequence[-1]))[0]
+        sequence = splitext(basename(sequence[-1].decode(errors='replace')))[0]
 
         return sequence, config
 
@@ -122,13 +207,57 @@ class AbstractEncLog(AbstractSimulationDataItem):
             return [self.__class__.__name__, self.sequence, self.config]
 
     @abstractmethod
-    def _parse_config(self):
+    def _parse_config(self, load_context):
         """Method which parses log file to get config (QP, other parameters).
         Abstract, needs to be implemented by encoder log parsers
         :return:
         """
         pass
 
+    # The config header of HM based logs ends before the list of macros, or,
+    # eg. for HM 14, which does not write out the macros, before the first
+    # POC line. Only this prefix of a log is read to parse the config.
+    _config_header_end_pattern = re.compile(rb'^POC | Non-environment-variable-controlled', re.M | re.X)
+    # Some of the configs should not be interpreted as parameters
+    _excluded_config_pattern = re.compile(
+        'RealFormat | Warning | InternalFormat | Byteswrittentofile | Frameindex | TotalTime | HMsoftware', re.X
+    )
+
+    @classmethod
+    def _get_config_header(cls, load_context):
+        """Return the config header of the log as :class: `bytes`, see
+        *_config_header_end_pattern*.
+        """
+        return load_context.read_until(cls._config_header_end_pattern)
+
+    @classmethod
+    def _parse_config_lines(cls, lines):
+        """Parse the parameters of the *lines* of the config header of an HM
+        based log. Lines with a single colon are parameters, lines with
+        several colons are split into their parameters.
+
+        :rtype: :class: `dict` of parameter names and values
+        """
+        cleanlist = []
+        for one_line in lines:
+            if one_line:
+                if one_line.count(':') == 1:
+                    clean_line = one_line.strip(' \n\t\r')
+                    clean_line = re.sub('\s+', '', clean_line)
+                    if not cls._excluded_config_pattern.search(clean_line):
+                        cleanlist.append(clean_line)
+                elif one_line.count(':') > 1:
+                    if re.search('\w+ \s+ \w+ \s+ \w+ \s+ :\s+ \( \w+ : \d+ , \s+ \w+ : \d+ \)', one_line, re.X):
+                        clean_line = re.findall('\w+ \s+ \w+ \s+ \w+ \s+ :\s+ \( \w+ : \d+ , \s+ \w+ : \d+ \)',
+                                                one_line, re.X)
+                    else:
+                        clean_line = re.findall('\w+ : \d+ | \w+ : \s+ \w+ = \d+', one_line, re.X)
+                    for clean_item in clean_line:
+                        if not cls._excluded_config_pattern.search(clean_item):
+                            cleanlist.append(clean_item)
+
+        return dict(item.split(':', maxsplit=1) for item in cleanlist)
+
     @property
     def data(self):
         # This is for conformance with rd data written out by older versions of rdplot
@@ -139,7 +268,7 @@ class AbstractEncLog(AbstractSimulationDataItem):
         return [
             (
                 [self.sequence, self.config] + l1[0:len(l1)],
-                {self.__class__.__name__: {'Temporal': self.temporal_data}}
+                {self.__class__.__name__: {'Temporal': self._get_temporal_tree()}}
             ),
             (
                 [self.sequence, self.config] + l1[0:len(l1) - 1],
@@ -150,7 +279,7 @@ class AbstractEncLog(AbstractSimulationDataItem):
     # Abstract Methods/Properties
     @classmethod
     @abstractmethod
-    def can_parse_file(cls, path):
+    def can_parse_file(cls, path, load_context=None):
         """Check, if the file at *path* can be parsed by the class. The class
         can can for example check, if the file name or the file extension
         matches a certain pattern, or inspect the contents of the file. Note,
@@ -161,350 +290,613 @@ class AbstractEncLog(AbstractSimulationDataItem):
         :param path:  path to file
         :type path: :class: `String`
 
+        :param load_context: Shared :class: `FileLoadContext` of the file
+
         :rtype: :class: `Bool`
         """
         pass
 
+    def update(self):
+        """Parse the lines, which have been appended to the log file of a
+        running encoder since the last update, and append their frames to the
+        temporal data. Only complete lines are parsed, thus, a partially
+        written line is parsed by a later update. If the encoder has finished,
+        the summary data is parsed from the whole log file.
+
+        Note, that the file is only opened if it has grown, so that polling
+        many logs is cheap.
+
+        :rtype: :class: `Bool`, True if the data of the item changed
+        """
+        if not self.is_running:
+            return False
+
+        try:
+            if stat(self.path).st_size <= self._parsed_size:
+                return False
+            with open(self.path, 'rb') as log_file:
+                log_file.seek(self._parsed_size)
+                appended_bytes = log_file.read()
+        except OSError:
+            return False
+
+        appended_size = appended_bytes.rfind(b'\n') + 1
+        if appended_size == 0:
+            return False
+        self._parsed_size += appended_size
+        log_buffer = appended_bytes[:appended_size]
+
+        frame_count = len(self.temporal_data.get('Frames', ()))
+        self.temporal_data = concatenate_columns(self.temporal_data,
+                                                 self._parse_temporal_buffer(log_buffer, frame_count))
+
+        if re.search(rb'Total\ Time', log_buffer, re.M + re.X):
+            self.is_running = False
+            load_context = FileLoadContext(self.path)
+            try:
+                self.summary_data = self._parse_summary_data(load_context)
+            finally:
+                load_context.close()
+        return True
+
+    @abstractmethod
+    def _parse_temporal_buffer(self, log_buffer, first_index=0, offset=0):
+        """
+        Method which parses the temporal data from the POC lines in the bytes-like *log_buffer*, starting at byte
+        *offset*, and numbers the frames starting at *first_index*. Needed to update the logs of running encoders,
+        see can_parse_running_file, and to parse the temporal data lazily
+        :return:
+        """
+        pass
+
+    # Lines of the POC block, ie. of the temporal data
+    _poc_line_pattern = re.compile(rb'^POC[^\n]*', re.M)
+
+    @classmethod
+    def _match_poc_lines(cls, log_buffer, offset=0):
+        """Generator, which yields the groups of the lines of the bytes-like
+        *log_buffer*, which start with 'POC' and match *_poc_pattern*. The
+        groups are not decoded, as they are converted to numbers directly.
+
+        :rtype: generator of :class: `tuple`s of :class: `bytes`
+        """
+        for line_match in cls._poc_line_pattern.finditer(log_buffer, offset):
+            match = cls._poc_pattern.match(line_match.group())
+            if match:
+                yield match.groups()
+
     # Non-abstract Helper Functions
     @classmethod
-    def _enc_log_file_matches_re_pattern(cls, path, pattern):
+    def _enc_log_file_matches_re_pattern(cls, path, pattern, load_context=None):
         """"""
-        if path.endswith("enc.log"):
-            return cls._is_file_text_matching_re_pattern(path, pattern)
+        if strip_compression_suffix(path).endswith("enc.log"):
+            return cls._is_file_text_matching_re_pattern(path, pattern, load_context)
         return False
 
-    @abstractmethod
-    def _parse_summary_data(self):
+    @classmethod
+    def _is_log_finished(cls, path, load_context=None):
+        """Check, if the encoder has finished writing the log file at *path*"""
+        return cls._is_file_text_matching_re_pattern(path, 'Total\ Time', load_context)
+
+    @classmethod
+    def _get_scan(cls, load_context):
+        """Return the result of :func: `_scan_log` for the text of
+        *load_context*. The result is stored at the load context, so that the
+        lines are scanned only once for all parse methods.
         """
-        Method which parses the summary data of a simulation. I.e. summaries for All, Intra, P and B Slices
-        :return:
+        if cls not in load_context.parse_results:
+            load_context.parse_results[cls] = cls._scan_log(load_context.buffer)
+        return load_context.parse_results[cls]
+
+    @classmethod
+    @abstractmethod
+    def _scan_log(cls, log_buffer):
+        """Scan the lines of the bytes-like *log_buffer* in a single pass, and
+        collect the decoded parts of the log which are needed by the parse
+        methods. POC lines are skipped, as temporal data is parsed lazily.
+        Abstract, needs to be implemented by encoder log parsers.
+
+        :rtype: :class: `dict`
         """
         pass
 
-    def _parse_temporal_data(self):
+    @abstractmethod
+    def _parse_summary_data(self, load_context):
         """
-        Method which parses the temporal data of a simulation. I.e. rate over poc, quality over poc ...
+        Method which parses the summary data of a simulation. I.e. summaries for All, Intra, P and B Slices
         :return:
         """
         pass
 
 
-class EncLogHM(AbstractEncLog):
-    # Order value, used to determine order in which parser are tried.
-    parse_order = 10
+class AbstractDeclarativeEncLog(AbstractEncLog):
+    """Encoder log, whose format is specified by class attributes instead of
+    parse methods. Sub classes for the logs of an encoder, eg. *EncLogVTM*,
+    only declare
+
+    * the banner of the log in *header_pattern*, which is the signature of
+      the class,
+    * the line with the version of the encoder in the config header, see
+      *version_pattern*,
+    * the end of the config header and the keys, which are not parameters,
+      see *_config_header_end_pattern* and *_excluded_config_pattern*,
+    * the layout of the POC lines, see *poc_line_pattern*, and
+    * the layout of the summary blocks, see *summary_type_pattern*.
+
+    The patterns of the specification are bytes regexes in verbose syntax,
+    which are compiled once, when the sub class is created, ie. when the
+    factory loads the module. The compiled specification is a scanner, which
+    only reads the config header before the first POC line and the summary
+    blocks after the last POC line, see :func: `_scan_log`. The POC lines are
+    parsed lazily by the POC line pattern, whose names are known in advance.
+    Thus, the logs of all encoders which are specified like this are parsed
+    at the same cost.
+    """
+
+    # Regex of the line with the version of the encoder in the config header,
+    # and the names of its groups in the summary by position of the group.
+    # The groups are converted by *version_type*, and are 0, if the version
+    # is not found.
+    version_pattern = None
+    version_names = {}
+    version_type = int
+
+    # Regex of the POC lines, and the names of its groups by position of the
+    # group. The groups are the temporal variables.
+    poc_line_pattern = None
+    temporal_names = None
+
+    # Summary blocks consist of a line with the type, whose beginning is
+    # matched by *summary_type_pattern*, a line with the names, eg.
+    # 'Total Frames |   Bitrate     Y-PSNR ...', and a line with the values,
+    # eg. '301    a   10988.6145   40.8662 ...'. The first name ends at '|',
+    # and the letter below the '|' is skipped. Blocks with values, which do not
+    # match *summary_value_pattern*, are skipped.
+    summary_type_pattern = rb'(\w*)'
+    summary_value_pattern = rb'\S+'
+    # The summary variables are referenced to the value of *summary_rate_name*.
+    # Names in *summary_excluded_names* are no summary variables.
+    summary_rate_name = 'Bitrate'
+    summary_excluded_names = ()
+    total_time_pattern = rb'\s* Total \s+ Time . \s+ (\d+.\d+)'
+
+    # Axis labels of the variables by their name, see :func: `_get_label`.
+    # Variables without an entry get the default label of their kind. The
+    # version variables are labelled by *version_label*.
+    summary_labels = {'Bitrate': ('kbps', 'bits'), 'Frames': ('kbps', 'Frames'),
+                      'Total Frames': ('kbps', 'Frames'), 'Total Time': ('kbps', 'sec')}
+    summary_default_label = ('kbps', 'dB')
+    temporal_labels = {'Bits': ('Frame', 'bits'), 'Frames': ('Frame', 'POC'), 'ET': ('Frame', 'sec')}
+    temporal_default_label = ('Frame', 'dB')
+    version_label = ('', 'sec')
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+
+        # compile the specification once for each class
+        for (name, compiled_name) in [('version_pattern', '_version_pattern'), ('poc_line_pattern', '_poc_pattern'),
+                                      ('summary_type_pattern', '_summary_type_pattern'),
+                                      ('summary_value_pattern', '_summary_value_pattern'),
+                                      ('total_time_pattern', '_total_time_pattern')]:
+            pattern = getattr(cls, name)
+            setattr(cls, compiled_name, re.compile(pattern, re.M + re.X) if pattern is not None else None)
+
+        if cls.temporal_names is not None:
+            if cls._poc_pattern is None or max(cls.temporal_names) >= cls._poc_pattern.groups:
+                raise SimulationDataItemError(
+                    "The temporal names of '{}' do not match its POC line pattern".format(cls.__name__)
+                )
+            cls._temporal_names = cls.temporal_names
 
     @classmethod
-    def can_parse_file(cls, path):
-        matches_class = cls._enc_log_file_matches_re_pattern(path, r'^HM \s software')
-        is_finished = cls._enc_log_file_matches_re_pattern(path, 'Total\ Time')
+    def _get_label(cls, keys):
+        """Return the axis labels of the variable at the path *keys* from the
+        labels of the specification.
+
+        :param keys: Variable/Path for which to get the labels
+        :return: tuple of labels: (x-axis label, y-axis label)
+        """
+        name = keys[-1]
+        if keys[1] == 'Temporal':
+            return cls.temporal_labels.get(name, cls.temporal_default_label)
+        if name in cls.version_names.values():
+            return cls.version_label
+        return cls.summary_labels.get(name, cls.summary_default_label)
+
+    @classmethod
+    def can_parse_file(cls, path, load_context=None):
+        if cls.header_pattern is None:
+            return False
+        load_context = cls._get_load_context(path, load_context)
+        matches_class = cls._enc_log_file_matches_re_pattern(path, cls.header_pattern, load_context)
+        is_finished = cls._enc_log_file_matches_re_pattern(path, 'Total\ Time', load_context)
         if is_finished is False and matches_class is True:
             # In case an enc.log file has not a Total Time mark it is very likely that the file is erroneous.
             # TODO: Inform user with a dialog window
             print("Warning: The file" + path + " might be erroneous.")
         return matches_class and is_finished
 
-    def _parse_summary_data(self):
-        with open(self.path, 'r') as log_file:
-            log_text = log_file.read()  # reads the whole text file
-
-            hm_match = re.search(r'HM software: Encoder Version \[([a-zA-Z-]+)?([0-9]+)\.([0-9]+)', log_text)
-            hm_major_version = hm_match.group(2)
-            hm_minor_version = hm_match.group(3)
-
-            if hm_major_version == '14':  # HM 14 does not write out average YUV-PSNR
-                # catch summary line
-                summaries = re.findall(r""" ^(\w*)-*.*$
-                                   \s* # catch newline and space
-                                   (.*)\| # catch phrase Total Frames / I / P / B
-                                   (\s+\S+)(\s+\S+)(\s+\S+)(\s+\S+)# catch rest of the line
-                                   \s* # catch newline and space
-                                   (\d+\s+)\w # catch frame number (integer)
-                                   (\s+\d+\.\d+)(\s+\d+\.\d+)(\s+\d+\.\d+)(\s+\d+\.\d+) # other numbers (rate, PSNRs)
-                              """, log_text, re.M + re.X)
-                total_time = re.findall(r""" ^\s*Total\s+Time.\s+(\d+.\d+)
-                               """, log_text, re.M + re.X)
-            else:
-                # catch summary line
-                summaries = re.findall(r""" ^(\w*)-*.*$
-                               \s* # catch newline and space
-                               (.*)\| # catch phrase Total Frames / I / P / B
-                               (\s+\S+)(\s+\S+)(\s+\S+)(\s+\S+)(\s+\S+)# catch rest of the line
-                               \s* # catch newline and space
-                               (\d+\s+)\w # catch frame number (integer)
-                               (\s+\d+\.\d+)(\s+\d+\.\d+)(\s+\d+\.\d+)(\s+\d+\.\d+)(\s+\d+\.\d+)# others (rate, PSNRs)
-                          """, log_text, re.M + re.X)
-                total_time = re.findall(r""" ^\s*Total\s+Time.\s+(\d+.\d+)
-                               """, log_text, re.M + re.X)
-        data = {}
-        for summary in summaries:
-            summary_type = summary[0]
-            # Create upon first access
-            if summary_type not in data:
-                data[summary_type] = {}
-
-            # remove first element, we need an even number of elements. then split into two list, values and names
-            # and pack them together
-            summary = summary[1:]
-            names = summary[:len(summary) // 2]
-            vals = summary[len(summary) // 2:]
-
-            names = [name.strip() for name in names]  # remove leading and trailing space
-            vals = [float(val) for val in vals]  # convert to numbers
+    @classmethod
+    def can_parse_running_file(cls, path, load_context=None):
+        if cls.header_pattern is None:
+            return False
+        load_context = cls._get_load_context(path, load_context)
+        matches_class = cls._enc_log_file_matches_re_pattern(path, cls.header_pattern, load_context)
+        return matches_class and not cls._is_log_finished(path, load_context)
 
-            name_val_dict = dict(zip(names, vals))  # pack both together in a dict
-            # print(summary_type)
+    @classmethod
+    def _scan_log(cls, log_buffer):
+        """Scan the bytes-like *log_buffer* according to the specification and
+        collect
+
+        * 'version': the groups of the version,
+        * 'summaries': the type, the names and the values of the summary
+          blocks, and
+        * 'total_time': the total time.
+
+        Only the config header before the first POC line is searched for the
+        version, and only the lines after the last POC line are scanned for
+        summary blocks, thus, the POC lines are skipped at once. The scanner
+        is a state machine, which waits for the values line after a names
+        line. Empty lines are skipped like newlines. Only the collected parts
+        are decoded.
+
+        :rtype: :class: `dict`
+        """
+        scan = {'version': None, 'summaries': [], 'total_time': []}
+
+        first_poc = 0 if log_buffer[:3] == b'POC' else log_buffer.find(b'\nPOC') + 1 or len(log_buffer)
+        if cls._version_pattern is not None:
+            match = cls._version_pattern.search(log_buffer, 0, first_poc)
+            if match:
+                scan['version'] = _decode(match.groups())
+
+        if first_poc < len(log_buffer):
+            # the summary blocks follow the last POC line
+            last_poc = max(log_buffer.rfind(b'\nPOC') + 1, first_poc)
+            trailer_offset = log_buffer.find(b'\n', last_poc) + 1 or len(log_buffer)
+        else:
+            trailer_offset = 0
+        # Last non-empty line, which contains the type of a summary block
+        previous_line = b''
+        # Type and names of a names line, while waiting for the values line
+        summary_names = None
+
+        for line in iter_lines(log_buffer, trailer_offset):
+            if not line.strip():
+                continue
+
+            if summary_names is not None:
+                summary_type, names = summary_names
+                summary_names = None
+                values = line.split()
+                del values[1:2]
+                if len(values) == len(names) and all(map(cls._summary_value_pattern.fullmatch, values)):
+                    scan['summaries'].append((summary_type, names, _decode(values)))
+            elif b'|' in line:
+                match = cls._summary_type_pattern.match(previous_line)
+                if match:
+                    first_name, other_names = line.split(b'|', 1)
+                    summary_names = (match.group(1).decode(), _decode([first_name.strip()] + other_names.split()))
+            elif b'Time' in line:
+                match = cls._total_time_pattern.match(line)
+                if match:
+                    scan['total_time'].append(match.group(1).decode())
+
+            previous_line = line
+
+        return scan
+
+    def _parse_summary_data(self, load_context):
+        scan = self._get_scan(load_context)
 
-            name_rate = 'Bitrate'
+        data = {}
+        bitrate = None
+        for (summary_type, names, values) in scan['summaries']:
+            if self.summary_rate_name not in names:
+                continue
+            values = [float(value) for value in values]  # convert to numbers
+            rate = values[names.index(self.summary_rate_name)]
             if summary_type == 'SUMMARY':
-                bitrate = float(vals[names.index(name_rate)])
-            names.remove(name_rate)
-
-            # now pack everything together
-            for name in names:
-                if name not in data[summary_type]:  # create upon first access
-                    data[summary_type][name] = []
-                # Reference all data to *self.qp*
-                data[summary_type][name].append(
-                    (name_val_dict[name_rate], name_val_dict[name])
-                )
-        # data['Total Time'] = total_time[0]
-        data['SUMMARY']['Total Time'] = [(bitrate, float(total_time[0]))]
-        data['SUMMARY']['HM Major Version'] = [(bitrate, int(hm_major_version))]
-        data['SUMMARY']['HM Minor Version'] = [(bitrate, int(hm_minor_version))]
+                bitrate = rate
+
+            # Create upon first access, and reference all data to the rate
+            summary = data.setdefault(summary_type, {})
+            for (name, value) in zip(names, values):
+                if name not in self.summary_excluded_names:
+                    summary.setdefault(name, []).append((rate, value))
+
+        data['SUMMARY']['Total Time'] = [(bitrate, float(scan['total_time'][0]))]
+        version = scan['version']
+        for (position, name) in self.version_names.items():
+            data['SUMMARY'][name] = [(bitrate, self.version_type(version[position] if version is not None else 0))]
         return data
 
-    def _parse_config(self):
-        with open(self.path, 'r') as log_file:
-            log_text = log_file.read()  # reads the whole text file
-            lines = log_text.split('\n')
-            cleanlist = []
-            # some of the configs should not be interpreted as parameters
-            # those are removed from the cleanlist
-            param_not_considered = ['RealFormat', 'Warning', 'InternalFormat', 'Byteswrittentofile', 'Frameindex',
-                                    'TotalTime', 'HMsoftware']
-            for one_line in lines:
-                if one_line:
-                    if 'Non-environment-variable-controlled' in one_line:
-                        break
-                    if one_line.count(':') == 1:
-                        clean_line = one_line.strip(' \n\t\r')
-                        clean_line = re.sub('\s+', '', clean_line)
-                        if not any(re.search(param, clean_line) for param in param_not_considered):
-                            cleanlist.append(clean_line)
-                    elif one_line.count(':') > 1:
-                        if re.search('\w+ \s+ \w+ \s+ \w+ \s+ :\s+ \( \w+ : \d+ , \s+ \w+ : \d+ \)', one_line, re.X):
-                            clean_line = re.findall('\w+ \s+ \w+ \s+ \w+ \s+ :\s+ \( \w+ : \d+ , \s+ \w+ : \d+ \)',
-                                                    one_line, re.X)
-                        else:
-                            clean_line = re.findall('\w+ : \d+ | \w+ : \s+ \w+ = \d+', one_line, re.X)
-                        for clean_item in clean_line:
-                            if not any(re.search(param, clean_item) for param in param_not_considered):
-                                cleanlist.append(clean_item)
-
-        parsed_config = dict(item.split(':', maxsplit=1) for item in cleanlist)
+    @classmethod
+    def read_config(cls, path, load_context=None):
+        """Parse the config from the config header of the log, see
+        :func: `_get_config_header`, without parsing the rest of the log.
+        """
+        header = cls._get_config_header(cls._get_load_context(path, load_context))
+        return cls._parse_config_lines(line.decode(errors='replace') for line in iter_lines(header))
+
+    def _parse_config(self, load_context):
+        parsed_config = self.read_config(self.path, load_context)
         self.qp = parsed_config['QP']
         return parsed_config
 
-    def _parse_temporal_data(self):
+    def _parse_temporal_buffer(self, log_buffer, first_index=0, offset=0):
         # this function extracts temporal values
-        with open(self.path, 'r') as log_file:
-            log_text = log_file.read()  # reads the whole text file
+        temp_data = self._match_poc_lines(log_buffer, offset)
+
+        # Convert the parsed values to columns. As referencing to frame
+        # produces error, the frames are referenced by their index
+        return columns_from_rows(temp_data, self._temporal_names, first_index)
 
-        temp_data = re.findall(r"""
+
+class EncLogHM(AbstractDeclarativeEncLog):
+    # Order value, used to determine order in which parser are tried.
+    parse_order = 10
+    # Signature, checked on the head of the file before can_parse_file
+    file_name_suffixes = ('enc.log',)
+    header_pattern = r'^HM \s software'
+    # The config of HM 14 logs ends before the POC lines
+    parser_version = 4
+
+    version_pattern = rb'HM \s software: \s Encoder \s Version \s \[ ([a-zA-Z-]+)? ([0-9]+) \. ([0-9]+)'
+    version_names = {1: 'HM Major Version', 2: 'HM Minor Version'}
+    poc_line_pattern = rb"""
             ^POC \s+ (\d+) \s+ .+ \s+ \d+ \s+ . \s+ (.-\D+) ,  #Slice
             \s .+ \) \s+ (\d+) \s+ (.+) \s+ #bits
             \[ (\D+) \s+ (\d+.\d+) \s+ #Y PSNR
             \D+ \s+ (\D+) \s+ (\d+.\d+) \s+ # U PSNR
             \D+ \s+ (\D+) \s+ (\d+.\d+) \s+ \D+ . # V PSNR
             \s+ \[ (\D+) \s+ (\d+) \s+# Encoding time
-            """, log_text, re.M + re.X)
-
-        # Association between index of data in temp_data and corresponding
-        # output key. Output shape definition is in one place.
-        names = {0: 'Frames', 2: 'Bits', 5: 'Y-PSNR', 7: 'U-PSNR',
-                 9: 'V-PSNR', 11: 'ET'}
+            """
+    # Association between index of data in the groups of the POC lines and
+    # corresponding output key. Output shape definition is in one place.
+    temporal_names = {0: 'Frames', 2: 'Bits', 5: 'Y-PSNR', 7: 'U-PSNR', 9: 'V-PSNR', 11: 'ET'}
+    # Blocks without frames, eg. of P slices in random access, have '-nan' values
+    summary_value_pattern = rb'\d+ (?: \. \d+)?'
+    summary_excluded_names = ('Bitrate',)
 
-        # Define output data dict and fill it with parsed values
-        data = {name: [] for (index, name) in names.items()}
-        for i in range(0, len(temp_data)):
-            # As referencing to frame produces error, reference to index *i*
-            for (index, name) in names.items():
-                data[name].append(
-                    (i, temp_data[i][index])
-                )
-        return data
 
-
-class EncLogHM360Lib(AbstractEncLog):
+class EncLogVTM(AbstractDeclarativeEncLog):
+    # Order value, used to determine order in which parser are tried.
+    parse_order = 10
+    # Signature, checked on the head of the file before can_parse_file
+    file_name_suffixes = ('enc.log',)
+    header_pattern = r'^VVCSoftware: \s VTM \s Encoder'
+
+    version_pattern = rb'VTM \s Encoder \s Version \s ([0-9]+) \. ([0-9]+)'
+    version_names = {0: 'VTM Major Version', 1: 'VTM Minor Version'}
+    # Later versions of VTM write out the layer and the NAL unit type, and
+    # optionally the MSE of the components
+    poc_line_pattern = rb"""
+            ^POC \s+ (\d+) \s+ (?: LId: \s* \d+ \s+ )? TId: \s* \d+ \s+ \( [^)]* \) \s+ (\d+) \s+ bits \s+
+            \[ Y \s+ (\S+) \s+ dB \s+ U \s+ (\S+) \s+ dB \s+ V \s+ (\S+) \s+ dB \s* \]
+            (?: \s+ \[ Y-MSE [^]]* \] )?
+            \s+ \[ ET \s+ (\d+) \s* \]
+            """
+    temporal_names = {0: 'Frames', 1: 'Bits', 2: 'Y-PSNR', 3: 'U-PSNR', 4: 'V-PSNR', 5: 'ET'}
+    summary_value_pattern = rb'\d+ (?: \. \d+)?'
+    summary_excluded_names = ('Bitrate',)
+
+
+class EncLogHM360Lib(AbstractDeclarativeEncLog):
     # Order value, used to determine order in which parser are tried.
     parse_order = 20
+    # Signature, checked on the head of the file before can_parse_file
+    file_name_suffixes = ('enc.log',)
+    header_pattern = r'360Lib \s software | Y-PSNR_(?:DYN_)?VP0'
+    # Version 4 tokenizes the POC lines by their bracket groups, version 5
+    # parses the 360Lib version from the config header
+    parser_version = 5
+
+    version_pattern = rb'-----360Lib \s software \s version \s \[ (\d+ \. \d+) \]-----'
+    version_names = {0: '360Lib Version'}
+    version_type = float
+    # The names of the temporal variables are the labels of the metrics in
+    # the POC lines, which differ between versions of 360Lib, see
+    # :func: `_parse_temporal_buffer`
+    poc_line_pattern = None
+    # The types of the summary blocks are eg. 'SUMMARY' and 'I Slices'. All
+    # names of a summary block are variables, including the bitrate.
+    summary_type_pattern = rb'( (?:\w\ )? \w+ ) \ ? -{8}'
+
+    def __init__(self, path, load_context=None):
+        load_context = self._get_load_context(path, load_context)
+        super().__init__(path, load_context)
+        if not self.is_running:
+            # The names of the temporal variables are taken from the first
+            # POC line, so that the temporal data can still be parsed lazily
+            self._temporal_names = self._get_poc_line_names(load_context.buffer, self._temporal_offset)
 
     @classmethod
-    def can_parse_file(cls, path):
-        matches_class = cls._enc_log_file_matches_re_pattern(path, r'Y-PSNR_(?:DYN_)?VP0')
-        is_finished = cls._enc_log_file_matches_re_pattern(path, 'Total\ Time')
+    def can_parse_file(cls, path, load_context=None):
+        load_context = cls._get_load_context(path, load_context)
+        matches_class = cls._enc_log_file_matches_re_pattern(path, r'Y-PSNR_(?:DYN_)?VP0', load_context)
+        is_finished = cls._enc_log_file_matches_re_pattern(path, 'Total\ Time', load_context)
         return matches_class and is_finished
 
-    def _parse_config(self):
-        with open(self.path, 'r') as log_file:
-            log_text = log_file.read()  # reads the whole text file
-            lines = log_text.split('\n')
-            cleanlist = []
-            # some of the configs should not be interpreted as parameters
-            # those are removed from the cleanlist
-            param_not_considered = ['RealFormat', 'Warning', 'InternalFormat', 'Byteswrittentofile', 'Frameindex',
-                                    'TotalTime', 'HMsoftware']
-            for one_line in lines:
-                if one_line:
-                    if '-----360 video parameters----' in one_line:
-                        break
-                    if 'Non-environment-variable-controlled' in one_line:
-                        break
-                    if one_line.count(':') == 1:
-                        clean_line = one_line.strip(' \n\t\r')
-                        clean_line = re.sub('\s+', '', clean_line)
-                        if not any(re.search(param, clean_line) for param in param_not_considered):
-                            cleanlist.append(clean_line)
-                    elif one_line.count(':') > 1:
-                        if re.search('\w+ \s+ \w+ \s+ \w+ \s+ :\s+ \( \w+ : \d+ , \s+ \w+ : \d+ \)', one_line, re.X):
-                            clean_line = re.findall('\w+ \s+ \w+ \s+ \w+ \s+ :\s+ \( \w+ : \d+ , \s+ \w+ : \d+ \)',
-                                                    one_line, re.X)
-                        else:
-                            clean_line = re.findall('\w+ : \d+ | \w+ : \s+ \w+ = \d+', one_line, re.X)
-                        for clean_item in clean_line:
-                            if not any(re.search(param, clean_item) for param in param_not_considered):
-                                cleanlist.append(clean_item)
-
-        parsed_config = dict(item.split(':', maxsplit=1) for item in cleanlist)
+    @classmethod
+    def can_parse_running_file(cls, path, load_context=None):
+        # the metrics of the viewports are not written before the first frame is encoded
+        load_context = cls._get_load_context(path, load_context)
+        matches_class = cls._enc_log_file_matches_re_pattern(path, r'360Lib \s software | Y-PSNR_(?:DYN_)?VP0',
+                                                             load_context)
+        return matches_class and not cls._is_log_finished(path, load_context)
+
+    @classmethod
+    def read_config(cls, path, load_context=None):
+        """Parse the config from the config header of the log, see
+        :func: `_get_config_header`, without parsing the rest of the log. The
+        parameters of the encoder end before the 360 video parameters, of
+        which only the rotation is parsed.
+        """
+        header = cls._get_config_header(cls._get_load_context(path, load_context))
+        lines = (line.decode(errors='replace') for line in iter_lines(header))
+        parsed_config = cls._parse_config_lines(takewhile(lambda line: '-----360 video parameters----' not in line,
+                                                          lines))
 
         # parse 360 rotation parameter
-        m = re.search('Rotation in 1/100 degrees:\s+\(yaw:(\d+)\s+pitch:(\d+)\s+roll:(\d+)\)', log_text)
+        m = re.search(rb'Rotation in 1/100 degrees:\s+\(yaw:(\d+)\s+pitch:(\d+)\s+roll:(\d+)\)', header)
         if m:
-            yaw = m.group(1)
-            pitch = m.group(2)
-            roll = m.group(3)
+            yaw, pitch, roll = _decode(m.groups())
             parsed_config['SVideoRotation'] = 'Y%sP%sR%s' % (yaw, pitch, roll)
-
-        self.qp = parsed_config['QP']
         return parsed_config
 
-    def _parse_summary_data(self):
-
-        with open(self.path, 'r') as log_file:
-            log_text = log_file.read()
-            total_time = re.findall(r""" ^\s*Total\s+Time.\s+(\d+.\d+)
-                            """, log_text, re.M + re.X)
-
-        # get 360 Lib version
-        m = re.match(r'-----360Lib\ software\ version\ (\[3.0\])-----', log_text)
-        if m:
-            version = m.group(1)
-        else:
-            version = '0'
-
-        # dictionary for the parsed data
-        data = {}
-
-        # get the summaries as pair of summary type and summary text, splitting at summary type and capturing it
-        summaries_texts_and_types = re.split('((?:\w )?\w+) ?--------------------------------------------------------',
-                                             log_text)
-        del summaries_texts_and_types[0]  # remove the log text up to the first summary item
-        if len(summaries_texts_and_types) % 2:
-            # each summary type should match a text, thus the list must have even length
-            raise Exception('Could not parse 360 enc log file.')
-        for summary_type, summary_text in zip(summaries_texts_and_types[0::2], summaries_texts_and_types[1::2]):
-            summary_text = summary_text.strip().splitlines()  # first line is header, second line are the values
-
-            # parsing header
-            first_header_item, remaining_items = re.split('\|', summary_text[0])  # since first item has a space
-            remaining_items = re.split('\s+', remaining_items.strip())
-            header = [first_header_item] + remaining_items
-
-            # parsing values
-            values = re.split('\s+', summary_text[1].strip())
-            del values[1]  # remove the letter below the | in the header (a, b, p or i)
-
-            if header[1] != 'Bitrate':
-                raise Exception('Could not parse bitrate.')
-            rate = values[1]
-
-            data[summary_type] = {}
-            for name, value in zip(header, values):
-                name = name.strip()
-                summary_item = {name: [(float(rate), float(value))]}
+    @staticmethod
+    def _tokenize_poc_line(line):
+        """Split a POC line into its bracketed groups, eg.
+
+        POC 0 TId: 0 ( I-SLICE, nQP 19 QP 19 ) 11365520 bits [Y 40.9 dB U 46.7 dB V 45.7 dB]
+        [Y-WSPSNR 40.8 dB U-WSPSNR 46.5 dB V-WSPSNR 45.6 dB] ... [ET 18 ] [L0 ] [L1 ]
+
+        and return the labels of the metrics of the groups, eg. b'Y-WSPSNR',
+        and the values of the POC, the bits, the metrics, and the encoding
+        time. A metric group consists of triplets of label, value and unit
+        'dB', other groups than the encoding time, eg. the reference picture
+        lists, are skipped. An encoding time without value, ie. '[ET ]', is
+        NaN. The line is split in linear time, thus, truncated lines or lines
+        with additional groups do not slow down the parser.
+
+        :rtype: :class: `tuple` of the :class: `tuple` of labels and the
+            :class: `list` of values, or None, if the line can not be split
+        """
+        head, *groups = line.split(b'[')
+        head = head.split()
+        if len(head) < 3 or head[-1] != b'bits':
+            return None
+
+        labels = []
+        values = [head[1], head[-2]]
+        for group in groups:
+            tokens = group.split(b']', 1)[0].split()
+            if tokens[:1] == [b'ET']:
+                labels.append(b'ET')
+                values.append(tokens[1] if len(tokens) > 1 else b'nan')
+                continue
+            for position in range(0, len(tokens) - 2, 3):
+                if tokens[position + 2] == b'dB':
+                    labels.append(tokens[position])
+                    values.append(tokens[position + 1])
+        return tuple(labels), values
 
-                data[summary_type].update(summary_item)
+    @staticmethod
+    def _get_names(labels):
+        """Return the names of the temporal variables for the *labels* of a
+        POC line, see :func: `_tokenize_poc_line`. The metrics of the first
+        group, which are labeled 'Y', 'U' and 'V', are the PSNR values.
 
-            if summary_type == 'SUMMARY':
-                data['SUMMARY']['Total Time'] = [(float(rate), float(total_time[0]))]
-                data['SUMMARY']['360Lib Version'] = [(float(rate), float(version))]
+        :rtype: :class: `dict` of positions of the values and names
+        """
+        names = ['Frames', 'Bits']
+        for label in labels:
+            label = label.decode(errors='replace')
+            names.append(label + '-PSNR' if label in ('Y', 'U', 'V') else label)
+        return dict(enumerate(names))
 
-        return data
+    @classmethod
+    def _get_poc_line_names(cls, log_buffer, offset=0):
+        """Return the names of the temporal variables of the first POC line in
+        *log_buffer* after *offset*, or None, if there is no POC line.
+        """
+        for line_match in cls._poc_line_pattern.finditer(log_buffer, offset):
+            tokens = cls._tokenize_poc_line(line_match.group())
+            if tokens is not None:
+                return cls._get_names(tokens[0])
+        return None
 
-    def _parse_temporal_data(self):
+    def _parse_temporal_buffer(self, log_buffer, first_index=0, offset=0):
         # this function extracts temporal values
-        with open(self.path, 'r') as log_file:
-            log_text = log_file.read()  # reads the whole text file
-            temp_data = re.findall(r"""
-                ^POC \s+ (\d+) \s+ .+ \s+ \d+ \s+ . \s+ (.-\D+) ,  # POC, Slice
-                \s .+ \) \s+ (\d+) \s+ \S+ \s+  # bitrate
-                \[ \S \s (\S+) \s \S+ \s+ \S \s (\S+) \s \S+ \s+ \S \s (\S+) \s \S+ ] \s  # y-, u-, v-PSNR
-                \[ \S+ \s (\S+) \s \S+ \s+ \S+ \s (\S+) \s \S+ \s+ \S+ \s (\S+) \s \S+ ] \s  #y-, u-, v-SPSNR_NN
-                \[ \S+ \s (\S+) \s \S+ \s+ \S+ \s (\S+) \s \S+ \s+ \S+ \s (\S+) \s \S+ ] \s  #y-, u-, v-WSPSNR
-                \[ \S+ \s (\S+) \s \S+ \s+ \S+ \s (\S+) \s \S+ \s+ \S+ \s (\S+) \s \S+ ] \s  #y-, u-, v-SPSNR_I
-                \[ \S+ \s (\S+) \s \S+ \s+ \S+ \s (\S+) \s \S+ \s+ \S+ \s (\S+) \s \S+ ] \s  #y-, u-, v-CPPPSNR
-                \[ \S+ \s (\S+) \s \S+ \s+ \S+ \s (\S+) \s \S+ \s+ \S+ \s (\S+) \s \S+ ] \s  #y-, u-, v-E2EWSPSNR
-                \[ \S+ \s (\S+) \s \S+ \s+ \S+ \s (\S+) \s \S+ \s+ \S+ \s (\S+) \s \S+ ] \s  #y-, u-, v-PSNR_VP0
-                \[ \S+ \s (\S+) \s \S+ \s+ \S+ \s (\S+) \s \S+ \s+ \S+ \s (\S+) \s \S+ ] \s  #y-, u-, v-PSNR_VP1
-                \[ \S+ \s \S+ \s \S+ \s+ \S+ \s \S+ \s \S+ \s+ \S+ \s \S+ \s \S+ ] \s  #y-, u-, v-CFSPSNR_NN
-                \[ \S+ \s \S+ \s \S+ \s+ \S+ \s \S+ \s \S+ \s+ \S+ \s \S+ \s \S+ ] \s  #y-, u-, v-CFSPSNR_I
-                \[ \S+ \s \S+ \s \S+ \s+ \S+ \s \S+ \s \S+ \s+ \S+ \s \S+ \s \S+ ] \s  #y-, u-, v-CFCPPPSNR
-                \[ \D+ \s+ (\d+) \s+ #ET
-                """, log_text, re.M + re.X)
+        poc_lines = (self._tokenize_poc_line(line_match.group())
+                     for line_match in self._poc_line_pattern.finditer(log_buffer, offset))
+        poc_lines = (tokens for tokens in poc_lines if tokens is not None)
+        first_tokens = next(poc_lines, None)
+        if first_tokens is None:
+            return {}
 
-        # Association between index of data in temp_data and corresponding
-        # output key. Output shape definition is in one place.
-        names = {0: 'Frames', 2: 'Bits',
-                 3: 'Y-PSNR', 4: 'U-PSNR', 5: 'V-PSNR',
-                 6: 'Y-SPSNR_NN', 7: 'U-SPSNR_NN', 8: 'V-SPSNR_NN',
-                 9: 'Y-WSPSNR', 10: 'U-WSPSNR', 11: 'V-WSPSNR',
-                 12: 'Y-SPSNR_I', 13: 'U-SPSNR_I', 14: 'V-SPSNR_I',
-                 15: 'Y-CPPSNR', 16: 'U-CPPSNR', 17: 'V-CPPSNR',
-                 18: 'Y-E2EWSPSNR', 19: 'U-E2EWSPSNR', 20: 'V-E2EWSPSNR',
-                 21: 'Y-PSNR_VP0', 22: 'U-PSNR_VP0', 23: 'V-PSNR_VP0',
-                 24: 'Y-PSNR_VP1', 25: 'U-PSNR_VP1', 26: 'V-PSNR_VP1', 27: 'ET'
-                 }
-
-        # Define output data dict and fill it with parsed values
-        data = {name: [] for (index, name) in names.items()}
-        for i in range(0, len(temp_data)):
-            # As referencing to frame produces error, reference to index *i*
-            for (index, name) in names.items():
-                data[name].append(
-                    (i, temp_data[i][index])
-                )
-        return data
+        # the metrics of all frames are expected to be the same as of the first
+        # frame, lines with other metrics, eg. truncated lines, are skipped
+        labels = first_tokens[0]
+        temp_data = chain([first_tokens[1]], (values for (line_labels, values) in poc_lines if line_labels == labels))
+
+        # Convert the parsed values to columns. As referencing to frame
+        # produces error, the frames are referenced by their index
+        return columns_from_rows(temp_data, self._get_names(labels), first_index)
 
 
 class EncLogSHM(AbstractEncLog):
     # Order value, used to determine order in which parser are tried.
     parse_order = 21
+    # Signature, checked on the head of the file before can_parse_file
+    file_name_suffixes = ('enc.log',)
+    header_pattern = r'^SHM \s software'
 
     @classmethod
-    def can_parse_file(cls, path):
-        matches_class = cls._enc_log_file_matches_re_pattern(path, r'^SHM \s software')
-        is_finished = cls._enc_log_file_matches_re_pattern(path, 'Total\ Time')
+    def can_parse_file(cls, path, load_context=None):
+        load_context = cls._get_load_context(path, load_context)
+        matches_class = cls._enc_log_file_matches_re_pattern(path, r'^SHM \s software', load_context)
+        is_finished = cls._enc_log_file_matches_re_pattern(path, 'Total\ Time', load_context)
         return matches_class and is_finished
 
-    def _parse_summary_data(self):
-        with open(self.path, 'r') as log_file:
-            log_text = log_file.read()  # reads the whole text file
-            summaries = re.findall(r"""
-                        ^\s+ L (\d+) \s+ (\d+) \s+ \D \s+ # the next is bitrate
-                        (\S+) \s+ (\S+) \s+ (\S+) \s+ (\S+) \s+ (\S+)
-                        """, log_text, re.M + re.X)
-            total_time = re.findall(r""" ^\s*Total\s+Time.\s+(\d+.\d+)
-                                        """, log_text, re.M + re.X)
+    # Patterns of the line scanner, each is matched against single lines
+    _summary_pattern = re.compile(rb"""
+                    \s+ L (\d+) \s+ (\d+) \s+ \D \s+ # the next is bitrate
+                    (\S+) \s+ (\S+) \s+ (\S+) \s+ (\S+) \s+ (\S+)
+                    """, re.X)
+    _poc_pattern = re.compile(rb"""
+                            POC \s+ (\d+) .+? : \s+ (\d+) .+ (\D-\D+) \s \D+,  #Slice
+                            .+ \) \s+ (\d+) \s+ (.+) \s+ \[ (\D+) \s+ (\d+.\d+) \s+ #Y PSNR
+                            \D+ \s+ (\D+) \s+ (\d+.\d+) \s+ # U PSNR
+                            \D+ \s+ (\D+) \s+ (\d+.\d+) \s+ \D+ . # v PSNR
+                            \s+ \[ (\D+) \s+ (\d+) \s+# Encoding time
+                            """, re.X)
+    _total_time_pattern = re.compile(rb""" \s*Total\s+Time.\s+(\d+.\d+)
+                                    """, re.X)
+
+    @classmethod
+    def _scan_log(cls, log_buffer):
+        """Scan the lines of the bytes-like *log_buffer* in a single pass and
+        collect
+
+        * 'config': the lines before the common configuration settings,
+        * 'summaries': the groups of the summary lines of the layers, and
+        * 'total_time': the total time.
+
+        Only the collected parts are decoded.
+
+        :rtype: :class: `dict`
+        """
+        scan = {'config': [], 'summaries': [], 'total_time': []}
+        is_config_header = True
+
+        for line in iter_lines(log_buffer):
+            if is_config_header:
+                if b'=== Common configuration settings === ' in line:
+                    is_config_header = False
+                else:
+                    scan['config'].append(line.decode(errors='replace'))
+
+            if line.startswith(b'POC'):
+                # temporal data, see _parse_temporal_buffer
+                continue
+
+            match = cls._summary_pattern.match(line) if b'L' in line else None
+            if match:
+                scan['summaries'].append(_decode(match.groups()))
+            elif b'Time' in line:
+                match = cls._total_time_pattern.match(line)
+                if match:
+                    scan['total_time'].append(match.group(1).decode())
+
+        return scan
+
+    def _parse_summary_data(self, load_context):
+        scan = self._get_scan(load_context)
+        summaries = scan['summaries']
+        total_time = scan['total_time']
         data = {}
         layer_quantity = int(len(summaries) / 4)
         header_names = ['SUMMARY', 'I', 'P', 'B']
@@ -557,61 +949,48 @@ class EncLogSHM(AbstractEncLog):
             (float(data['SUMMARY']['layer 1 + 2']['Bitrate'][0][0]), float(total_time[0]))]
         return data
 
-    def _parse_temporal_data(self):
+    def _parse_temporal_buffer(self, log_buffer, first_index=0, offset=0):
         # this function extracts temporal values
-        with open(self.path, 'r') as log_file:
-            log_text = log_file.read()  # reads the whole text file
-            temp_data = re.findall(r"""
-                                ^POC \s+ (\d+) .+? : \s+ (\d+) .+ (\D-\D+) \s \D+,  #Slice
-                                .+ \) \s+ (\d+) \s+ (.+) \s+ \[ (\D+) \s+ (\d+.\d+) \s+ #Y PSNR
-                                \D+ \s+ (\D+) \s+ (\d+.\d+) \s+ # U PSNR
-                                \D+ \s+ (\D+) \s+ (\d+.\d+) \s+ \D+ . # v PSNR
-                                \s+ \[ (\D+) \s+ (\d+) \s+# Encoding time
-                                """, log_text, re.M + re.X)
+        temp_data = list(self._match_poc_lines(log_buffer, offset))
 
         # Association between index of data in temp_data and corresponding
         # output key. Output shape definition is in one place.
         names = {0: 'Frames', 3: 'Bits', 6: 'Y-PSNR', 8: 'U-PSNR',
                  10: 'V-PSNR', 12: 'ET'}
 
-        layer_quantity = int(max(temp_data[i][1] for i in range(0, len(temp_data)))) + 1
-        layer_quantity = int(layer_quantity)
+        if not temp_data:
+            return {}
+        # The layer ids are compared as numbers, not as bytes (b'10' < b'9')
+        layer_quantity = max(int(values[1]) for values in temp_data) + 1
         data = {}
+        frame_count = int(len(temp_data) / layer_quantity)
         for layer in range(0, layer_quantity):  # iterate through layers
-            data2 = {name: [] for (index, name) in names.items()}
-            for j in range(0, int(len(temp_data) / layer_quantity)):  # iterate through frames (POCS)
-                for (index, name) in names.items():
-                    data2[name].append(
-                        (j, temp_data[layer_quantity * j + layer][index])
-                    )
+            # the POC lines of the layers are interleaved
+            layer_data = temp_data[layer:layer_quantity * frame_count:layer_quantity]
             layerstring = 'layer ' + str(layer)
-            data[layerstring] = data2
+            data[layerstring] = columns_from_rows(layer_data, names, first_index)
         return data
 
-    def _parse_config(self):
-        with open(self.path, 'r') as log_file:
-            log_text = log_file.read()                 # reads the whole text file
-            lines = log_text.split('\n')
-            clean_list = []
-            for one_line in lines:
-                if '=== Common configuration settings === ' in one_line:
-                    break
-                if re.match('QP\s+',one_line):
-                    clean_line = one_line.strip(' \n\t\r')
-                    clean_line = re.sub('\s+', '', clean_line)
-                    clean_list.append(clean_line)
-            clean_list = [item.split(':', maxsplit=1) for item in clean_list]
-            parsed_config = {}
-            for key, val in clean_list:
-                # Later the differences between the configurations are calculated.
-                # The calculation can not handle lists. Therefore the list elements are joined.
-                # The first element describes the QP value connected to the first layer
-                # and the second QP value connected to the second layer
-                # TODO: connect QP values better to layers
-                if key in parsed_config:
-                    parsed_config.setdefault(key, []).append(val)
-                    parsed_config[key] = '+'.join(parsed_config[key])
-                else:
-                    parsed_config.setdefault(key, []).append(val)
-            self.qp = parsed_config['QP']
+    def _parse_config(self, load_context):
+        lines = self._get_scan(load_context)['config']
+        clean_list = []
+        for one_line in lines:
+            if re.match('QP\s+',one_line):
+                clean_line = one_line.strip(' \n\t\r')
+                clean_line = re.sub('\s+', '', clean_line)
+                clean_list.append(clean_line)
+        clean_list = [item.split(':', maxsplit=1) for item in clean_list]
+        parsed_config = {}
+        for key, val in clean_list:
+            # Later the differences between the configurations are calculated.
+            # The calculation can not handle lists. Therefore the list elements are joined.
+            # The first element describes the QP value connected to the first layer
+            # and the second QP value connected to the second layer
+            # TODO: connect QP values better to layers
+            if key in parsed_config:
+                parsed_config.setdefault(key, []).append(val)
+                parsed_config[key] = '+'.join(parsed_config[key])
+            else:
+                parsed_config.setdefault(key, []).append(val)
+        self.qp = parsed_config['QP']
         return parsed_config
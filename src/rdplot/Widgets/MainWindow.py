@@ -5,11 +5,11 @@ import csv
 import pkg_resources
 import jsonpickle
 from PyQt5 import QtWidgets, QtGui
-from PyQt5.QtCore import QItemSelectionModel
+from PyQt5.QtCore import QTimer
 from PyQt5.uic import loadUiType
 
 
-from rdplot.SimulationDataItem import dict_tree_from_sim_data_items
+from rdplot.SimulationDataItem import sorted_columns
 from rdplot.Widgets.PlotWidget import PlotWidget
 from rdplot.model import SimDataItemTreeModel, OrderedDictModel, VariableTreeModel, BdTableModel
 from rdplot.view import QRecursiveSelectionModel
@@ -73,6 +73,9 @@ class MainWindow(QMainWindow, Ui_MainWindow):
         self.actionOpen_Directory_List.triggered.connect(
             self.simDataItemTreeView.add_folder_list
         )
+        self.actionWatch_Running_Simulations.toggled.connect(
+            self.set_watch_running_simulations
+        )
         self.actionHide_PlotSettings.triggered.connect(
             self.set_plot_settings_visibility
         )
@@ -103,6 +106,11 @@ class MainWindow(QMainWindow, Ui_MainWindow):
             self.open_about_page
         )
 
+        # Poll the log files of running simulations for new data
+        self._running_simulations_timer = QTimer(self)
+        self._running_simulations_timer.setInterval(5000)
+        self._running_simulations_timer.timeout.connect(self.update_running_simulations)
+
         self.variableTreeModel = VariableTreeModel()
         self.variableTreeView.setModel(self.variableTreeModel)
         self.plotsettings.visibilityChanged.connect(self.plot_settings_visibility_changed)
@@ -175,6 +183,22 @@ class MainWindow(QMainWindow, Ui_MainWindow):
         else:
             self.actionHide_Status.setChecked(False)
 
+    def set_watch_running_simulations(self, enabled):
+        """Parse logs of running simulations, and update them periodically,
+        if *enabled*."""
+        self.simDataItemTreeView.parserThread.parse_running = enabled
+        if enabled:
+            self._running_simulations_timer.start()
+        else:
+            self._running_simulations_timer.stop()
+
+    def update_running_simulations(self):
+        updated_sim_data_items = self.simDataItemTreeModel.update_running_items()
+        # Update the variable tree and replot, if data of selected items changed
+        if any(sim_data_item.path in self.selectedSimulationDataItemListModel
+               for sim_data_item in updated_sim_data_items):
+            self.update_variable_tree(updated_sim_data_items)
+
     def remove(self):
         values = self.selectedSimulationDataItemListModel.values()
         # List call necessary to avoid runtime error because of elements changing
@@ -227,49 +251,35 @@ class MainWindow(QMainWindow, Ui_MainWindow):
 
         return plot_data_collection
 
-    def update_variable_tree(self):
-        """Collect all SimDataItems currently selected, and create variable
-        tree and corresponding data from it. Additionaly reselect all previously
-        selected variables.
+    def update_variable_tree(self, updated_sim_data_items=()):
+        """Update the variable tree and corresponding data from all SimDataItems
+        currently selected. Only the data of added and removed SimDataItems,
+        and of *updated_sim_data_items* is updated, thus, the selection of
+        all other variables is kept. If data of selected variables changed,
+        the plot is updated.
+
+        :param updated_sim_data_items: Iterable of :class: `SimDataItem`s,
+            whose data has changed
         """
 
-        # Create a list of all currently selected paths
-        # Note, that *q_index* can not be used directly, because it might
-        # change if the variable tree is recreated
-        selected_path_collection = []
-        for q_index in self.variableTreeView.selectedIndexes():
-            selected_path_collection.append(
-                # Create list of identifiers from path
-                # Note, that the root node is excluded from the path
-                [item.identifier for item in q_index.internalPointer().path[1:]]
-            )
-
-        # Join the data of all currently selected items to a dictionary
-        # tree
-        sim_data_items = self.get_selected_simulation_data_items()
-        dict_tree = dict_tree_from_sim_data_items(sim_data_items)
         # check if qp values are the same
         # self.check_qp(sim_data_items)
 
-        # Reset variable tree and update it with *dict_tree*
-        self.variableTreeModel.clear_and_update_from_dict_tree(dict_tree)
+        # Update the variable tree by the data of added and removed SimDataItems
+        sim_data_items = self.get_selected_simulation_data_items()
+        changed_items = self.variableTreeModel.update_from_sim_data_items(
+            sim_data_items,
+            updated_sim_data_items,
+        )
 
         # Auto expand variable tree
         self.variableTreeView.expandToDepth(1)
 
-        # Reselect all variables, which also exist on the new tree
-        for path in selected_path_collection:
-            # Try to reselect, and do nothing, if path does not exist anymore
-            try:
-                # Reselect new item corresponding to the previously selected
-                # path
-                item = self.variableTreeModel.get_item_from_path(*path)
-                self.variableTreeView.selectionModel().select(
-                    self.variableTreeModel._get_index_from_item(item),
-                    QItemSelectionModel.Select,
-                )
-            except KeyError:
-                pass
+        # Replot, if data of a selected variable changed. Note, that removing
+        # selected variables already updates the plot by changing the selection.
+        selected_items = set(q_index.internalPointer() for q_index in self.variableTreeView.selectedIndexes())
+        if any(item in selected_items for item in changed_items):
+            self.update_plot()
 
     # TODO: it might be that some log files do not have a QP value, therefore the check_qp method must be
     #       implemented in a way that these files are not affected
@@ -394,10 +404,7 @@ class MainWindow(QMainWindow, Ui_MainWindow):
         header = legend[0]
 
         for plot_data in plot_data_collection:
-            values = ((float(x), float(y)) for (x, y) in plot_data.values)
-
-            sorted_value_pairs = sorted(values, key=lambda pair: pair[0])
-            [xs, ys] = list(zip(*sorted_value_pairs))
+            xs, ys = (column.tolist() for column in sorted_columns(plot_data.values))
 
             # make header
             if plot_data.identifiers[0] not in data_names:
@@ -451,10 +458,7 @@ class MainWindow(QMainWindow, Ui_MainWindow):
 
         for plot_data in plot_data_collection:
 
-            values = ((float(x), float(y)) for (x, y) in plot_data.values)
-
-            sorted_value_pairs = sorted(values, key=lambda pair: pair[0])
-            [xs, ys] = list(zip(*sorted_value_pairs))
+            xs, ys = (column.tolist() for column in sorted_columns(plot_data.values))
 
             # make header, important if more than one plot
             if plot_data.identifiers[0] not in data_names:
@@ -559,8 +563,12 @@ class MainWindow(QMainWindow, Ui_MainWindow):
         filename = QtWidgets.QFileDialog.getSaveFileName(self, 'Save RD data as', '.', '*.rd')
         filename = filename[0] + filename[1][1:]
         if not len(filename) == 0:
+            sim_data_items = self.get_selected_simulation_data_items()
+            # the stored items have to be complete, as their files might not be available on loading
+            for sim_data_item in sim_data_items:
+                sim_data_item.load_lazy_data()
             f = open(filename, 'w')
-            f.write(jsonpickle.encode(self.get_selected_simulation_data_items()))
+            f.write(jsonpickle.encode(sim_data_items))
             f.close()
 
     def process_cmd_line_args(self, args):
@@ -576,7 +584,7 @@ class MainWindow(QMainWindow, Ui_MainWindow):
                 f.close()
                 continue
 
-            self.simDataItemTreeView.msg.show()
+            self.simDataItemTreeView.show_parse_message()
             self.simDataItemTreeView.parserThread.add_path(path)
             self.simDataItemTreeView.parserThread.start()
 
@@ -43,6 +43,8 @@ from matplotlib.pyplot import show
 
 import pkg_resources
 
+from rdplot.SimulationDataItem import sorted_columns
+
 Ui_name = pkg_resources.resource_filename('rdplot', 'ui' + sep + 'plotWidget.ui')
 Ui_PlotWidget, QWidget = loadUiType(Ui_name)
 
@@ -150,10 +152,8 @@ class PlotWidget(QWidget, Ui_PlotWidget):
             # Create legend from variable path and sim data items identifiers
             l = legend[plot_count] #" ".join([i for i in plot_data.identifiers] + plot_data.path)
 
-            # Convert list of pairs of strings to two sorted lists of floats
-            values = ((float(x), float(y)) for (x, y) in plot_data.values)
-            sorted_value_pairs = sorted(values, key=lambda pair: pair[0])
-            [xs, ys] = list(zip(*sorted_value_pairs))
+            # Get the values as two float arrays sorted by x
+            xs, ys = sorted_columns(plot_data.values)
 
             # plot the current plotdata and set the legend
             curve = self.ax.plot(xs, ys, label=l)
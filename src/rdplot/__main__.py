@@ -25,10 +25,14 @@ from PyQt5.QtCore import QSize
 
 from rdplot.Widgets import MainWindow
 
+import multiprocessing
 import pkg_resources
 import sys
 
 def main():
+    # Files are parsed by spawned worker processes, which start through the
+    # entry point again in frozen builds
+    multiprocessing.freeze_support()
 
     app = QtWidgets.QApplication(sys.argv)
 
@@ -17,7 +17,8 @@
 #    along with this program. If not, see <http://www.gnu.org/licenses/>.
 #
 ##################################################################################################
-from collections import deque
+from collections import Counter, deque
+from functools import cmp_to_key
 from os.path import sep
 from os import environ
 import numpy as np
@@ -28,6 +29,8 @@ from PyQt5.Qt import Qt, QVariant, QModelIndex, QDialog, QHBoxLayout, QVBoxLayou
 from PyQt5.QtCore import QAbstractListModel, QAbstractItemModel, QAbstractTableModel, pyqtSignal
 
 import matplotlib.pyplot as plt
+from rdplot.SimulationDataItem import (dict_tree_from_sim_data_items, get_file_key, get_file_path, join_values,
+                                      PlotData)
 from rdplot.SimulationDataItemClasses.EncoderLogs import AbstractEncLog
 from rdplot.lib.BD import bjontegaard
 from string import Template
@@ -75,6 +78,11 @@ class OrderedDictModel(QAbstractListModel):
     `clear_and_update_from_tuples` or :func: `remove_keys` it is especially
     efficient, as it allows updating the model with a collection of
     keys/items, but emitting the *items_changed* signal only once.
+
+    The items are stored in a :class: `dict` by their keys, and the keys
+    additionally in a sorted :class: `list`, in which insertion positions
+    are found by bisection. Thus, looking up items and rows is done in
+    constant time.
     """
 
     items_changed = pyqtSignal()
@@ -89,7 +97,7 @@ class OrderedDictModel(QAbstractListModel):
         self._compare_keys_function = compare_keys_function
 
         self._keys = []
-        self._items = []
+        self._items = {}
 
     # Qt interface methods
 
@@ -97,10 +105,8 @@ class OrderedDictModel(QAbstractListModel):
         return len(self)
 
     def data(self, q_index, role):
-        if q_index.isValid() and role == Qt.DisplayRole:
-            for index, (key, item) in enumerate(self.items()):
-                if index == q_index.row():
-                    return QVariant(key)
+        if q_index.isValid() and role == Qt.DisplayRole and q_index.row() < len(self):
+            return QVariant(self._keys[q_index.row()])
         return QVariant()
 
     # Reimplemented dictionary methods.
@@ -108,10 +114,10 @@ class OrderedDictModel(QAbstractListModel):
     # custom methods, so that *items_changed* is emitted correctly.
 
     def __getitem__(self, key):
-        return self._items[self._keys.index(key)]
+        return self._items[key]
 
     def __setitem__(self, key, item):
-        self.update((key, item))
+        self.update_from_tuples([(key, item)])
 
     def pop(self, key):
         item = self[key]
@@ -122,7 +128,7 @@ class OrderedDictModel(QAbstractListModel):
         return iter(self._keys)
 
     def __contains__(self, key):
-        return key in self._keys
+        return key in self._items
 
     def __len__(self):
         return len(self._keys)
@@ -134,41 +140,71 @@ class OrderedDictModel(QAbstractListModel):
         return str(self)
 
     def values(self):
-        return list(self._items)
+        return [self._items[key] for key in self._keys]
 
     def items(self):
-        return list(zip(self._keys, self._items))
+        return [(key, self._items[key]) for key in self._keys]
 
     # Implement specific methods
     # Note, that these methods allow update of whole ranges of data and emit
     # the *items_changed* signal afterwards. This allows more efficient update
     # behavior.
 
+    def _get_insertion_index(self, key):
+        """Find the position of the first key, which is bigger than *key*,
+        by bisection of the sorted keys.
+
+        :rtype: :class: `int`
+        """
+
+        low, high = 0, len(self._keys)
+        while low < high:
+            middle = (low + high) // 2
+            if self._compare_keys_function(self._keys[middle], key):
+                high = middle
+            else:
+                low = middle + 1
+        return low
+
     def update_from_tuples(self, tuples):
         """Add/replace items to the dictionary specified in the iterable :param:
         *tuples* of (key, item) pairs. Emit *items_changed* afterwards.
         """
 
+        # Replace the items of keys, which are already present, and collect
+        # the new ones
+        items_new = {}
         for key, item in tuples:
-            # If the key is already present, just update its item and continue
-            if key in self:
-                self._items[self._keys.index(key)] = item
-                continue
+            if key in self._items:
+                self._items[key] = item
+            else:
+                items_new[key] = item
 
-            # Else search the insertion position by comparision
-            index_insert = len(self)
-            for index, key_other in enumerate(self):
-                # If the key is bigger, then insert key/item here
-                if self._compare_keys_function(key_other, key):
-                    index_insert = index
-                    break
-
-            # Call Qt interface functions and add/replace item corresponding
-            # to key
-            self.beginInsertRows(QModelIndex(), index_insert, index_insert + 1)
-            self._keys.insert(index_insert, key)
-            self._items.insert(index_insert, item)
+        # Sort the new keys, and group them by their insertion position in
+        # the present keys, so that each group is inserted as one range of rows
+        keys_new = sorted(items_new, key=cmp_to_key(
+            lambda first, second: 1 if self._compare_keys_function(first, second) else
+            -1 if self._compare_keys_function(second, first) else 0
+        ))
+        groups = []
+        for key in keys_new:
+            index_insert = self._get_insertion_index(key)
+            if len(groups) > 0 and groups[-1][0] == index_insert:
+                groups[-1][1].append(key)
+            else:
+                groups.append((index_insert, [key]))
+
+        # Call Qt interface functions and add the keys of each group. Note,
+        # that insertion positions shift by the number of keys inserted before.
+        offset = 0
+        for index_insert, keys in groups:
+            index_insert += offset
+            self.beginInsertRows(QModelIndex(), index_insert, index_insert + len(keys) - 1)
+            self._keys[index_insert:index_insert] = keys
+            for key in keys:
+                self._items[key] = items_new[key]
             self.endInsertRows()
+            offset += len(keys)
 
         self.items_changed.emit()
 
@@ -181,10 +217,11 @@ class OrderedDictModel(QAbstractListModel):
 
         # Call Qt interface functions and remove all keys and corresponding
         # items from the dictionary
-        self.beginRemoveRows(QModelIndex(), 0, len(self) - 1)
-        self._keys.clear()
-        self._items.clear()
-        self.endRemoveRows()
+        if len(self) > 0:
+            self.beginRemoveRows(QModelIndex(), 0, len(self) - 1)
+            self._keys.clear()
+            self._items.clear()
+            self.endRemoveRows()
 
         # Update it with (key, item) pairs specified by *tuples*. The update
         # method emits *items_changed*.
@@ -198,16 +235,26 @@ class OrderedDictModel(QAbstractListModel):
             the corresponding items
         """
 
-        # Iterate to find index corresponding to key in ordered dict
-        for key in keys:
-            for index, key_other in enumerate(self):
-                if key_other == key:
-                    break
+        keys_removed = set(key for key in keys if key in self._items)
 
-            # Call Qt interface functions and remove key and corresponding item
-            self.beginRemoveRows(QModelIndex(), index, index + 1)
-            self._keys.pop(index)
-            self._items.pop(index)
+        # Find the ranges of rows of the removed keys
+        ranges = []
+        for index, key in enumerate(self._keys):
+            if key not in keys_removed:
+                continue
+            if len(ranges) > 0 and ranges[-1][1] == index - 1:
+                ranges[-1][1] = index
+            else:
+                ranges.append([index, index])
+
+        # Call Qt interface functions and remove the ranges of keys and
+        # corresponding items. Ranges are removed from the end, so the rows of
+        # the remaining ranges do not change.
+        for first, last in reversed(ranges):
+            self.beginRemoveRows(QModelIndex(), first, last)
+            for key in self._keys[first:last + 1]:
+                del self._items[key]
+            del self._keys[first:last + 1]
             self.endRemoveRows()
 
         self.items_changed.emit()
@@ -248,24 +295,38 @@ class OrderedDictTreeItem:
     :param values: Values contained by the item
     :param identifier_compare_function: Function to compare two identifiers,
         defines the order of children.
+
+    The children are additionally stored in a :class: `dict` by their
+    identifiers, and each child caches its *row* ie. its position in the
+    children of its parent. Thus, children are looked up in constant time.
+    On insertion or removal of a child, only the rows from its position on
+    are invalidated, and they are updated, when a row is needed again.
+    Likewise, the *label*s of the children are computed once, when a label
+    is needed after the children changed.
     """
 
     def __init__(self, identifier=None, parent=None, children=None,
                  values=None, compare_identifiers_function=None):
         self._identifier = identifier
         self._parent = parent
-
-        self._children = []
-        if children is not None:
-            self.extend(children)
-
-        self.values = set() if values is None else values
+        self._row = 0
+        self._label = None
 
         if compare_identifiers_function is None:
             def compare_identifiers_function(first, second):
                 return first > second
         self._compare_identifiers_function = compare_identifiers_function
 
+        self._children = []
+        self._children_by_identifier = {}
+        # Cached rows of children before this position are valid
+        self._rows_valid_until = 0
+        self._labels_valid = False
+        if children is not None:
+            self._update(children)
+
+        self.values = set() if values is None else values
+
     # Properties for private attributes
 
     @property
@@ -281,6 +342,36 @@ class OrderedDictTreeItem:
         # Copy the list of children
         return list(self._children)
 
+    @property
+    def row(self):
+        """Position of the item in the children of its parent.
+
+        :rtype: :class: `int`
+        """
+
+        if self._parent is None:
+            return 0
+        return self._parent._get_row(self)
+
+    @property
+    def label(self):
+        """Label to display the item. If the item has siblings, the parts of
+        its identifier, which the identifiers of all siblings contain as well,
+        are omitted, eg. the common directories of simulation paths.
+
+        :rtype: :class: `str`
+        """
+
+        if self._parent is None:
+            return str(self)
+        if not self._parent._labels_valid:
+            self._parent._update_labels()
+        return self._label
+
+    def child(self, row):
+        """Get the child at position *row*."""
+        return self._children[row]
+
     # Special functions/properties
 
     @property
@@ -335,40 +426,84 @@ class OrderedDictTreeItem:
 
     # Functions to add/remove children of the item
 
+    def _get_row(self, child):
+        """Get the row of *child*, and update the cached rows of all children
+        from the first invalid one on, if necessary. Note, that a cached row,
+        which still points to the child itself, is always valid."""
+        if child._row >= self._rows_valid_until and not (
+                child._row < len(self._children) and self._children[child._row] is child):
+            for row in range(self._rows_valid_until, len(self._children)):
+                self._children[row]._row = row
+            self._rows_valid_until = len(self._children)
+        return child._row
+
+    def _update_labels(self):
+        """Compute the labels of all children. A part of an identifier is
+        omitted, if it is counted in the identifiers of all children."""
+        if len(self._children) == 1:
+            self._children[0]._label = str(self._children[0])
+        else:
+            parts_list = [child.identifier.split(sep) for child in self._children]
+            counts = Counter(part for parts in parts_list for part in set(parts))
+            for child, parts in zip(self._children, parts_list):
+                child._label = " ".join(part for part in parts if counts[part] < len(self._children))
+        self._labels_valid = True
+
+    def _get_insertion_row(self, identifier):
+        """Find the row, at which a child with *identifier* is inserted, ie.
+        the position of the first child with a bigger identifier, by bisection.
+
+        :rtype: :class: `int`
+        """
+
+        low, high = 0, len(self._children)
+        while low < high:
+            middle = (low + high) // 2
+            if self._compare_identifiers_function(self._children[middle].identifier, identifier):
+                high = middle
+            else:
+                low = middle + 1
+        return low
+
     def _add(self, child):
         child._parent = self
 
-        # Find the insertion index of the child, and do insertion.
-        for index, identifier in enumerate(self):
-            # If child is already present overwrite it
-            if identifier == child.identifier:
-                self._children[index] = child
-                return
-            # If the identifier is bigger than the current one, and thus,
-            # all identifiers before, do insertion here
-            if self._compare_identifiers_function(identifier, child.identifier):
-                self._children.insert(index, child)
-                return
+        # If child is already present overwrite it
+        if child.identifier in self._children_by_identifier:
+            row = self._children_by_identifier[child.identifier].row
+            self._children[row] = child
+            self._children_by_identifier[child.identifier] = child
+            child._row = row
+            self._labels_valid = False
+            return
 
-        # If no position has been found, just append the element
-        self._children.append(child)
+        # Else insert it before the first child with a bigger identifier
+        row = self._get_insertion_row(child.identifier)
+        self._children.insert(row, child)
+        self._children_by_identifier[child.identifier] = child
+        child._row = row
+        self._rows_valid_until = min(self._rows_valid_until, row)
+        self._labels_valid = False
 
     def _update(self, children):
         for child in children:
-            self.add(child)
+            self._add(child)
 
     def _remove(self, child):
+        row = child.row
         child._parent = None
-        self._children.remove(child)
+        del self._children[row]
+        del self._children_by_identifier[child.identifier]
+        self._rows_valid_until = min(self._rows_valid_until, row)
+        self._labels_valid = False
 
     # Reimplemented some dictionary functions
 
     def __getitem__(self, identifier):
         """Get child by *identifier*"""
 
-        for child in self._children:
-            if child.identifier == identifier:
-                return child
+        if identifier in self._children_by_identifier:
+            return self._children_by_identifier[identifier]
 
         raise KeyError("Key {key} not found in item {item}".format(
             key=identifier,
@@ -384,12 +519,9 @@ class OrderedDictTreeItem:
         for child in self._children:
             yield child.identifier
 
-    def __contains(self, identifier):
+    def __contains__(self, identifier):
         """Check for identifier ie. key in *children*"""
-        for identifier_child in self:
-            if identifier_child == identifier:
-                return True
-        return False
+        return identifier in self._children_by_identifier
 
     def __str__(self):
         return str(self.identifier)
@@ -427,16 +559,15 @@ class OrderedDictTreeModel(QAbstractItemModel):
         if not self.hasIndex(row, column, q_parent_index):
             return QModelIndex()
         if q_parent_index.isValid():
-            item = q_parent_index.internalPointer().children[row]
+            item = q_parent_index.internalPointer().child(row)
             return self.createIndex(row, 0, item)
-        return self.createIndex(row, column, self.root.children[row])
+        return self.createIndex(row, column, self.root.child(row))
 
     def parent(self, q_parent_index):
         if q_parent_index.isValid():
             parent = q_parent_index.internalPointer().parent
-            if parent != self.root:
-                row = parent.parent.children.index(parent)
-                return self.createIndex(row, 0, parent)
+            if parent is not None and parent is not self.root:
+                return self.createIndex(parent.row, 0, parent)
         return QModelIndex()
 
     def rowCount(self, q_parent_index):
@@ -452,19 +583,9 @@ class OrderedDictTreeModel(QAbstractItemModel):
 
     def data(self, q_parent_index, q_role):
         if q_parent_index.isValid() and q_role == Qt.DisplayRole:
-            siblings = q_parent_index.internalPointer().parent.children
-            if len(siblings) > 1:
-                sibling_identifiers = []
-                sibling_identifiers += [sibling.identifier.split(sep) for sibling in siblings]
-                unique_part = []
-                for c in sibling_identifiers:
-                    result = list(filter(lambda x: all(x in l for l in sibling_identifiers) == False, c))
-                    unique_part.append(" ".join(result))
-
-                return unique_part[q_parent_index.row()]
-            else:
-                path = str(q_parent_index.internalPointer())
-                return path
+            # Display the parts of the identifier, which differ from those of
+            # its siblings
+            return q_parent_index.internalPointer().label
 
         return QVariant()
 
@@ -506,12 +627,8 @@ class OrderedDictTreeModel(QAbstractItemModel):
         # Callback, which is used to create items not already present at the
         # *path*
         def create_item(key, item_parent, q_index_parent):
-            # Always add as last child
-            row = len(item_parent)
-            for index, identifier in enumerate(item_parent):
-                if compare_strings_case_insensitive(key, identifier):
-                    row = index
-                    break
+            # Insert at the same row as the item parent does
+            row = item_parent._get_insertion_row(key)
             # Call Qt update functions
             self.beginInsertRows(q_index_parent, row, row)
             item = OrderedDictTreeItem(
@@ -585,38 +702,17 @@ class OrderedDictTreeModel(QAbstractItemModel):
 
     def _get_index_parent_from_item(self, item):
         """Get the :class: `QModelIndex` *q_parent_index* of the parent item of
-        *item*. Note, that the tree has to walked up and down again
-        to find the index, so performance depends on the depth of the tree.
+        *item*.
 
         :param item: The parent index of this item is found.
 
         :rtype: :class: `QModelIndex*
         """
 
-        # Return invalid index if *item* is the root item
+        # Return invalid index if *item* or its parent is the root item
         if item.parent is None:
             return QModelIndex()
-
-        # Walk the tree up the chain of parent items until the root item
-        # to find the *path*
-        path_queue = deque()
-        other = item.parent
-        while True:
-            path_queue.appendleft(other)
-            # Break if *other* is the root item
-            if other.parent is None:
-                break
-            other = other.parent
-        path = list(path_queue)
-
-        # Walk the path down again to the *item* and create
-        # QModelIndex along the way.
-        q_index_parent = QModelIndex()
-        for (parent, item) in zip(path[:-1], path[1:]):
-            row = parent.children.index(item)
-            q_index_parent = self.index(row, 0, q_index_parent)
-
-        return q_index_parent
+        return self._get_index_from_item(item.parent)
 
     def _get_index_from_item(self, item):
         """Get the :class: `QModelIndex` corresponding to a given *item*.
@@ -629,18 +725,7 @@ class OrderedDictTreeModel(QAbstractItemModel):
         # If the **item** itself is the root item, return an invalid index
         if item.parent is None:
             return QModelIndex()
-
-        q_index_parent = self._get_index_parent_from_item(item)
-
-        # If the **parent** item is not the root item, create the index
-        # corresponding to *item* and return it.
-        if q_index_parent.isValid():
-            row = q_index_parent.internalPointer().children.index(item)
-            return self.index(row, 0, q_index_parent)
-
-        # If the **parent** item is the root item, create index and return it.
-        row = self.root.children.index(item)
-        return self.index(row, 0, QModelIndex())
+        return self.createIndex(item.row, 0, item)
 
     def _get_row_from_item_and_index_parent(self, item, q_index_parent):
         """Get the row of an *item* in reference to its parent at
@@ -652,11 +737,8 @@ class OrderedDictTreeModel(QAbstractItemModel):
         :rtype: :class: `Int`
         """
 
-        if q_index_parent.isValid():
-            return q_index_parent.internalPointer().children.index(item)
-        # If the *q_index_parent* is invalid, default to root being
-        # parent
-        return self.root.children.index(item)
+        # The row is cached by the item itself
+        return item.row
 
     def remove_item(self, item, q_index_parent=None):
         """Remove *item* from the tree. Additionally to the item itself, all sub
@@ -678,10 +760,12 @@ class OrderedDictTreeModel(QAbstractItemModel):
 
         # Before removing *item* itself, recursively remove all sub items, if
         # there are any
+        # Note, that children are removed from the last one, so the rows of
+        # the remaining ones stay valid
         if len(item) > 0:
             q_index = self.index(row, 0, q_index_parent)
-            for child in item:
-                self.remove_item(item[child], q_index)
+            for child in reversed(item.children):
+                self.remove_item(child, q_index)
 
         parent = item.parent
 
@@ -706,8 +790,11 @@ class OrderedDictTreeModel(QAbstractItemModel):
     def clear(self):
         """Remove all items except the *root* item from the tree."""
 
-        for child in self.root:
-            self.remove_item(self.root[child], QModelIndex())
+        # Iterate over a copy of the children, as they are removed. Children
+        # are removed from the last one, so the rows of the remaining ones
+        # stay valid
+        for child in reversed(self.root.children):
+            self.remove_item(child, QModelIndex())
 
     def __repr__(self):
         return str(self.root.dict_tree)
@@ -730,6 +817,15 @@ class SimDataItemTreeModel(OrderedDictTreeModel):
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
+        # Additional parameters offered to and chosen by the user for each
+        # sim data item class, see *update*
+        self._parameter_choices = {}
+        # Index of the files, from which the sim data items in the tree are
+        # loaded: *file_index* maps their paths to their key of get_file_key,
+        # thus, unchanged files need not be parsed again, and *_file_items*
+        # maps them to their sim data items
+        self.file_index = {}
+        self._file_items = {}
 
     # Implement *add*, *update* and remove to add/remove sim data items to the
     # tree.
@@ -807,9 +903,21 @@ class SimDataItemTreeModel(OrderedDictTreeModel):
                     not_chosen_par.setDragDropMode(QAbstractItemView.DragDrop)
                     not_chosen_par.setDefaultDropAction(QtCore.Qt.MoveAction)
                     if not_chosen_par:
+                        # the parser thread adds the items of a directory in several batches,
+                        # thus, keep the choice for the parameters which have been offered before,
+                        # so that all items of a class use the same parameters in the tree
+                        offered_par = {not_chosen_par.item(i).text() for i in range(len(not_chosen_par))}
+                        previous_offered_par, previous_chosen_par = self._parameter_choices.get(sim_class,
+                                                                                                (set(), []))
+                        if offered_par <= previous_offered_par:
+                            chosen_par.clear()
+                            chosen_par.addItems(previous_chosen_par)
+                            not_chosen_par.clear()
+                            not_chosen_par.addItems([item for item in offered_par
+                                                     if item not in previous_chosen_par])
                         # we do not want to create the dialog when testing the code. since the dialog will never be closed
                         # todo: code should not know about test. make dialog available from the outside, let test close it
-                        if 'RUNNING_AS_UNITTEST' not in environ:
+                        elif 'RUNNING_AS_UNITTEST' not in environ:
                             main_layout = QVBoxLayout()
                             dialog = QDialog()
                             dialog.setWindowTitle('Choose Parameters')
@@ -829,6 +937,9 @@ class SimDataItemTreeModel(OrderedDictTreeModel):
                             main_layout.addWidget(ok_button)
                             ok_button.clicked.connect(dialog.close)
                             dialog.exec()
+                        self._parameter_choices[sim_class] = (offered_par | previous_offered_par,
+                                                              [chosen_par.item(i).text()
+                                                               for i in range(len(chosen_par))])
                     for i in range(len(not_chosen_par)):
                         diff_dict[sim_class].pop(not_chosen_par.item(i).text(), None)
                 additional_param_found.append(sim_class)
@@ -838,6 +949,8 @@ class SimDataItemTreeModel(OrderedDictTreeModel):
             # This is for conformance with rd data written out by older versions of rdplot
             pass
 
+        replaced_tree_items = self._replace_file_items(sim_data_items)
+
         for sim_data_item in sim_data_items:
 
             has_additional_params = False
@@ -866,8 +979,71 @@ class SimDataItemTreeModel(OrderedDictTreeModel):
             # Add *sim_data_item* to the set of values of the tree item *item*
             item.values.add(sim_data_item)
 
+        # Remove the tree items of replaced sim data items, which are not
+        # used by their replacements
+        for item in replaced_tree_items:
+            if len(item.values) == 0 and len(item) == 0 and item.parent is not None:
+                self.remove_item(item)
+
         self.items_changed.emit()
 
+    def _replace_file_items(self, sim_data_items):
+        """Remove the sim data items, which have been loaded from the files
+        of *sim_data_items* before, from the tree, and index the files with
+        *sim_data_items*.
+
+        :rtype: :class: `list` of the tree items of the removed sim data items
+        """
+
+        file_items = {}
+        for sim_data_item in sim_data_items:
+            file_items.setdefault(get_file_path(sim_data_item.path), []).append(sim_data_item)
+
+        replaced_tree_items = {}
+        for file_path, items in file_items.items():
+            for sim_data_item in self._file_items.get(file_path, ()):
+                item = self.create_path(*sim_data_item.tree_identifier_list)
+                item.values.discard(sim_data_item)
+                replaced_tree_items[id(item)] = item
+            self._file_items[file_path] = items
+            try:
+                self.file_index[file_path] = get_file_key(file_path)
+            except OSError:
+                # eg. items of rd data, whose logs do not exist anymore
+                self.file_index.pop(file_path, None)
+
+        return list(replaced_tree_items.values())
+
+    def _remove_from_file_index(self, sim_data_item):
+        # The file is parsed again, if it is added again, but its remaining
+        # sim data items are still replaced then
+        file_path = get_file_path(sim_data_item.path)
+        self.file_index.pop(file_path, None)
+        items = self._file_items.get(file_path, [])
+        if sim_data_item in items:
+            items.remove(sim_data_item)
+        if not items:
+            self._file_items.pop(file_path, None)
+
+    def update_running_items(self):
+        """Update the sim data items of running simulations in the tree with
+        the data appended to their log files, see :func: `update` of
+        :class: `AbstractSimulationDataItem`. Emit *items_changed* signal, if
+        any sim data item changed.
+
+        :rtype: :class: `list` of updated :class: `SimDataItem`s
+        """
+
+        updated_sim_data_items = []
+        for item in self.root.leafs:
+            for sim_data_item in item.values:
+                if sim_data_item.is_running and sim_data_item.update():
+                    updated_sim_data_items.append(sim_data_item)
+
+        if updated_sim_data_items:
+            self.items_changed.emit()
+        return updated_sim_data_items
+
     def remove(self, sim_data_items):
         """Remove all elements in iterable collection *sim_data_items* from the tree.
         Emit *items_changed* signal after all sim data items are removed.
@@ -878,6 +1054,8 @@ class SimDataItemTreeModel(OrderedDictTreeModel):
         for sim_data_item in sim_data_items:
             # Get *item* of the tree corresponding to *sim_data_item*
             item = self.create_path(*sim_data_item.tree_identifier_list)
+            for value in item.values:
+                self._remove_from_file_index(value)
             self.remove_item(item)
 
         self.items_changed.emit()
@@ -889,6 +1067,11 @@ class VariableTreeModel(OrderedDictTreeModel):
     The tree itself corresponds to a structure of variables, which is exported
     by the sim data items. The model implements the *item_changed* signal to
     be compatible to the :class: `QRecursiveSelectionModel` class.
+
+    The model keeps track of the :class: `PlotData` objects, which every sim
+    data item contributes to the leafs of the tree. Thus, if the selection of
+    sim data items changes, only the leafs of added and removed sim data items
+    have to be updated, see :func: `update_from_sim_data_items`.
     """
 
     items_changed = pyqtSignal()
@@ -897,6 +1080,11 @@ class VariableTreeModel(OrderedDictTreeModel):
         # Use lists as default item value
         super().__init__(*args, default_item_values=[], **kwargs)
 
+        # Sim data items contributing to the tree by their path, and the
+        # PlotData objects they contribute by leaf path
+        self._sim_data_items = {}
+        self._sim_data_item_leafs = {}
+
     def update_from_dict_tree(self, dict_tree):
         """ Update the tree from *dict_tree* . Keys create tree items, and the
         leafs of the dictionary tree are appended as values to the corresponding
@@ -921,12 +1109,127 @@ class VariableTreeModel(OrderedDictTreeModel):
         self.items_changed.emit()
 
     def clear_and_update_from_dict_tree(self, dict_tree):
-        # TODO This needs to be called two times, what obviously should not
-        # be the case
-        self.clear()
         self.clear()
+        self._sim_data_items = {}
+        self._sim_data_item_leafs = {}
         self.update_from_dict_tree(dict_tree)
 
+    def update_from_sim_data_items(self, sim_data_items, updated_sim_data_items=()):
+        """Update the tree, so that it contains the data of exactly the
+        *sim_data_items*. Only the leafs, to which added or removed sim data
+        items contribute, are updated. The data of sim data items in
+        *updated_sim_data_items* is read again, eg. if they have been parsed
+        again. Items of unchanged leafs are kept, and so is their selection.
+
+        :param sim_data_items: Iterable of :class: `SimDataItem`s
+        :param updated_sim_data_items: Iterable of :class: `SimDataItem`s,
+            whose data has changed
+
+        :rtype: :class: `list` of the :class: `OrderedDictTreeItem`s, whose
+            values have changed, but which have not been removed
+        """
+
+        sim_data_items = {sim_data_item.path: sim_data_item for sim_data_item in sim_data_items}
+        updated_paths = set(sim_data_item.path for sim_data_item in updated_sim_data_items)
+
+        # Find the sim data items to retract from and to contribute to the
+        # tree. A sim data item, which has been replaced by another one with
+        # the same path, is retracted and its replacement contributed.
+        removed_paths = [path for (path, sim_data_item) in self._sim_data_items.items()
+                         if sim_data_items.get(path) is not sim_data_item or path in updated_paths]
+        added_paths = [path for (path, sim_data_item) in sim_data_items.items()
+                       if self._sim_data_items.get(path) is not sim_data_item or path in updated_paths]
+
+        changed_leaf_paths = set()
+        for path in removed_paths:
+            del self._sim_data_items[path]
+            changed_leaf_paths.update(self._sim_data_item_leafs.pop(path))
+        for path in added_paths:
+            self._sim_data_items[path] = sim_data_items[path]
+            leafs = self._get_leafs_from_sim_data_item(sim_data_items[path])
+            self._sim_data_item_leafs[path] = leafs
+            changed_leaf_paths.update(leafs)
+
+        if len(changed_leaf_paths) == 0:
+            return []
+
+        # Sim data items contribute to a leaf in the order of their paths, as
+        # they are listed by the selected sim data items list model
+        sorted_paths = sorted(self._sim_data_items)
+
+        changed_items = []
+        for leaf_path in sorted(changed_leaf_paths):
+            plot_data_lists = [self._sim_data_item_leafs[path][leaf_path] for path in sorted_paths
+                               if leaf_path in self._sim_data_item_leafs[path]]
+            if len(plot_data_lists) > 0:
+                tree_item = self.create_path(*leaf_path)
+                tree_item.values = self._join_plot_data_lists(plot_data_lists)
+                changed_items.append(tree_item)
+                continue
+
+            # The leaf does not contain data anymore, thus, it is removed
+            # unless it has children itself
+            try:
+                tree_item = self.get_item_from_path(*leaf_path)
+            except KeyError:
+                continue
+            if len(tree_item) > 0:
+                tree_item.values = []
+                changed_items.append(tree_item)
+            else:
+                self.remove_item(tree_item)
+
+        self.items_changed.emit()
+        return changed_items
+
+    @staticmethod
+    def _get_leafs_from_sim_data_item(sim_data_item):
+        """Get the :class: `PlotData` objects of a *sim_data_item* by the paths
+        of the leafs they belong to.
+
+        :rtype: :class: `dict` of :class: `tuple` of leaf path and
+            :class: `list` of :class: `PlotData`
+        """
+
+        leafs = {}
+        pairs = deque(((key,), item) for (key, item) in dict_tree_from_sim_data_items([sim_data_item]).items())
+        while len(pairs) != 0:
+            (path, item) = pairs.pop()
+
+            if isinstance(item, dict):
+                pairs.extend((path + (key,), item) for key, item in item.items())
+                continue
+
+            leafs[path] = item
+
+        return leafs
+
+    @staticmethod
+    def _join_plot_data_lists(plot_data_lists):
+        """Join the lists of :class: `PlotData` objects, which different sim
+        data items contribute to a leaf, the same way
+        :func: `dict_tree_from_sim_data_items` does. PlotData objects with the
+        same identifiers are joined to a new object, all others are shared.
+
+        :rtype: :class: `list` of :class: `PlotData`
+        """
+
+        plot_data_groups = {}
+        for plot_data_list in plot_data_lists:
+            for plot_data in plot_data_list:
+                plot_data_groups.setdefault(tuple(plot_data.identifiers), []).append(plot_data)
+
+        plot_data_joined = []
+        for plot_data_group in plot_data_groups.values():
+            plot_data = plot_data_group[0]
+            if len(plot_data_group) > 1:
+                plot_data = PlotData(plot_data.identifiers,
+                                     join_values([other.values for other in plot_data_group]),
+                                     plot_data.path, plot_data.label)
+            plot_data_joined.append(plot_data)
+
+        return plot_data_joined
+
 
 # This is the model for storing the bd table
 # noinspection PyMethodOverriding
@@ -268,5 +268,20 @@ class TestDatLogs(unittest.TestCase):
                 print('Can parse %s with %s' % (log_path, type(cls_list[0])))
 
 
+
+class TestReadDatLog(unittest.TestCase):
+    XML = ('<?xml version="1.0" encoding="utf-8"?>\n<Logfile>\n\t<Codec>\n\t\t<Value>HEVC</Value>\n\t</Codec>\n'
+           '\t<Rate>\n\t\t<Unit>kbps</Unit>\n\t\t<Value>4171.1368</Value>\n\t</Rate>\n</Logfile>\n')
+
+    def test_read_entries(self):
+        self.assertEqual(DatLogs.read_dat_log(self.XML),
+                         {'Codec': {'Value': 'HEVC'}, 'Rate': {'Unit': 'kbps', 'Value': '4171.1368'}})
+
+    def test_stop_after_codec(self):
+        # the rest of the log is not read, thus, even broken xml is fine
+        self.assertEqual(DatLogs.read_dat_log(self.XML.replace('</Rate>', '</Broken>'), stop_after_codec=True),
+                         {'Codec': {'Value': 'HEVC'}})
+
+
 if __name__ == '__main__':
     unittest.main()
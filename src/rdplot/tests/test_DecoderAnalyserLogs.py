@@ -0,0 +1,66 @@
+import pickle
+import unittest
+
+import jsonpickle
+
+from rdplot.SimulationDataItem import FileLoadContext
+from rdplot.SimulationDataItemClasses.DecoderAnalyserLogs import DecAnalyserLogHM
+
+STATISTICS = '''HM software: Decoder Version [16.20]
+ Decoder statistics                             -   Width   Type  CABAC Count    CABAC Sum   CABAC bits     EP Count       EP Sum      EP bits   Total bits ( Total bytes)
+------------------------------------------------------------------------------------------------------------------------------------------------------------------------
+ CABAC_BITS__SPLIT_FLAG                        :       8      L          10          20           30           40           50           60           90 (          11)
+ CABAC_EP_BIT_ALIGNMENT                        :       -      -                                                40           50           60           60 (           7)
+--Break down by size----------------------------------------------------------------------------------------------------------------------------------------------------
+                                               :       8      -          10          20           30           40           50           60           90 (          11)
+--Break down by component/Channel type----------------------------------------------------------------------------------------------------------------------------------
+                                               :       -      L          10          20           30           40           50           60           90 (          11)
+--Break down by size and component/Channel type-------------------------------------------------------------------------------------------------------------------------
+                                               :       8      L          10          20           30           40           50           60           90 (          11)
+------------------------------------------------------------------------------------------------------------------------------------------------------------------------
+[TOTAL                                         ~  ~~GT~~ ~~GT~~          10          20           30           40           50           60           90 (          11)]
+
+ Total Time:        1.234 sec.
+'''
+
+
+class TestDecAnalyserLogHM(unittest.TestCase):
+    def test_tokenize_statistics(self):
+        values = (10.0, 20.0, 30.0, 40.0, 50.0, 60.0, 90.0, 11.0)
+        self.assertEqual(DecAnalyserLogHM._tokenize_statistics(STATISTICS.encode()), [
+            ('Statistics', 'CABAC_BITS__SPLIT_FLAG', '8', 'L') + values,
+            ('Statistics', 'CABAC_EP_BIT_ALIGNMENT', '-', '-', 0.0, 0.0, 0.0, 40.0, 50.0, 60.0, 60.0, 7.0),
+            ('bySize', '', '8', '-') + values,
+            ('byType', '', '-', 'L') + values,
+            ('bySize/byType', '', '8', 'L') + values,
+            ('Total', 'TOTAL', '~~GT~~', '~~GT~~') + values,
+        ])
+
+    def test_analyser_data_is_created_once(self):
+        log_path = 'BasketballPass_416x240_QP22_dec.log'
+        item = DecAnalyserLogHM(log_path, FileLoadContext(log_path, STATISTICS.encode()))
+        analyser_data = item.analyser_data
+        self.assertIs(item.analyser_data, analyser_data)
+        self.assertEqual(analyser_data['Total']['TOTAL']['Total bits'], [('22', 90.0)])
+
+        # the tree is not pickled, but created again from the table
+        unpickled_item = pickle.loads(pickle.dumps(item))
+        self.assertNotIn('_analyser_data', unpickled_item.__dict__)
+        self.assertEqual(unpickled_item.analyser_data, analyser_data)
+
+    def test_pickled_as_lists(self):
+        log_path = 'BasketballPass_416x240_QP22_dec.log'
+        item = DecAnalyserLogHM(log_path, FileLoadContext(log_path, STATISTICS.encode()))
+        encoded = jsonpickle.encode(item)
+        self.assertNotIn('py/reduce', encoded)
+        self.assertNotIn('numpy', encoded)
+
+        decoded = jsonpickle.decode(encoded)
+        for (name, column) in item.analyser_table.items():
+            self.assertEqual(decoded.analyser_table[name].dtype, column.dtype)
+            self.assertEqual(decoded.analyser_table[name].tolist(), column.tolist())
+        self.assertEqual(decoded.analyser_data, item.analyser_data)
+
+
+if __name__ == '__main__':
+    unittest.main()
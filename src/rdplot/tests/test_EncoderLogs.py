@@ -1,9 +1,16 @@
 import unittest
 from rdplot.SimulationDataItemClasses import EncoderLogs, DatLogs
 from rdplot.SimulationDataItem import AbstractSimulationDataItem
-from rdplot.SimulationDataItem import SimulationDataItemFactory
+from rdplot.SimulationDataItem import SimulationDataItemFactory, dict_tree_from_sim_data_items
 # import SimulationDataItem
+import bz2
+import gzip
+import lzma
+import math
+import tarfile
+import zipfile
 from os import path, listdir
+from tempfile import TemporaryDirectory
 
 # path to test module (this file)
 TEST_DIR = path.dirname(path.abspath(__file__))
@@ -52,6 +59,7 @@ class TestEncoderLogs(unittest.TestCase):
         # remove base classes which are not tested
         del self.tested_parsers[AbstractSimulationDataItem]
         del self.tested_parsers[EncoderLogs.AbstractEncLog]
+        del self.tested_parsers[EncoderLogs.AbstractDeclarativeEncLog]
         del self.tested_parsers[DatLogs.AbstractDatLog]
         del self.tested_parsers[DatLogs.DatLogBasedOnClassName]
 
@@ -125,14 +133,12 @@ class TestEncoderLogs(unittest.TestCase):
                     self.assertTrue(isinstance(float(qp), float))
 
                     # check structure of temporal data dict
-                    self.assertCountEqual(temporal_data.keys(),
-                                          ['Frames', 'ET', 'Bits', 'Y-PSNR', 'U-PSNR', 'V-PSNR', 'Y-SPSNR_NN',
-                                           'U-SPSNR_NN',
-                                           'V-SPSNR_NN', 'Y-WSPSNR', 'U-WSPSNR', 'V-WSPSNR', 'Y-SPSNR_I', 'U-SPSNR_I',
-                                           'V-SPSNR_I', 'Y-CPPSNR', 'U-CPPSNR', 'V-CPPSNR', 'Y-E2EWSPSNR',
-                                           'U-E2EWSPSNR',
-                                           'V-E2EWSPSNR', 'Y-PSNR_VP0', 'U-PSNR_VP0', 'V-PSNR_VP0', 'Y-PSNR_VP1',
-                                           'U-PSNR_VP1', 'V-PSNR_VP1'])
+                    # the metrics are configurable for 360Lib, they are labeled
+                    # the same in the POC lines and in the summary
+                    metric_keys = set(summary_data['SUMMARY']) - {'360Lib Version', 'Bitrate', 'Total Frames',
+                                                                   'Total Time', 'YUV-PSNR'}
+                    self.assertIn('Y-WSPSNR', metric_keys)
+                    self.assertCountEqual(temporal_data.keys(), metric_keys | {'Frames', 'ET', 'Bits'})
 
                     # check structure of summary data dict
                     # any stream will have at least summary and intra pictures:
@@ -157,6 +163,31 @@ class TestEncoderLogs(unittest.TestCase):
                             self.assertIn('V-PSNR', data.keys())
                             self.assertIn('YUV-PSNR', data.keys())
 
+                elif isinstance(parsed_instance, EncoderLogs.EncLogVTM):
+                    temporal_data = parsed_instance.temporal_data
+                    summary_data = parsed_instance.summary_data
+
+                    # run checks on the parsed data
+                    # check variable types
+                    self.assertTrue(isinstance(parsed_instance.sequence, str))
+                    self.assertTrue(path.isdir(parsed_instance.config))
+                    self.assertTrue(isinstance(float(parsed_instance.qp), float))
+
+                    # check structure of temporal data dict
+                    self.assertCountEqual(temporal_data.keys(), ['Frames', 'ET', 'Bits', 'Y-PSNR', 'U-PSNR', 'V-PSNR'])
+
+                    # check structure of summary data dict
+                    # blocks of picture types which do not occur are skipped
+                    self.assertCountEqual(summary_data.keys(), ['SUMMARY', 'I', 'B'])
+                    for picture_type_key, data in summary_data.items():
+                        if picture_type_key == 'SUMMARY':
+                            self.assertCountEqual(data.keys(), ['VTM Major Version', 'Total Time', 'U-PSNR',
+                                                                'Y-PSNR', 'VTM Minor Version', 'V-PSNR',
+                                                                'Total Frames', 'YUV-PSNR'])
+                        else:
+                            self.assertCountEqual(data.keys(),
+                                                  ['Total Frames', 'Y-PSNR', 'U-PSNR', 'V-PSNR', 'YUV-PSNR'])
+
                 elif isinstance(parsed_instance, EncoderLogs.EncLogSHM):
                     temporal_data = parsed_instance.temporal_data
                     summary_data = parsed_instance.summary_data
@@ -259,5 +290,209 @@ class TestEncoderLogs(unittest.TestCase):
                 print('Can parse %s with %s' % (log_path, type(cls_list[0])))
 
 
+class FactoryTestCase(unittest.TestCase):
+    """Test case, whose tests share a simulation data item factory, which is
+    created once for the class
+    """
+    @classmethod
+    def setUpClass(cls):
+        cls._factory = SimulationDataItemFactory.from_path(SIMULATION_DATA_ITEM_CLASSES_PATH)
+
+
+class TestRunningEncLogs(FactoryTestCase):
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls._factory.parse_running = True
+
+    def setUp(self):
+        test_log_path = path.join(TEST_DIR, 'test_logs/examplesForDifferentVersions')
+        self.log_paths = [path.join(test_log_path, log_dir, log)
+                          for log_dir in ['HM', 'HM360Lib'] for log in listdir(path.join(test_log_path, log_dir))
+                          if log.endswith('enc.log')]
+
+    def test_update_running_log(self):
+        for log_path in self.log_paths:
+            with self.subTest(log_path=log_path), TemporaryDirectory() as temp_dir:
+                finished_item = self._factory.create_item_from_file(log_path)[0]
+                with open(log_path, 'rb') as log_file:
+                    log_bytes = log_file.read()
+
+                # write the log in pieces, cutting lines, like a running encoder
+                running_log_path = path.join(temp_dir, path.basename(log_path))
+                size = log_bytes.index(b'POC') + 10
+                with open(running_log_path, 'wb') as running_log_file:
+                    running_log_file.write(log_bytes[:size])
+                running_item = self._factory.create_item_from_file(running_log_path)[0]
+                self.assertIs(type(running_item), type(finished_item))
+                self.assertTrue(running_item.is_running)
+
+                while size < len(log_bytes):
+                    with open(running_log_path, 'ab') as running_log_file:
+                        running_log_file.write(log_bytes[size:size + 5000])
+                    size += 5000
+                    running_item.update()
+
+                self.assertFalse(running_item.is_running)
+                self.assertFalse(running_item.update())
+                self.assertEqual(running_item.temporal_data, finished_item.temporal_data)
+                self.assertEqual(repr(running_item.summary_data), repr(finished_item.summary_data))
+
+
+class TestLazyTemporalData(FactoryTestCase):
+    def test_temporal_data_is_parsed_on_access(self):
+        log_dir = path.join(TEST_DIR, 'test_logs/examplesForDifferentVersions/HM')
+        log_path = path.join(log_dir, sorted(log for log in listdir(log_dir) if log.endswith('enc.log'))[0])
+        item = self._factory.create_item_from_file(log_path)[0]
+        self.assertIsNone(item._temporal_data)
+
+        # the variable tree is created without parsing the temporal data
+        dict_tree = dict_tree_from_sim_data_items([item])
+        self.assertIsNone(item._temporal_data)
+
+        # the temporal data parsed from the POC block equals the data parsed from the whole log
+        plot_data = dict_tree['EncLogHM']['Temporal']['Y-PSNR'][0]
+        self.assertGreater(len(plot_data.values), 0)
+        self.assertIsNotNone(item._temporal_data)
+        with open(log_path, 'rb') as log_file:
+            self.assertEqual(item.temporal_data, item._parse_temporal_buffer(log_file.read()))
+        self.assertEqual(plot_data.values, item.temporal_data['Y-PSNR'])
+
+
+class TestCompressedLogs(FactoryTestCase):
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls._factory.file_patterns = ['*_enc.log']
+
+    def test_compressed_logs_equal_uncompressed_logs(self):
+        log_dir = path.join(TEST_DIR, 'test_logs/examplesForDifferentVersions/HM360Lib')
+        log_name = sorted(log for log in listdir(log_dir) if log.endswith('enc.log'))[0]
+        with open(path.join(log_dir, log_name), 'rb') as log_file:
+            log_bytes = log_file.read()
+        item = self._factory.create_item_from_file(path.join(log_dir, log_name))[0]
+
+        with TemporaryDirectory() as temp_dir:
+            for (suffix, compress) in [('.gz', gzip.compress), ('.xz', lzma.compress), ('.bz2', bz2.compress)]:
+                with open(path.join(temp_dir, log_name + suffix), 'wb') as log_file:
+                    log_file.write(compress(log_bytes))
+            compressed_items = self._factory.create_item_list_from_directory(temp_dir)
+
+            self.assertEqual(len(compressed_items), 3)
+            for compressed_item in compressed_items:
+                with self.subTest(path=compressed_item.path):
+                    self.assertIs(type(compressed_item), type(item))
+                    self.assertEqual(compressed_item.sequence, item.sequence)
+                    self.assertEqual(compressed_item.log_config, item.log_config)
+                    self.assertEqual(repr(compressed_item.summary_data), repr(item.summary_data))
+                    # the temporal data is decompressed on access
+                    self.assertEqual(compressed_item.temporal_data, item.temporal_data)
+
+
+class TestArchives(FactoryTestCase):
+    def test_archive_members_equal_files(self):
+        log_dir = path.join(TEST_DIR, 'test_logs/examplesForDifferentVersions/HM')
+        log_names = sorted(log for log in listdir(log_dir) if log.endswith('enc.log'))[:2]
+        items = {path.basename(item.path): item for item in self._factory.create_item_list_from_directory(log_dir)}
+
+        with TemporaryDirectory() as temp_dir:
+            tar_path = path.join(temp_dir, 'campaign.tar.gz')
+            with tarfile.open(tar_path, 'w:gz') as archive:
+                for log_name in log_names:
+                    archive.add(path.join(log_dir, log_name), 'HM/' + log_name)
+            zip_path = path.join(temp_dir, 'campaign.zip')
+            with zipfile.ZipFile(zip_path, 'w') as archive:
+                for log_name in log_names:
+                    archive.write(path.join(log_dir, log_name), 'HM/' + log_name)
+
+            archive_item_lists = [(archive_path, self._factory.create_item_list_from_path(archive_path))
+                                  for archive_path in [tar_path, zip_path]]
+
+        # the temporal data is parsed with the archive, and not read from it again
+        for archive_path, archive_items in archive_item_lists:
+            self.assertEqual([path.basename(item.path) for item in archive_items], log_names)
+            for archive_item in archive_items:
+                with self.subTest(path=archive_item.path):
+                    item = items[path.basename(archive_item.path)]
+                    # the config is the directory inside the archive
+                    self.assertEqual(archive_item.config, path.join(archive_path, 'HM'))
+                    self.assertEqual(repr(archive_item.summary_data), repr(item.summary_data))
+                    self.assertEqual(archive_item.temporal_data, item.temporal_data)
+
+
+class TestDeclarativeLabels(FactoryTestCase):
+    def test_labels_of_specification(self):
+        log_dir = path.join(TEST_DIR, 'test_logs/examplesForDifferentVersions')
+        items = self._factory.create_item_list_from_directory(log_dir)
+        dict_tree = dict_tree_from_sim_data_items(items)
+
+        for class_name in ['EncLogHM', 'EncLogVTM', 'EncLogHM360Lib']:
+            with self.subTest(class_name=class_name):
+                self.assertIn(class_name, dict_tree)
+        # the labels of the specification equal the labels of the base class
+        for class_name in ['EncLogHM', 'EncLogHM360Lib']:
+            for (kind, variables) in dict_tree[class_name].items():
+                for (summary_type, summary) in variables.items():
+                    for name in (summary if kind == 'Summary' else [summary_type]):
+                        keys = [class_name, kind, summary_type, name] if kind == 'Summary' else [class_name, kind, name]
+                        self.assertEqual(getattr(EncoderLogs, class_name)._get_label(keys),
+                                         EncoderLogs.AbstractEncLog._get_label(keys))
+        # new variables of a specification get labels without changes of the base class
+        self.assertEqual(dict_tree['EncLogVTM']['Summary']['SUMMARY']['VTM Major Version'][0].label, ('', 'sec'))
+        self.assertEqual(dict_tree['EncLogVTM']['Temporal']['ET'][0].label, ('Frame', 'sec'))
+
+
+class TestHM360LibPocLines(unittest.TestCase):
+    def test_metrics_of_poc_lines(self):
+        log_buffer = (b'POC    0 TId: 0 ( I-SLICE, nQP 22 QP 22 )    1000 bits [Y 40.5 dB    U 45.0 dB    V 44.0 dB]'
+                      b' [Y-PSNR_VP0 39.0 dB U-PSNR_VP0 44.5 dB V-PSNR_VP0 43.5 dB] [ET     2 ] [L0 ] [L1 ]\n'
+                      b'POC    8 TId: 0 ( B-SLICE, nQP 26 QP 26 )     200 bits [Y 38.5 dB    U 43.0 dB    V 42.0 dB]'
+                      b' [Y-PSNR_VP0 37.0 dB U-PSNR_VP0 42.5 dB V-PSNR_VP0 41.5 dB] [ET     1 ] [L0 0 ] [L1 0 ]\n'
+                      # truncated line of a running encoder
+                      b'POC    4 TId: 0 ( B-SLICE, nQP 25 QP 25 )     100 bits [Y 39.5 dB    U 44.0 dB]\n')
+        temporal_data = EncoderLogs.EncLogHM360Lib.__new__(EncoderLogs.EncLogHM360Lib)._parse_temporal_buffer(
+            log_buffer)
+        self.assertCountEqual(temporal_data.keys(), ['Frames', 'Bits', 'Y-PSNR', 'U-PSNR', 'V-PSNR', 'Y-PSNR_VP0',
+                                                     'U-PSNR_VP0', 'V-PSNR_VP0', 'ET'])
+        self.assertEqual(temporal_data['Frames'], [(0, 0), (1, 8)])
+        self.assertEqual(temporal_data['V-PSNR_VP0'], [(0, 43.5), (1, 41.5)])
+        self.assertEqual(temporal_data['ET'], [(0, 2), (1, 1)])
+
+    def test_encoding_time_without_value(self):
+        log_buffer = (b'POC    0 TId: 0 ( I-SLICE, nQP 22 QP 22 )    1000 bits [Y 40.5 dB    U 45.0 dB    V 44.0 dB]'
+                      b' [Y-PSNR_VP0 39.0 dB U-PSNR_VP0 44.5 dB V-PSNR_VP0 43.5 dB] [ET     2 ] [L0 ] [L1 ]\n'
+                      b'POC    8 TId: 0 ( B-SLICE, nQP 26 QP 26 )     200 bits [Y 38.5 dB    U 43.0 dB    V 42.0 dB]'
+                      b' [Y-PSNR_VP0 37.0 dB U-PSNR_VP0 42.5 dB V-PSNR_VP0 41.5 dB] [ET ] [L0 0 ] [L1 0 ]\n')
+        temporal_data = EncoderLogs.EncLogHM360Lib.__new__(EncoderLogs.EncLogHM360Lib)._parse_temporal_buffer(
+            log_buffer)
+        # the frame is kept with its other values
+        self.assertEqual(temporal_data['Bits'], [(0, 1000), (1, 200)])
+        self.assertEqual(temporal_data['ET'][0], (0, 2))
+        self.assertTrue(math.isnan(temporal_data['ET'].ys[1]))
+
+
+class TestSHMPocLines(unittest.TestCase):
+    def test_layers_of_poc_lines(self):
+        poc_line = (b'POC    0 LId: {} TId: 0 ( I-SLICE IDR_W_RADL, nQP 34 QP 34 )     1000 bits'
+                    b' [Y 33.5 dB    U 39.2 dB    V 41.0 dB] [ET     6 ] [L0 ] [L1 ]\n')
+        log_buffer = b''.join(poc_line.replace(b'{}', str(layer).encode()) for layer in range(11))
+        temporal_data = EncoderLogs.EncLogSHM.__new__(EncoderLogs.EncLogSHM)._parse_temporal_buffer(log_buffer)
+        # layer ids are compared as numbers, eg. 10 > 9
+        self.assertEqual(len(temporal_data), 11)
+        self.assertEqual(temporal_data['layer 10']['Bits'], [(0, 1000)])
+
+
+class TestReadConfigs(FactoryTestCase):
+    def test_configs_equal_log_configs(self):
+        configs = list(self._factory.read_configs(path.join(TEST_DIR, 'test_logs/examplesForDifferentVersions')))
+        self.assertTrue(configs)
+        for file_path, cls, config in configs:
+            with self.subTest(file_path=file_path):
+                self.assertEqual(config, cls(file_path).log_config)
+                if issubclass(cls, EncoderLogs.EncLogHM):
+                    # the config of HM 14 logs ends before the POC lines
+                    self.assertNotIn('MD5', config)
+
+
 if __name__ == '__main__':
     unittest.main()
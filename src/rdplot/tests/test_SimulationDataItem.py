@@ -0,0 +1,273 @@
+import re
+import tarfile
+import unittest
+from os import path, makedirs
+from shutil import copytree
+from tempfile import TemporaryDirectory
+from unittest import mock
+
+import jsonpickle
+import numpy as np
+
+from rdplot.SimulationDataItem import (SimulationDataItemFactory, SimulationDataItemError, FileLoadContext,
+                                       ParseProgress, ColumnValues, columns_from_rows, dict_tree_from_sim_data_items,
+                                       get_file_key, iter_lines, join_values, sorted_columns)
+from rdplot.SimulationDataItemClasses.EncoderLogs import EncLogHM
+
+# path to test module (this file)
+TEST_DIR = path.dirname(path.abspath(__file__))
+
+
+class TestFindFiles(unittest.TestCase):
+    def setUp(self):
+        self._temp_dir = TemporaryDirectory()
+        for file_path in ['a_enc.log', 'b.yuv', 'rec/c_enc.log', 'sub/d.xml', 'sub/e.txt', 'sub/deep/f_enc.log']:
+            file_path = path.join(self._temp_dir.name, file_path)
+            makedirs(path.dirname(file_path), exist_ok=True)
+            with open(file_path, 'w') as file:
+                file.write('log')
+        self._factory = SimulationDataItemFactory()
+
+    def tearDown(self):
+        self._temp_dir.cleanup()
+
+    def _find_files(self):
+        return [path.relpath(file_path, self._temp_dir.name).replace(path.sep, '/')
+                for file_path in self._factory.find_files(self._temp_dir.name)]
+
+    def test_default_patterns(self):
+        self.assertEqual(self._find_files(),
+                         ['a_enc.log', 'rec/c_enc.log', 'sub/d.xml', 'sub/e.txt', 'sub/deep/f_enc.log'])
+
+    def test_include_and_exclude_patterns(self):
+        self._factory.file_patterns = ['*_enc.log', '*.xml', '!*/rec/*']
+        self.assertEqual(self._find_files(), ['a_enc.log', 'sub/d.xml', 'sub/deep/f_enc.log'])
+
+    def test_not_recursive(self):
+        self._factory.recursive = False
+        self.assertEqual(self._find_files(), ['a_enc.log'])
+
+    def test_max_file_size(self):
+        self._factory.max_file_size = 1
+        self.assertEqual(self._find_files(), [])
+
+
+class TestParseProgress(unittest.TestCase):
+    def setUp(self):
+        self._factory = SimulationDataItemFactory([EncLogHM])
+        self._log_dir = path.join(TEST_DIR, 'test_logs/examplesForDifferentVersions/HM')
+        self._file_count = len(list(self._factory.find_files(self._log_dir)))
+        self._parsed_files = []
+
+    def _file_parsed(self, progress, file_path, items, error):
+        self._parsed_files.append(file_path)
+        self.assertEqual(progress.files_done, len(self._parsed_files))
+
+    def test_progress(self):
+        progress = ParseProgress(self._file_parsed)
+        item_lists = list(self._factory.create_item_lists_from_path_list([self._log_dir], progress=progress))
+
+        self.assertEqual(len(item_lists), 1)
+        self.assertEqual(len(self._parsed_files), self._file_count)
+        self.assertEqual((progress.files_done, progress.files_total), (self._file_count, self._file_count))
+        self.assertEqual(progress.bytes_done, progress.bytes_total)
+        self.assertGreater(progress.bytes_total, 0)
+        self.assertEqual(progress.remaining_time, 0)
+
+    def test_cancel(self):
+        def cancel_after_first_file(progress, file_path, items, error):
+            self._file_parsed(progress, file_path, items, error)
+            progress.cancel()
+
+        progress = ParseProgress(cancel_after_first_file)
+        item_lists = list(self._factory.create_item_lists_from_path_list([self._log_dir], progress=progress))
+
+        # the directory is not yielded, as it is not parsed completely
+        self.assertEqual(item_lists, [])
+        self.assertEqual(len(self._parsed_files), 1)
+        self.assertTrue(progress.is_cancelled)
+
+
+class TestIterItemListsFromPathList(unittest.TestCase):
+    def test_errors_are_isolated(self):
+        factory = SimulationDataItemFactory([EncLogHM])
+        log_dir = path.join(TEST_DIR, 'test_logs/examplesForDifferentVersions/HM')
+        with TemporaryDirectory() as empty_dir:
+            path_list = [path.join(empty_dir, 'missing'), empty_dir, log_dir]
+            results = list(factory.iter_item_lists_from_path_list(path_list))
+
+        self.assertEqual([result[0] for result in results], path_list)
+        for _, item_list, error in results[:2]:
+            self.assertEqual(item_list, [])
+            self.assertIsInstance(error, SimulationDataItemError)
+        self.assertGreater(len(results[2][1]), 0)
+        self.assertIsNone(results[2][2])
+
+    def test_malformed_log_fails_on_its_own(self):
+        factory = SimulationDataItemFactory([EncLogHM])
+        log_dir = path.join(TEST_DIR, 'test_logs/examplesForDifferentVersions/HM')
+        with open(path.join(log_dir, 'HM-14.0-bluesky_1920x1080_QP32_enc.log'), 'rb') as log_file:
+            lines = [line for line in log_file if not line.startswith(b'Input')]
+        with TemporaryDirectory() as temp_dir:
+            # A log without 'Input File' line makes the parser fail with an
+            # IndexError
+            bad_path = path.join(temp_dir, 'bad_enc.log')
+            with open(bad_path, 'wb') as log_file:
+                log_file.writelines(lines)
+            results = list(factory.iter_item_lists_from_path_list([bad_path, log_dir]))
+
+        self.assertEqual([result[0] for result in results], [bad_path, log_dir])
+        self.assertEqual(results[0][1], [])
+        self.assertIsInstance(results[0][2], SimulationDataItemError)
+        self.assertGreater(len(results[1][1]), 0)
+        self.assertIsNone(results[1][2])
+
+    def test_workers_use_factory_settings(self):
+        factory = SimulationDataItemFactory([EncLogHM])
+        factory.recursive = False
+        log_path = path.join(TEST_DIR, 'test_logs/examplesForDifferentVersions/HM/HM-14.0-bluesky_1920x1080_QP32_enc.log')
+        with TemporaryDirectory() as temp_dir:
+            tar_path = path.join(temp_dir, 'logs.tar')
+            with tarfile.open(tar_path, 'w') as archive:
+                archive.add(log_path, 'top_enc.log')
+                archive.add(log_path, 'sub/deep_enc.log')
+            path_list = [tar_path, log_path]
+
+            serial_results = list(factory.iter_item_lists_from_path_list(path_list))
+            with mock.patch('rdplot.SimulationDataItem.PARALLEL_PARSE_MIN_FILES', 1), \
+                    mock.patch('rdplot.SimulationDataItem.PARALLEL_PARSE_MIN_BYTES', 0):
+                parallel_results = list(factory.iter_item_lists_from_path_list(path_list, max_workers=2))
+
+        self.assertEqual([item.path for item in serial_results[0][1]], [path.join(tar_path, 'top_enc.log')])
+        for serial_result, parallel_result in zip(serial_results, parallel_results):
+            self.assertEqual([item.path for item in parallel_result[1]], [item.path for item in serial_result[1]])
+
+    def test_unchanged_files_are_skipped(self):
+        factory = SimulationDataItemFactory([EncLogHM])
+        log_dir = path.join(TEST_DIR, 'test_logs/examplesForDifferentVersions/HM')
+        with TemporaryDirectory() as temp_dir:
+            copy_dir = path.join(temp_dir, 'HM')
+            copytree(log_dir, copy_dir)
+            file_paths = sorted(factory.find_files(copy_dir))
+            loaded_files = {file_path: get_file_key(file_path) for file_path in file_paths}
+
+            # nothing changed, nothing is parsed, but the directory is fine
+            [(_, item_list, error)] = factory.iter_item_lists_from_path_list([copy_dir], loaded_files=loaded_files)
+            self.assertEqual(item_list, [])
+            self.assertIsNone(error)
+
+            with open(file_paths[0], 'a') as log_file:
+                log_file.write('\n')
+            [(_, item_list, error)] = factory.iter_item_lists_from_path_list([copy_dir], loaded_files=loaded_files)
+            self.assertEqual([item.path for item in item_list], [file_paths[0]])
+
+
+class TestDictTreeFromSimDataItems(unittest.TestCase):
+    class _Item:
+        def __init__(self, data):
+            self.data = data
+
+        @staticmethod
+        def _get_label(keys):
+            return 'x', keys[-1]
+
+    def test_values_are_shared_or_joined(self):
+        summary_a, summary_b = [(1, 30.0)], [(2, 35.0)]
+        temporal = ColumnValues(np.arange(3), np.array([1.0, 2.0, 3.0]), is_sorted=True)
+        items = [self._Item([(['seq'], {'Log': {'Summary': {'Y-PSNR': summary_a}}}),
+                             (['seq', 'QP 22'], {'Log': {'Temporal': {'Y-PSNR': temporal}}})]),
+                 self._Item([(['seq'], {'Log': {'Summary': {'Y-PSNR': summary_b}}})])]
+
+        dict_tree = dict_tree_from_sim_data_items(items)
+
+        [summary] = dict_tree['Log']['Summary']['Y-PSNR']
+        self.assertEqual(summary.values, [(1, 30.0), (2, 35.0)])
+        self.assertEqual((summary_a, summary_b), ([(1, 30.0)], [(2, 35.0)]))
+        self.assertEqual(summary.path, ['Log', 'Summary', 'Y-PSNR'])
+        self.assertIs(dict_tree['Log']['Temporal']['Y-PSNR'][0].values, temporal)
+
+    def test_join_column_values(self):
+        first = ColumnValues(np.arange(2), np.ones(2), is_sorted=True)
+        joined = join_values([first, ColumnValues(np.array([5]), np.array([2.0]), is_sorted=True), [(3, 4.0)]])
+        self.assertEqual(joined, [(0, 1.0), (1, 1.0), (5, 2.0), (3, 4.0)])
+        self.assertEqual(len(first), 2)
+        # like extending the first values by the others
+        first.extend(ColumnValues(np.array([5]), np.array([2.0]), is_sorted=True))
+        self.assertTrue(first.is_sorted)
+        self.assertFalse(joined.is_sorted)
+
+
+class TestColumnValues(unittest.TestCase):
+    def setUp(self):
+        self._columns = columns_from_rows([('8', '40.5'), ('4', '38.25')], {0: 'Frames', 1: 'Y-PSNR'})
+
+    def test_compatible_with_list_of_pairs(self):
+        self.assertEqual(self._columns['Frames'], [(0, 8), (1, 4)])
+        self.assertEqual(self._columns['Y-PSNR'][1], (1, 38.25))
+        # the columns share the frame index
+        self.assertIs(self._columns['Frames'].xs, self._columns['Y-PSNR'].xs)
+
+    def test_sorted_columns(self):
+        values = self._columns['Y-PSNR']
+        values.extend([('0', '41.0')])
+        xs, ys = sorted_columns(values)
+        self.assertEqual((xs.tolist(), ys.tolist()), ([0.0, 0.0, 1.0], [40.5, 41.0, 38.25]))
+        xs, ys = sorted_columns([('1', '2.5'), ('0', '3')])
+        self.assertEqual((xs.tolist(), ys.tolist()), ([0.0, 1.0], [3.0, 2.5]))
+
+    def test_pickled_as_lists(self):
+        values = ColumnValues(np.arange(3), np.array([1.0, np.nan, 3.0]), is_sorted=True)
+        encoded = jsonpickle.encode(values)
+        self.assertNotIn('numpy', encoded)
+
+        decoded = jsonpickle.decode(encoded)
+        # NaNs at the same positions are equal
+        self.assertEqual(decoded, values)
+        self.assertNotEqual(decoded, ColumnValues(np.arange(3), np.array([1.0, 2.0, 3.0])))
+        self.assertEqual((decoded.xs.dtype, decoded.ys.dtype), (values.xs.dtype, values.ys.dtype))
+        self.assertTrue(decoded.is_sorted)
+
+
+class TestFileLoadContext(unittest.TestCase):
+    def setUp(self):
+        self._temp_dir = TemporaryDirectory()
+
+    def tearDown(self):
+        self._temp_dir.cleanup()
+
+    def _get_load_context(self, content):
+        file_path = path.join(self._temp_dir.name, 'a_enc.log')
+        with open(file_path, 'wb') as file:
+            file.write(content)
+        return FileLoadContext(file_path)
+
+    def test_buffer_lines(self):
+        load_context = self._get_load_context(b'POC 0\r\nPOC 1\r\n\r\nTotal Time')
+        try:
+            self.assertEqual(list(iter_lines(load_context.buffer)), [b'POC 0', b'POC 1', b'', b'Total Time'])
+            self.assertEqual(list(iter_lines(load_context.buffer, 7)), [b'POC 1', b'', b'Total Time'])
+        finally:
+            load_context.close()
+
+    def test_read_until(self):
+        load_context = self._get_load_context(b'QP : 22\r\nPOC 0\r\nPOC 1\r\n')
+        pattern = re.compile(rb'^POC', re.M)
+        # the match spans the chunks
+        self.assertEqual(load_context.read_until(pattern, chunk_size=10), b'QP : 22\r\n')
+        self.assertEqual(load_context.read_until(re.compile(rb'Total Time'), chunk_size=4),
+                         b'QP : 22\r\nPOC 0\r\nPOC 1\r\n')
+        try:
+            load_context.buffer
+            self.assertEqual(load_context.read_until(pattern), b'QP : 22\r\n')
+        finally:
+            load_context.close()
+
+    def test_empty_file(self):
+        load_context = self._get_load_context(b'')
+        self.assertEqual(load_context.buffer, b'')
+        self.assertEqual(list(iter_lines(load_context.buffer)), [])
+        load_context.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
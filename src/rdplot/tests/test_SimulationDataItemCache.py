@@ -0,0 +1,70 @@
+import unittest
+from os import path, listdir, utime, stat
+from shutil import copy
+from tempfile import TemporaryDirectory
+from rdplot.SimulationDataItem import SimulationDataItemFactory
+from rdplot.SimulationDataItemCache import SimulationDataItemCache
+
+# path to test module (this file)
+TEST_DIR = path.dirname(path.abspath(__file__))
+
+# Path to the folder containing simulation data sub classes. The classes
+# are loaded by the simulation data item factory and used for parsing files
+SIMULATION_DATA_ITEM_CLASSES_PATH = path.normpath(path.join(TEST_DIR, '../SimulationDataItemClasses'))
+
+TEST_LOG_DIR = path.join(TEST_DIR, 'test_logs/examplesForDifferentVersions/HM')
+
+
+class TestSimulationDataItemCache(unittest.TestCase):
+    def setUp(self):
+        self._temp_dir = TemporaryDirectory()
+        self._cache = SimulationDataItemCache(path.join(self._temp_dir.name, 'cache.sqlite'))
+        self._factory = SimulationDataItemFactory.from_path(SIMULATION_DATA_ITEM_CLASSES_PATH)
+        self._factory.cache = self._cache
+
+    def tearDown(self):
+        self._cache.close()
+        self._temp_dir.cleanup()
+
+    def _parse(self, directory_path):
+        items = self._factory.create_item_list_from_directory(directory_path)
+        return {item.path: (type(item), item.summary_data, item.data) for item in items}
+
+    def test_cached_items_equal_parsed_items(self):
+        parsed = self._parse(TEST_LOG_DIR)
+        self.assertTrue(parsed)
+        # the second run only reads the cache
+        self._factory.create_item_from_file = None
+        self.assertEqual(self._parse(TEST_LOG_DIR), parsed)
+
+    def test_invalidation(self):
+        classes = {cls.__name__: cls for cls in self._factory._get_dispatch_order()}
+        log_path = copy(path.join(TEST_LOG_DIR, sorted(f for f in listdir(TEST_LOG_DIR)
+                                                       if f.endswith('enc.log'))[0]), self._temp_dir.name)
+        self._parse(self._temp_dir.name)
+        self.assertIsNotNone(self._cache.get(log_path, classes))
+
+        # changed modification time
+        file_stat = stat(log_path)
+        utime(log_path, ns=(file_stat.st_atime_ns, file_stat.st_mtime_ns + 10 ** 9))
+        self.assertIsNone(self._cache.get(log_path, classes))
+        self._parse(self._temp_dir.name)
+
+        # changed parser version
+        cls = type(self._cache.get(log_path, classes)[0])
+        cls.parser_version = 'test'
+        try:
+            self.assertIsNone(self._cache.get(log_path, classes))
+        finally:
+            del cls.parser_version
+
+    def test_eviction(self):
+        self._parse(TEST_LOG_DIR)
+        self._cache.max_size = 1
+        self._cache.flush()
+        connection = self._cache._get_connection()
+        self.assertEqual(connection.execute('SELECT COUNT(*) FROM items').fetchone()[0], 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,124 @@
+import unittest
+from os.path import sep
+
+from PyQt5.QtCore import QModelIndex, Qt
+
+# Import the plot widget before the models, as the application does, so the
+# matplotlib backend is set before pyplot is imported
+import rdplot.Widgets.PlotWidget
+from rdplot.model import OrderedDictModel, OrderedDictTreeModel, VariableTreeModel
+
+
+class _Item:
+    def __init__(self, path, data):
+        self.path = path
+        self.data = data
+
+    @staticmethod
+    def _get_label(keys):
+        return 'x', keys[-1]
+
+
+class TestOrderedDictModel(unittest.TestCase):
+    def setUp(self):
+        self.model = OrderedDictModel()
+        self.inserted_rows = []
+        self.removed_rows = []
+        self.model.rowsInserted.connect(lambda parent, first, last: self.inserted_rows.append((first, last)))
+        self.model.rowsRemoved.connect(lambda parent, first, last: self.removed_rows.append((first, last)))
+
+    def test_keys_are_inserted_in_order_by_ranges(self):
+        self.model.update_from_tuples([('d', 4), ('b', 2), ('a', 1)])
+        self.model.update_from_tuples([('c', 3), ('e', 5), ('b', 20), ('f', 6)])
+
+        self.assertEqual(self.model.items(), [('a', 1), ('b', 20), ('c', 3), ('d', 4), ('e', 5), ('f', 6)])
+        self.assertEqual(self.inserted_rows, [(0, 2), (2, 2), (4, 5)])
+        self.assertEqual(self.model['c'], 3)
+        self.assertTrue('f' in self.model)
+        self.assertEqual(self.model.data(self.model.index(4, 0), Qt.DisplayRole), 'e')
+
+    def test_keys_are_removed_by_ranges(self):
+        self.model.update_from_tuples((key, key) for key in 'abcdef')
+        self.model.remove_keys(['b', 'c', 'e', 'x'])
+
+        self.assertEqual(list(self.model), ['a', 'd', 'f'])
+        self.assertEqual(self.removed_rows, [(4, 4), (1, 2)])
+
+        self.model.clear_and_update_from_tuples([('z', 1)])
+        self.assertEqual(self.model.items(), [('z', 1)])
+        self.assertEqual(self.removed_rows[-1], (0, 2))
+
+
+class TestOrderedDictTreeModel(unittest.TestCase):
+    def setUp(self):
+        self.model = OrderedDictTreeModel()
+        self.inserted_rows = []
+        self.model.rowsInserted.connect(lambda parent, first, last: self.inserted_rows.append(
+            (parent.internalPointer(), first, last)))
+
+    def test_rows_are_cached_and_updated(self):
+        for identifier in ['c', 'A', 'e', 'b', 'D']:
+            item = self.model.create_path('parent', identifier)
+            self.assertEqual(self.inserted_rows[-1][1:], (item.row, item.row))
+
+        parent = self.model.get_item_from_path('parent')
+        self.assertEqual(list(parent), ['A', 'b', 'c', 'D', 'e'])
+        self.assertTrue('D' in parent)
+        self.assertFalse('d' in parent)
+
+        self.model.remove_item(parent['b'])
+        self.assertEqual([parent[identifier].row for identifier in parent], [0, 1, 2, 3])
+        q_index = self.model.index(2, 0, self.model._get_index_from_item(parent))
+        self.assertIs(q_index.internalPointer(), parent['D'])
+        self.assertIs(self.model.parent(q_index).internalPointer(), parent)
+
+        self.model.clear()
+        self.assertEqual(self.model.rowCount(QModelIndex()), 0)
+
+    def test_labels_omit_common_parts(self):
+        first = self.model.create_path(sep.join(['sim', 'QP22']))
+        self.assertEqual(first.label, sep.join(['sim', 'QP22']))
+
+        second = self.model.create_path(sep.join(['sim', 'QP27', 'QP27']))
+        self.assertEqual((first.label, second.label), ('QP22', 'QP27 QP27'))
+        self.assertEqual(self.model.data(self.model._get_index_from_item(second), Qt.DisplayRole), 'QP27 QP27')
+
+        self.model.create_path(sep.join(['other', 'QP22']))
+        self.assertEqual((first.label, second.label), ('sim QP22', 'sim QP27 QP27'))
+
+
+class TestVariableTreeModel(unittest.TestCase):
+    def setUp(self):
+        self.model = VariableTreeModel()
+        self.first = _Item('a.log', [(['seq'], {'Summary': {'Y-PSNR': [(1, 30.0)], 'Bitrate': [(1, 100.0)]}})])
+        self.second = _Item('b.log', [(['seq'], {'Summary': {'Y-PSNR': [(2, 35.0)]}})])
+
+    def _get_values(self, *path):
+        return [plot_data.values for plot_data in self.model.get_item_from_path(*path).values]
+
+    def test_items_are_added_and_removed_by_delta(self):
+        self.model.update_from_sim_data_items([self.first])
+        bitrate = self.model.get_item_from_path('Summary', 'Bitrate')
+
+        changed_items = self.model.update_from_sim_data_items([self.first, self.second])
+        self.assertEqual(changed_items, [self.model.get_item_from_path('Summary', 'Y-PSNR')])
+        self.assertEqual(self._get_values('Summary', 'Y-PSNR'), [[(1, 30.0), (2, 35.0)]])
+        self.assertIs(self.model.get_item_from_path('Summary', 'Bitrate'), bitrate)
+
+        inserted_rows = []
+        self.model.rowsInserted.connect(lambda parent, first, last: inserted_rows.append((first, last)))
+        self.model.update_from_sim_data_items([self.second])
+        self.assertEqual(self._get_values('Summary', 'Y-PSNR'), [[(2, 35.0)]])
+        self.assertEqual(list(self.model.get_item_from_path('Summary')), ['Y-PSNR'])
+        self.assertEqual(inserted_rows, [])
+
+        self.assertEqual(self.model.update_from_sim_data_items([self.second]), [])
+        self.model.update_from_sim_data_items([])
+        self.assertEqual(self.model.rowCount(QModelIndex()), 0)
+
+    def test_updated_items_are_read_again(self):
+        self.model.update_from_sim_data_items([self.first, self.second])
+        self.second.data = [(['seq'], {'Summary': {'Y-PSNR': [(2, 35.0), (3, 37.0)]}})]
+
+        self.model.update_from_sim_data_items([self.first, self.second], [self.second])
+        self.assertEqual(self._get_values('Summary', 'Y-PSNR'), [[(1, 30.0), (2, 35.0), (3, 37.0)]])
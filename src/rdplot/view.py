@@ -18,8 +18,12 @@
 #
 ##################################################################################################
 import json
+import time
 from collections import deque
+from heapq import heappush, heappop
+from itertools import count
 from os.path import isdir, abspath, sep, dirname, basename, isfile, join
+from threading import Lock
 
 import jsonpickle
 from PyQt5 import QtWidgets
@@ -30,7 +34,9 @@ from PyQt5.QtGui import *
 from PyQt5.QtGui import QKeySequence
 from PyQt5.QtWidgets import QMessageBox, QMenu
 
-from rdplot.SimulationDataItem import SimulationDataItemFactory, SimulationDataItemError
+from rdplot.SimulationDataItem import (SimulationDataItemFactory, SimulationDataItemError, ParseProgress,
+                                       COMPRESSED_FILE_OPENERS, ARCHIVE_SUFFIXES)
+from rdplot.SimulationDataItemCache import SimulationDataItemCache
 from rdplot.model import AmbiguousSimDataItems
 
 # Path to the folder containing simulation data sub classes. The classes
@@ -39,41 +45,210 @@ here = abspath(dirname(__file__))
 SIMULATION_DATA_ITEM_CLASSES_PATH = here + sep + "SimulationDataItemClasses"
 
 
+class ParseJob:
+    """
+    A path to parse by :class: `ParserWorkThread`. Jobs with a lower
+    *priority* value are parsed first, jobs with equal priority in the order
+    in which they were added. *status* is one of the status constants below,
+    *error* is the :class: `SimulationDataItemError` of a failed job.
+    """
+
+    # Priorities of paths added interactively and of bulk imports
+    PRIORITY_INTERACTIVE = 0
+    PRIORITY_BULK = 10
+
+    QUEUED = 'queued'
+    RUNNING = 'running'
+    DONE = 'done'
+    FAILED = 'failed'
+    CANCELLED = 'cancelled'
+
+    def __init__(self, path, priority=PRIORITY_BULK):
+        self.path = path
+        self.priority = priority
+        self.status = ParseJob.QUEUED
+        self.error = None
+
+    def __repr__(self):
+        return "ParseJob({!r}, priority={}, status={})".format(self.path, self.priority, self.status)
+
+
 class ParserWorkThread(QThread):
+    """
+    Parses the paths added by *add_path* in the background. The paths are
+    queued as :class: `ParseJob`s, which can be added from any thread, also
+    while parsing. The jobs with the highest priority are taken from the
+    queue together, and their files are spread across a pool of
+    *max_workers* processes. Each finished job is emitted by *jobFinished*.
+    A job which can not be parsed fails on its own, the other jobs go on.
+
+    The parsed items are emitted by *newParsedData* in batches, at most every
+    *flush_interval* seconds, thus, the tree fills while parsing continues.
+    Along with each batch, *progress* is emitted with the number of parsed
+    files, the number of all files, the parsed bytes per second and the
+    estimated remaining seconds, which is -1 as long as it is unknown.
+    *allParsed* is emitted, when the queue is empty.
+
+    Parsing can be stopped by *cancel*, which cancels all queued jobs, too.
+    The items parsed so far are kept.
+    """
+
     newParsedData = pyqtSignal([list])
+    progress = pyqtSignal(int, int, float, float)
+    jobFinished = pyqtSignal(object)
     allParsed = pyqtSignal()
 
-    def __init__(self, path_list=None):
+    def __init__(self, path_list=None, max_workers=None, flush_interval=0.5):
         QThread.__init__(self)
 
         self._factory = SimulationDataItemFactory.from_path(
             SIMULATION_DATA_ITEM_CLASSES_PATH
         )
-
-        if path_list is None:
-            path_list = []
-        self.path_list = path_list
+        # Reopened files are taken from the persistent cache, if unchanged
+        self._factory.cache = SimulationDataItemCache()
+
+        # Heap of tuples (priority, sequence number, job) and the lock
+        # guarding it
+        self._job_queue = []
+        self._job_queue_lock = Lock()
+        self._job_count = count()
+
+        # Number of parser processes, None for the number of CPUs
+        self.max_workers = max_workers
+        # Parse logs of running simulations, too
+        self.parse_running = False
+        self.flush_interval = flush_interval
+        # Index of the files, whose items are loaded already. Unchanged files
+        # are not parsed again, see SimDataItemTreeModel.file_index
+        self.loaded_files = None
+
+        self._progress = ParseProgress(self._file_parsed)
+        self._pending_items = []
+        self._last_flush_time = 0
+
+        if path_list is not None:
+            for path in path_list:
+                self.add_path(path)
+
+        # Jobs might be added, while run is about to return. Start again for
+        # them.
+        self.finished.connect(self._start_if_jobs_queued)
 
     def __del__(self):
         self.wait()
 
-    def add_path(self, path):
-        self.path_list.append(path)
+    def add_path(self, path, priority=ParseJob.PRIORITY_BULK):
+        """Queue a :class: `ParseJob` for *path*. Can be called from any
+        thread.
+
+        :rtype: :class: `ParseJob`
+        """
+        job = ParseJob(path, priority)
+        with self._job_queue_lock:
+            heappush(self._job_queue, (priority, next(self._job_count), job))
+        return job
+
+    def cancel(self):
+        """Stop parsing after the file which is parsed at the moment, and
+        cancel all queued jobs. Can be called from any thread.
+        """
+        with self._job_queue_lock:
+            cancelled_jobs = [job for _, _, job in self._job_queue]
+            self._job_queue.clear()
+            self._progress.cancel()
+        for job in cancelled_jobs:
+            job.status = ParseJob.CANCELLED
+            self.jobFinished.emit(job)
 
     def run(self):
-        for path in self.path_list:
-            try:
-                sim_data_items = self._factory.create_item_list_from_path(path)
-                print("Parsed '{}' ".format(path))
-            except SimulationDataItemError:
-                self.newParsedData.emit([])
-                self.path_list.clear()
-                return
+        self._factory.parse_running = self.parse_running
+        self._pending_items = []
+        self._last_flush_time = time.monotonic()
 
-            self.newParsedData.emit(sim_data_items)
-        self.path_list.clear()
+        jobs = self._take_jobs()
+        while jobs:
+            self._run_jobs(jobs)
+            jobs = self._take_jobs()
+
+        self._flush()
         self.allParsed.emit()
 
+    def _take_jobs(self):
+        """Take all queued jobs with the highest priority from the queue,
+        and create the progress of parsing them.
+        """
+        with self._job_queue_lock:
+            if not self._job_queue:
+                return []
+            priority = self._job_queue[0][0]
+            jobs = []
+            while self._job_queue and self._job_queue[0][0] == priority:
+                jobs.append(heappop(self._job_queue)[2])
+            self._progress = ParseProgress(self._file_parsed)
+            return jobs
+
+    def _run_jobs(self, jobs):
+        for job in jobs:
+            job.status = ParseJob.RUNNING
+
+        try:
+            self._parse_jobs(jobs)
+        except Exception:
+            # Parse the unfinished jobs one by one, so an unexpected error
+            # only fails its own job, and the thread goes on with the queue
+            for job in jobs:
+                if job.status != ParseJob.RUNNING or self._progress.is_cancelled:
+                    continue
+                try:
+                    self._parse_jobs([job])
+                except Exception as error:
+                    job.status = ParseJob.FAILED
+                    job.error = error
+                    self.jobFinished.emit(job)
+
+        # The remaining jobs are left, if parsing was cancelled
+        for job in jobs:
+            if job.status == ParseJob.RUNNING:
+                job.status = ParseJob.CANCELLED
+                self.jobFinished.emit(job)
+
+    def _parse_jobs(self, jobs):
+        # The item lists are yielded in the order of the jobs
+        results = self._factory.iter_item_lists_from_path_list([job.path for job in jobs], self.max_workers,
+                                                               self._progress, self.loaded_files)
+        for job, (path, sim_data_items, error) in zip(jobs, results):
+            if error is None:
+                print("Parsed '{}' ".format(path))
+                job.status = ParseJob.DONE
+            else:
+                job.status = ParseJob.FAILED
+                job.error = error
+            self._flush()
+            self.jobFinished.emit(job)
+
+    def _start_if_jobs_queued(self):
+        with self._job_queue_lock:
+            has_jobs = bool(self._job_queue)
+        if has_jobs:
+            self.start()
+
+    def _file_parsed(self, progress, file_path, items, error):
+        # Items of files, which can not be parsed, are ignored like by
+        # create_item_lists_from_path_list
+        if error is None:
+            self._pending_items.extend(items)
+        if time.monotonic() - self._last_flush_time >= self.flush_interval:
+            self._flush()
+
+    def _flush(self):
+        self._last_flush_time = time.monotonic()
+        if self._pending_items:
+            self.newParsedData.emit(self._pending_items)
+            self._pending_items = []
+        remaining_time = self._progress.remaining_time
+        self.progress.emit(self._progress.files_done, self._progress.files_total,
+                           self._progress.bytes_per_second, -1 if remaining_time is None else remaining_time)
+
 
 class ParserWorkNoThread(QObject):
     """
@@ -95,7 +270,7 @@ class ParserWorkNoThread(QObject):
             path_list = []
         self.path_list = path_list
 
-    def add_path(self, path):
+    def add_path(self, path, priority=None):
         self.path_list.append(path)
 
     def run(self):
@@ -123,14 +298,24 @@ class SimDataItemTreeView(QtWidgets.QTreeView):
         # self.parserThread = ParserWorkNoThread()
         self.parserThread.newParsedData.connect(self._update_model)
         self.parserThread.allParsed.connect(self._hide_parse_message)
+        self.parserThread.progress.connect(self._show_parse_progress)
+        self.parserThread.jobFinished.connect(self._parse_job_finished)
         self.msg = QMessageBox(self)  # use self as parent here
         self.msg.setIcon(QMessageBox.Information)
         self.msg.setText("Parsing Directory...")
         self.msg.setWindowTitle("Info")
+        # the message is not modal, closing it cancels the parsing
+        self.msg.setStandardButtons(QMessageBox.Cancel)
+        self.msg.rejected.connect(self.parserThread.cancel)
         # TODO: add context menu capabilities
         # self.setContextMenuPolicy(Qt.CustomContextMenu)
         # self.customContextMenuRequested.connect(self.openMenu)
 
+    def setModel(self, model):
+        super().setModel(model)
+        # Re-added files are only parsed, if they changed
+        self.parserThread.loaded_files = model.file_index
+
     # drag'n'drop mechanism adapted
     # from question on stackoverflow at http://stackoverflow.com/q/22543644
     # from user http://stackoverflow.com/users/1107049/alphanumeric
@@ -148,19 +333,19 @@ class SimDataItemTreeView(QtWidgets.QTreeView):
             if url.isLocalFile() and isfile(url.path()):
                 try:
                     # check what kind of file we have.
-                    # process .rd with load_rd_data, .xml and .log with the parsers
-                    file_ending = basename(url.path()).rsplit('.', maxsplit=1)[1]
+                    # process .rd with load_rd_data, all other files, eg.
+                    # compressed logs and archives, with the parsers, which
+                    # are chosen by the signatures of the files
+                    file_ending = basename(url.path()).rsplit('.', maxsplit=1)[-1]
                     if file_ending == 'rd':
                         self.load_rd_data(url.path())
-                    elif file_ending == 'log' or file_ending == 'xml':
-                        self.parserThread.add_path(url.path())
+                    else:
+                        self.parserThread.add_path(url.path(), ParseJob.PRIORITY_INTERACTIVE)
                         self.parserThread.start()
                 except json.decoder.JSONDecodeError:
                     return
-                except IndexError:  # there was no file ending, i.e. not '.' in the name
-                    return
             else:
-                self.msg.show()
+                self.show_parse_message()
                 self.parserThread.add_path(url.path())
                 self.parserThread.start()
 
@@ -200,7 +385,9 @@ class SimDataItemTreeView(QtWidgets.QTreeView):
                 self,
                 "Open Sequence Encoder Log",
                 "/home/ient/Software/rd-plot-gui/exampleLogs",
-                "All Logs (*.log *.xml *.rd);;Encoder Logs (*.log);;Dat Logs (*.xml);; RD Data (*.rd)")
+                "All Logs (*.log *.xml *.rd {0} {1});;Encoder Logs (*.log {0});;Dat Logs (*.xml);; RD Data (*.rd);;"
+                "Archives ({1})".format(' '.join('*' + suffix for suffix in COMPRESSED_FILE_OPENERS),
+                                        ' '.join('*' + suffix for suffix in ARCHIVE_SUFFIXES)))
 
             # magic: split returned list of files into lists of directories and file names
             directories, file_names = zip(*[file.rsplit('/', 1) for file in result[0]])
@@ -222,7 +409,7 @@ class SimDataItemTreeView(QtWidgets.QTreeView):
             return
 
     # open one or more files
-    # will detect what kind of file (.rd, .log, .xml) and act accordingly
+    # will detect what kind of file (.rd, .log, .xml, compressed logs, archives) and act accordingly
     def add_file(self):
         try:
             directories, file_names = self._get_open_file_names()
@@ -230,13 +417,13 @@ class SimDataItemTreeView(QtWidgets.QTreeView):
             return
         for directory, file_name in zip(directories, file_names):
             # check what kind of file we have.
-            # process .rd with load_rd_data, .xml and .log with the parsers
+            # process .rd with load_rd_data, all other files with the parsers
             path = join(directory, file_name)
-            file_ending = file_name.rsplit('.', maxsplit=1)[1]
+            file_ending = file_name.rsplit('.', maxsplit=1)[-1]
             if file_ending == 'rd':
                 self.load_rd_data(path)
-            elif file_ending == 'log' or file_ending == 'xml':
-                self.parserThread.add_path(path)
+            else:
+                self.parserThread.add_path(path, ParseJob.PRIORITY_INTERACTIVE)
         self.parserThread.start()
 
     # adds all log files and sequences from a directory to the treeview
@@ -246,11 +433,8 @@ class SimDataItemTreeView(QtWidgets.QTreeView):
         except TypeError:
             return
 
-        # TODO this uses the parse_directory method, thus, does not automatically
-        # parse 'log'.subfolder. Should this be the case?
-        # sim_data_items = list(SimulationDataItemFactory.parse_directory(path))
-        # self.model().update(sim_data_items)
-        self.msg.show()
+        # sub folders are searched recursively, see SimulationDataItemFactory.find_files
+        self.show_parse_message()
         self.parserThread.add_path(path)
         self.parserThread.start()
 
@@ -267,7 +451,7 @@ class SimDataItemTreeView(QtWidgets.QTreeView):
                     clean_path = line.rstrip()
                     if isdir(clean_path):
                         self.parserThread.add_path(clean_path)
-            self.msg.show()
+            self.show_parse_message()
             self.parserThread.start()
 
         except IndexError:
@@ -281,6 +465,17 @@ class SimDataItemTreeView(QtWidgets.QTreeView):
             # self.parserThread.addPath(path)
             # self.parserThread.start()
 
+    def show_parse_message(self):
+        self.msg.setText("Parsing Directory...")
+        self.msg.show()
+
+    def _show_parse_progress(self, files_done, files_total, bytes_per_second, remaining_time):
+        text = "Parsing Directory...\n{} of {} files, {:.1f} MB/s".format(files_done, files_total,
+                                                                       bytes_per_second / 1024 ** 2)
+        if remaining_time >= 0:
+            text += ", {:.0f} s left".format(remaining_time)
+        self.msg.setText(text)
+
     def _hide_parse_message(self):
         self.msg.hide()
 
@@ -292,6 +487,17 @@ class SimDataItemTreeView(QtWidgets.QTreeView):
         self._update_model(sim_data_items)
         f.close()
 
+    def _parse_job_finished(self, job):
+        if job.status != ParseJob.FAILED:
+            return
+        msg = QMessageBox(self)  # use self as parent here
+        msg.setIcon(QMessageBox.Warning)
+        msg.setText("I cannot find any simulation data item in '{}'.\n"
+                    "If you are really sure that there should be some valid item, "
+                    "you should consider writing a new parser.".format(job.path))
+        msg.setWindowTitle("Warning")
+        msg.show()
+
     def _update_model(self, sim_data_items):
         if not sim_data_items:
             msg = QMessageBox(self)  # use self as parent here